@@ -1,8 +1,9 @@
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
@@ -19,6 +20,89 @@ import config
 logger = logging.getLogger(__name__)
 
 
+def _t_test_result(
+    t_statistic: float,
+    p_value: float,
+    value_col: str,
+    group1_name: Any,
+    group1_mean: float,
+    group2_name: Any,
+    group2_mean: float,
+) -> Dict[str, Any]:
+    """Logs and returns the result dictionary of a completed t-test."""
+    interpretation = ""
+    if p_value < 0.05:
+        interpretation = f"There is a statistically significant difference (p={p_value:.3f}) in '{value_col}' between '{group1_name}' (Mean: {group1_mean:.2f}) and '{group2_name}' (Mean: {group2_mean:.2f})."
+    else:
+        interpretation = f"There is no statistically significant difference (p={p_value:.3f}) in '{value_col}' between '{group1_name}' (Mean: {group1_mean:.2f}) and '{group2_name}' (Mean: {group2_mean:.2f})."
+
+    logger.info(f"  t-statistic: {t_statistic:.3f}")
+    logger.info(f"  p-value: {p_value:.3f}")
+    logger.info(f"  Interpretation: {interpretation}")
+
+    return {
+        "status": "completed",
+        "t_statistic": t_statistic,
+        "p_value": p_value,
+        "interpretation": interpretation,
+        "group1_mean": group1_mean,
+        "group2_mean": group2_mean,
+    }
+
+
+def _anova_result(
+    f_statistic: float, p_value: float, value_col: str, group_col: str
+) -> Dict[str, Any]:
+    """Logs and returns the result dictionary of a completed ANOVA."""
+    interpretation = ""
+    if p_value < 0.05:
+        interpretation = f"There is a statistically significant difference (p={p_value:.3f}) in '{value_col}' across at least two groups in '{group_col}'."
+    else:
+        interpretation = f"There is no statistically significant difference (p={p_value:.3f}) in '{value_col}' across groups in '{group_col}'."
+
+    logger.info(f"  F-statistic: {f_statistic:.3f}")
+    logger.info(f"  p-value: {p_value:.3f}")
+    logger.info(f"  Interpretation: {interpretation}")
+
+    return {
+        "status": "completed",
+        "f_statistic": f_statistic,
+        "p_value": p_value,
+        "interpretation": interpretation,
+    }
+
+
+def _chi_squared_result(
+    chi2_statistic: float,
+    p_value: float,
+    dof: int,
+    expected_freq: np.ndarray,
+    col1: str,
+    col2: str,
+) -> Dict[str, Any]:
+    """Logs and returns the result dictionary of a completed Chi-squared test."""
+    interpretation = ""
+    if p_value < 0.05:
+        interpretation = f"There is a statistically significant association (p={p_value:.3f}) between '{col1}' and '{col2}'. This suggests that the two variables are not independent."
+    else:
+        interpretation = f"There is no statistically significant association (p={p_value:.3f}) between '{col1}' and '{col2}'. This suggests that the two variables are independent."
+
+    logger.info(f"  Chi-squared statistic: {chi2_statistic:.3f}")
+    logger.info(f"  p-value: {p_value:.3f}")
+    logger.info(f"  Degrees of freedom: {dof}")
+    # logger.info(f"  Expected Frequencies:\n{expected_freq}") # Can be very large, log only if needed
+    logger.info(f"  Interpretation: {interpretation}")
+
+    return {
+        "status": "completed",
+        "chi2_statistic": chi2_statistic,
+        "p_value": p_value,
+        "dof": dof,
+        "expected_freq": expected_freq.tolist(),  # Convert numpy array to list for JSON compatibility if returned
+        "interpretation": interpretation,
+    }
+
+
 def perform_independent_t_test(
     df: pd.DataFrame,
     group_col: str,
@@ -92,25 +176,15 @@ def perform_independent_t_test(
         t_statistic, p_value = stats.ttest_ind(
             group1_data, group2_data, equal_var=False
         )
-
-        interpretation = ""
-        if p_value < 0.05:
-            interpretation = f"There is a statistically significant difference (p={p_value:.3f}) in '{value_col}' between '{group1_name}' (Mean: {group1_data.mean():.2f}) and '{group2_name}' (Mean: {group2_data.mean():.2f})."
-        else:
-            interpretation = f"There is no statistically significant difference (p={p_value:.3f}) in '{value_col}' between '{group1_name}' (Mean: {group1_data.mean():.2f}) and '{group2_name}' (Mean: {group2_data.mean():.2f})."
-
-        logger.info(f"  t-statistic: {t_statistic:.3f}")
-        logger.info(f"  p-value: {p_value:.3f}")
-        logger.info(f"  Interpretation: {interpretation}")
-
-        return {
-            "status": "completed",
-            "t_statistic": t_statistic,
-            "p_value": p_value,
-            "interpretation": interpretation,
-            "group1_mean": group1_data.mean(),
-            "group2_mean": group2_data.mean(),
-        }
+        return _t_test_result(
+            t_statistic,
+            p_value,
+            value_col,
+            group1_name,
+            group1_data.mean(),
+            group2_name,
+            group2_data.mean(),
+        )
     except Exception as e:
         logger.error(
             f"An unexpected error occurred during t-test for '{value_col}' between '{group1_name}' and '{group2_name}': {e}"
@@ -184,23 +258,7 @@ def perform_anova_test(
 
     try:
         f_statistic, p_value = stats.f_oneway(*groups_data)
-
-        interpretation = ""
-        if p_value < 0.05:
-            interpretation = f"There is a statistically significant difference (p={p_value:.3f}) in '{value_col}' across at least two groups in '{group_col}'."
-        else:
-            interpretation = f"There is no statistically significant difference (p={p_value:.3f}) in '{value_col}' across groups in '{group_col}'."
-
-        logger.info(f"  F-statistic: {f_statistic:.3f}")
-        logger.info(f"  p-value: {p_value:.3f}")
-        logger.info(f"  Interpretation: {interpretation}")
-
-        return {
-            "status": "completed",
-            "f_statistic": f_statistic,
-            "p_value": p_value,
-            "interpretation": interpretation,
-        }
+        return _anova_result(f_statistic, p_value, value_col, group_col)
     except Exception as e:
         logger.error(
             f"An unexpected error occurred during ANOVA for '{value_col}' across '{group_col}': {e}"
@@ -263,27 +321,269 @@ def perform_chi_squared_test(df: pd.DataFrame, col1: str, col2: str) -> Dict[str
         chi2_statistic, p_value, dof, expected_freq = stats.chi2_contingency(
             contingency_table
         )
+        return _chi_squared_result(
+            chi2_statistic, p_value, dof, expected_freq, col1, col2
+        )
+    except ValueError as e:
+        logger.error(
+            f"ValueError during Chi-squared test for '{col1}' and '{col2}': {e}. "
+            "This often means expected frequencies are too low. Consider combining categories or "
+            "using Fisher's exact test for small samples (e.g., if any expected frequency is < 5)."
+        )
+        return {"status": "error", "reason": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during Chi-squared test: {e}")
+        return {"status": "error", "reason": str(e)}
 
-        interpretation = ""
-        if p_value < 0.05:
-            interpretation = f"There is a statistically significant association (p={p_value:.3f}) between '{col1}' and '{col2}'. This suggests that the two variables are not independent."
-        else:
-            interpretation = f"There is no statistically significant association (p={p_value:.3f}) between '{col1}' and '{col2}'. This suggests that the two variables are independent."
 
-        logger.info(f"  Chi-squared statistic: {chi2_statistic:.3f}")
-        logger.info(f"  p-value: {p_value:.3f}")
-        logger.info(f"  Degrees of freedom: {dof}")
-        # logger.info(f"  Expected Frequencies:\n{expected_freq}") # Can be very large, log only if needed
-        logger.info(f"  Interpretation: {interpretation}")
+# --- Chunked (streaming) variants ---
+
+
+def compute_group_moments(
+    chunks: Iterable[pd.DataFrame],
+    group_cols: Union[str, List[str]],
+    value_col: str,
+) -> pd.DataFrame:
+    """
+    Folds DataFrame chunks into the count, mean and standard deviation of a numerical
+    column per group, without holding more than one chunk in memory.
+    Per-chunk moments are merged with the pairwise update of Chan et al., which stays
+    numerically stable for large counts. Rows with NaN in a group or value column are
+    ignored, as in the DataFrame-based tests.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The data, e.g. from iter_data_from_sqlite.
+        group_cols (Union[str, List[str]]): The column(s) holding the group labels.
+        value_col (str): The numerical column to summarize.
+
+    Raises:
+        ValueError: If a chunk lacks a required column or the value column is not numeric.
+
+    Returns:
+        pd.DataFrame: One row per group, indexed by the group labels, with the columns
+                      'count', 'mean' and 'std' (sample standard deviation, ddof=1).
+    """
+    group_cols = [group_cols] if isinstance(group_cols, str) else list(group_cols)
+    totals: Optional[pd.DataFrame] = None
+
+    for chunk in chunks:
+        missing_cols = [c for c in group_cols + [value_col] if c not in chunk.columns]
+        if missing_cols:
+            raise ValueError(f"Column(s) {missing_cols} not found in DataFrame chunk.")
+        if not pd.api.types.is_numeric_dtype(chunk[value_col]):
+            raise ValueError(f"Value column '{value_col}' is not numeric.")
+
+        data = chunk.dropna(subset=group_cols + [value_col])
+        if data.empty:
+            continue
+        grouped = data.groupby(group_cols)[value_col]
+        part = pd.DataFrame(
+            {
+                "count": grouped.count().astype(float),
+                "mean": grouped.mean(),
+                "m2": grouped.var(ddof=0) * grouped.count(),
+            }
+        )
+        if totals is None:
+            totals = part
+            continue
+
+        totals, part = totals.align(part, join="outer", fill_value=0.0)
+        count = totals["count"] + part["count"]
+        delta = part["mean"] - totals["mean"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(count > 0, part["count"] / count, 0.0)
+        totals = pd.DataFrame(
+            {
+                "count": count,
+                "mean": totals["mean"] + delta * weight,
+                "m2": totals["m2"] + part["m2"] + delta**2 * totals["count"] * weight,
+            }
+        )
+
+    if totals is None:
+        return pd.DataFrame(columns=["count", "mean", "std"])
+
+    totals["count"] = totals["count"].astype(int)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        totals["std"] = np.sqrt(
+            totals["m2"] / (totals["count"] - 1).where(totals["count"] > 1)
+        )
+    return totals[["count", "mean", "std"]]
+
+
+def perform_independent_t_test_from_chunks(
+    chunks: Iterable[pd.DataFrame],
+    group_col: str,
+    value_col: str,
+    group1_name: Any,
+    group2_name: Any,
+) -> Dict[str, Any]:
+    """
+    Chunked variant of perform_independent_t_test: performs Welch's t-test from group
+    moments folded over DataFrame chunks, so the data never has to fit in memory.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The data, e.g. from iter_data_from_sqlite.
+        group_col (str): The name of the column containing the group labels.
+        value_col (str): The name of the column containing the numerical values to compare.
+        group1_name (Any): The label of the first group in 'group_col'.
+        group2_name (Any): The label of the second group in 'group_col'.
 
+    Returns:
+        Dict[str, Any]: The same result dictionary as perform_independent_t_test.
+    """
+    logger.info(
+        f"\n--- Performing Independent Samples t-test for '{value_col}' between '{group1_name}' and '{group2_name}' (chunked) ---"
+    )
+    try:
+        moments = compute_group_moments(chunks, group_col, value_col)
+    except ValueError as e:
+        logger.error(f"{e} Skipping t-test.")
+        return {"status": "error", "reason": str(e)}
+
+    counts = moments["count"]
+    if counts.get(group1_name, 0) < 2 or counts.get(group2_name, 0) < 2:
+        logger.warning(
+            f"One or both groups ('{group1_name}', '{group2_name}') have fewer than 2 observations for '{value_col}'. Skipping t-test as it requires at least 2 samples per group."
+        )
         return {
-            "status": "completed",
-            "chi2_statistic": chi2_statistic,
-            "p_value": p_value,
-            "dof": dof,
-            "expected_freq": expected_freq.tolist(),  # Convert numpy array to list for JSON compatibility if returned
-            "interpretation": interpretation,
+            "status": "skipped",
+            "reason": "Not enough observations in one or both groups.",
         }
+
+    try:
+        group1 = moments.loc[group1_name]
+        group2 = moments.loc[group2_name]
+        t_statistic, p_value = stats.ttest_ind_from_stats(
+            group1["mean"],
+            group1["std"],
+            group1["count"],
+            group2["mean"],
+            group2["std"],
+            group2["count"],
+            equal_var=False,
+        )
+        return _t_test_result(
+            t_statistic,
+            p_value,
+            value_col,
+            group1_name,
+            group1["mean"],
+            group2_name,
+            group2["mean"],
+        )
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during t-test for '{value_col}' between '{group1_name}' and '{group2_name}': {e}"
+        )
+        return {"status": "error", "reason": str(e)}
+
+
+def perform_anova_test_from_chunks(
+    chunks: Iterable[pd.DataFrame], group_col: str, value_col: str
+) -> Dict[str, Any]:
+    """
+    Chunked variant of perform_anova_test: computes the one-way ANOVA F-statistic from
+    group counts, means and variances folded over DataFrame chunks.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The data, e.g. from iter_data_from_sqlite.
+        group_col (str): The name of the column containing the group labels.
+        value_col (str): The name of the column containing the numerical values to compare.
+
+    Returns:
+        Dict[str, Any]: The same result dictionary as perform_anova_test.
+    """
+    logger.info(
+        f"\n--- Performing One-Way ANOVA test for '{value_col}' across groups in '{group_col}' (chunked) ---"
+    )
+    try:
+        moments = compute_group_moments(chunks, group_col, value_col)
+    except ValueError as e:
+        logger.error(f"{e} Skipping ANOVA.")
+        return {"status": "error", "reason": str(e)}
+
+    if len(moments) < 2:
+        logger.warning(
+            f"Less than two non-empty groups with valid data for '{value_col}' in '{group_col}'. Skipping ANOVA."
+        )
+        return {
+            "status": "skipped",
+            "reason": "Insufficient non-empty groups for ANOVA.",
+        }
+
+    try:
+        counts = moments["count"].to_numpy(dtype=float)
+        means = moments["mean"].to_numpy(dtype=float)
+        within_ss = np.nansum(moments["std"].to_numpy(dtype=float) ** 2 * (counts - 1))
+        grand_mean = np.sum(counts * means) / counts.sum()
+        between_ss = np.sum(counts * (means - grand_mean) ** 2)
+        df_between = len(counts) - 1
+        df_within = counts.sum() - len(counts)
+        f_statistic = (between_ss / df_between) / (within_ss / df_within)
+        p_value = stats.f.sf(f_statistic, df_between, df_within)
+        return _anova_result(f_statistic, p_value, value_col, group_col)
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during ANOVA for '{value_col}' across '{group_col}': {e}"
+        )
+        return {"status": "error", "reason": str(e)}
+
+
+def perform_chi_squared_test_from_chunks(
+    chunks: Iterable[pd.DataFrame], col1: str, col2: str
+) -> Dict[str, Any]:
+    """
+    Chunked variant of perform_chi_squared_test: sums the contingency tables of
+    DataFrame chunks and tests the total table for independence.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The data, e.g. from iter_data_from_sqlite.
+        col1 (str): The name of the first categorical column.
+        col2 (str): The name of the second categorical column.
+
+    Returns:
+        Dict[str, Any]: The same result dictionary as perform_chi_squared_test.
+    """
+    logger.info(
+        f"\n--- Performing Chi-squared test of independence between '{col1}' and '{col2}' (chunked) ---"
+    )
+    contingency_table = pd.DataFrame()
+    for chunk in chunks:
+        missing_cols = [c for c in (col1, col2) if c not in chunk.columns]
+        if missing_cols:
+            logger.error(
+                f"Column(s) {missing_cols} not found in DataFrame chunk. Skipping Chi-squared test."
+            )
+            return {"status": "error", "reason": f"Column(s) {missing_cols} not found."}
+        contingency_table = contingency_table.add(
+            pd.crosstab(chunk[col1], chunk[col2], dropna=True), fill_value=0
+        )
+
+    if contingency_table.empty:
+        logger.warning(
+            f"Contingency table is empty for '{col1}' and '{col2}' after dropping NaNs. Skipping Chi-squared test."
+        )
+        return {"status": "skipped", "reason": "Empty contingency table."}
+    contingency_table = contingency_table.fillna(0).astype(int)
+    if contingency_table.shape[0] < 2 or contingency_table.shape[1] < 2:
+        logger.warning(
+            f"Contingency table for '{col1}' and '{col2}' has dimensions {contingency_table.shape}. "
+            "Chi-squared test requires at least 2 rows and 2 columns. Skipping."
+        )
+        return {
+            "status": "skipped",
+            "reason": "Contingency table too small (less than 2x2).",
+        }
+
+    try:
+        chi2_statistic, p_value, dof, expected_freq = stats.chi2_contingency(
+            contingency_table
+        )
+        return _chi_squared_result(
+            chi2_statistic, p_value, dof, expected_freq, col1, col2
+        )
     except ValueError as e:
         logger.error(
             f"ValueError during Chi-squared test for '{col1}' and '{col2}': {e}. "
@@ -2,7 +2,20 @@ import logging
 import os
 import sqlite3
 import sys
-from typing import Optional
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
@@ -27,15 +40,103 @@ DATA_BASE_DIR = getattr(
     config, "DATA_DIR", os.path.join(PROJECT_ROOT, "data")
 )  # Fallback to 'data' subfolder
 
+# Comment IDs are only unique within an event: overlapping search queries (e.g. "OG" and
+# "Topson" over the same dates) return the same comments for several events.
+PRIMARY_KEY_COLUMNS = ("event_name", "comment_id")
+# Bookkeeping table with one row per event stored in the comments table
+PARTITIONS_TABLE_NAME = "event_partitions"
+# Key of the columnar snapshot's schema metadata holding the write generation of the
+# database (its 'user_version', incremented by every write) the snapshot was built from
+SNAPSHOT_GENERATION_KEY = b"write_generation"
+
+# Declared types of the comments table. TIMESTAMP columns hold 'YYYY-MM-DD HH:MM:SS'
+# text and BOOLEAN columns hold 0/1; both are converted back when the table is loaded.
+# Columns not listed here get a type derived from their pandas dtype.
+COMMENTS_TABLE_SCHEMA: Dict[str, str] = {
+    "post_id": "TEXT",
+    "post_title": "TEXT",
+    "post_url": "TEXT",
+    "post_author": "TEXT",
+    "post_created_utc": "TIMESTAMP",
+    "post_score": "INTEGER",
+    "post_num_comments": "INTEGER",
+    "upvote_ratio": "REAL",
+    "is_self": "BOOLEAN",
+    "selftext": "TEXT",
+    "link_flair_text": "TEXT",
+    "permalink": "TEXT",
+    "comment_id": "TEXT",
+    "comment_body": "TEXT",
+    "comment_author": "TEXT",
+    "comment_created_utc": "TIMESTAMP",
+    "comment_score": "INTEGER",
+    "comment_permalink": "TEXT",
+    "processed_comment_body": "TEXT",
+    "neg_sentiment": "REAL",
+    "neu_sentiment": "REAL",
+    "pos_sentiment": "REAL",
+    "compound_sentiment": "REAL",
+    "char_count": "INTEGER",
+    "word_count": "INTEGER",
+    "time_period": "TEXT",
+    "days_from_event_start": "INTEGER",
+    "post_title_length": "INTEGER",
+    "post_title_word_count": "INTEGER",
+    "contains_question": "BOOLEAN",
+    "author_karma": "INTEGER",
+    "contains_team_name": "BOOLEAN",
+    "contains_player_keyword": "BOOLEAN",
+    "contains_hero_keyword": "BOOLEAN",
+    "contains_event_keyword": "BOOLEAN",
+    "team_keyword_count": "INTEGER",
+    "player_keyword_count": "INTEGER",
+    "hero_keyword_count": "INTEGER",
+    "event_keyword_count": "INTEGER",
+    "matched_keywords": "TEXT",
+    "post_type": "TEXT",
+    "comment_to_post_score_ratio": "REAL",
+    "comment_score_per_day": "REAL",
+    "event_name": "TEXT",
+    "comment_hour": "INTEGER",
+    "comment_day_of_week": "TEXT",
+}
+# Secondary indexes of the comments table. Filters on 'event_name' use the primary key
+# index, whose first column it is.
+INDEXED_COLUMNS = ("time_period", "post_id", "comment_created_utc")
+# Columns stored dictionary-encoded in the columnar snapshot; they are decoded on load,
+# so the snapshot and SQLite return the same dtypes
+SNAPSHOT_CATEGORICAL_COLUMNS = tuple(
+    getattr(
+        config,
+        "CATEGORICAL_FEATURES",
+        [
+            "time_period",
+            "comment_day_of_week",
+            "event_name",
+            "link_flair_text",
+            "post_type",
+        ],
+    )
+)
+
 
-def save_data_to_sqlite(df_comments: pd.DataFrame) -> None:
+def save_data_to_sqlite(
+    df_comments: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    chunksize: Optional[int] = None,
+) -> None:
     """
-    Saves a single combined DataFrame to an SQLite database.
+    Saves a single combined DataFrame to an SQLite database, replacing all stored rows.
+    The table is created with the explicit schema of COMMENTS_TABLE_SCHEMA and its
+    indexes; use upsert_data_to_sqlite to only rewrite the events in the DataFrame.
     The database file path is constructed using config.DATA_DIR and config.DATABASE_NAME.
     The table name is taken from config.TABLE_NAME.
 
     Args:
-        df_comments (pd.DataFrame): The combined DataFrame containing all comments data.
+        df_comments (Union[pd.DataFrame, Iterable[pd.DataFrame]]): The combined DataFrame
+            containing all comments data, or an iterable of DataFrame chunks, which are
+            written one at a time.
+        chunksize (Optional[int]): Rows converted and written per executemany call.
+                                   Defaults to config.SQLITE_WRITE_CHUNK_SIZE.
     """
     # Ensure config attributes exist
     if not hasattr(config, "DATABASE_NAME") or not config.DATABASE_NAME:
@@ -52,34 +153,74 @@ def save_data_to_sqlite(df_comments: pd.DataFrame) -> None:
     os.makedirs(db_dir, exist_ok=True)
     db_path = os.path.join(db_dir, config.DATABASE_NAME)
 
+    if chunksize is None:
+        chunksize = getattr(config, "SQLITE_WRITE_CHUNK_SIZE", 5000)
+
+    conn = _connect(db_path)
     try:
-        with sqlite3.connect(db_path) as conn:
-            logger.info(f"Attempting to save data to SQLite database: {db_path}")
+        logger.info(f"Attempting to save data to SQLite database: {db_path}")
 
-            df_comments.to_sql(
-                config.TABLE_NAME, conn, if_exists="replace", index=False
-            )
-            logger.info(
-                f"Successfully saved '{config.TABLE_NAME}' table with {len(df_comments)} rows to '{db_path}'."
+        # Replace the whole table in one transaction, using the explicit schema
+        with _transaction(conn):
+            conn.execute(f"DROP TABLE IF EXISTS {_quote(config.TABLE_NAME)}")
+            conn.execute(f"DROP TABLE IF EXISTS {_quote(PARTITIONS_TABLE_NAME)}")
+            rows_written = _write_chunks(
+                conn, config.TABLE_NAME, _as_chunks(df_comments), chunksize
             )
+            _bump_write_generation(conn)
+        _finish_write(conn)
+        logger.info(
+            f"Successfully saved '{config.TABLE_NAME}' table with {rows_written} rows to '{db_path}'."
+        )
 
-    except sqlite3.Error as e:
+    except (sqlite3.Error, ValueError) as e:
         logger.error(f"SQLite error during data saving to '{db_path}': {e}")
     except Exception as e:
         logger.error(
             f"An unexpected error occurred during data saving to '{db_path}': {e}"
         )
+    finally:
+        conn.close()
 
 
-def load_data_from_sqlite() -> pd.DataFrame:
+def load_data_from_sqlite(
+    columns: Optional[Sequence[str]] = None,
+    event_names: Optional[Sequence[str]] = None,
+    time_periods: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+    use_snapshot: Optional[bool] = None,
+) -> pd.DataFrame:
     """
     Loads data from an SQLite database into a Pandas DataFrame.
     The database file path is constructed using config.DATA_DIR and config.DATABASE_NAME.
     The table name is taken from config.TABLE_NAME.
+    Column selection, filters and the row limit are compiled into one parameterized
+    query, so only the requested columns and rows are read from the database.
+
+    By default the data is read from a columnar Arrow IPC snapshot of the table instead
+    (see write_columnar_snapshot). The snapshot is memory-mapped, so only the selected
+    columns are read. It records the database's write generation; writes leave it
+    untouched, and a missing snapshot or one of an older generation is rebuilt by the
+    first load that uses it. If it cannot be rebuilt, the data is read from SQLite.
+    Both paths return the same dtypes.
+
+    Args:
+        columns (Optional[Sequence[str]]): The columns to load. Columns that are not in
+                                           the table are skipped with a warning.
+                                           Defaults to all columns.
+        event_names (Optional[Sequence[str]]): Only load comments of these events.
+        time_periods (Optional[Sequence[str]]): Only load comments of these time periods
+                                                (e.g. 'Pre-Event').
+        limit (Optional[int]): The maximum number of rows to load.
+        use_snapshot (Optional[bool]): Read from the columnar snapshot if possible.
+                                       Defaults to config.COLUMNAR_SNAPSHOT_ENABLED.
 
     Returns:
         pd.DataFrame: The comments DataFrame. Returns an empty DataFrame if loading fails.
     """
+    if use_snapshot is None:
+        use_snapshot = getattr(config, "COLUMNAR_SNAPSHOT_ENABLED", True)
+
     # Ensure config attributes exist
     if not hasattr(config, "DATABASE_NAME") or not config.DATABASE_NAME:
         logger.error(
@@ -102,17 +243,40 @@ def load_data_from_sqlite() -> pd.DataFrame:
         )
         return df_comments
 
+    if use_snapshot:
+        df_snapshot = _load_from_snapshot(
+            db_path, columns, event_names, time_periods, limit
+        )
+        if df_snapshot is None and write_columnar_snapshot():
+            df_snapshot = _load_from_snapshot(
+                db_path, columns, event_names, time_periods, limit
+            )
+        if df_snapshot is not None:
+            return df_snapshot
+
     try:
-        with sqlite3.connect(db_path) as conn:
+        with closing(_connect(db_path)) as conn:
             logger.info(f"Attempting to load data from SQLite database: {db_path}")
 
-            df_comments = pd.read_sql_query(f"SELECT * FROM {config.TABLE_NAME}", conn)
+            declared_types = _declared_types(conn, config.TABLE_NAME)
+            query, params = _build_select_query(
+                config.TABLE_NAME,
+                declared_types,
+                columns,
+                event_names,
+                time_periods,
+                limit,
+            )
+            df_comments = pd.read_sql_query(query, conn, params=params)
+            df_comments = _restore_column_types(df_comments, declared_types)
             logger.info(
                 f"Successfully loaded '{config.TABLE_NAME}' table with {len(df_comments)} rows from '{db_path}'."
             )
 
     except pd.io.sql.DatabaseError as e:  # Specific error for pandas read_sql_query
         logger.error(f"Database error during data loading from '{db_path}': {e}")
+    except ValueError as e:
+        logger.error(f"Invalid query for data loading from '{db_path}': {e}")
     except sqlite3.Error as e:
         logger.error(f"SQLite error during data loading from '{db_path}': {e}")
     except Exception as e:
@@ -123,6 +287,119 @@ def load_data_from_sqlite() -> pd.DataFrame:
     return df_comments
 
 
+def write_columnar_snapshot() -> Optional[str]:
+    """
+    Writes a columnar snapshot of the comments table next to the database: an
+    uncompressed Arrow IPC file, so it can be memory-mapped and its columns used without
+    copying. The columns keep the types load_data_from_sqlite restores, and the
+    low-cardinality SNAPSHOT_CATEGORICAL_COLUMNS are dictionary-encoded, to be decoded
+    again on load. The database's write generation is stored in the schema metadata.
+    Called by load_data_from_sqlite when the snapshot is missing or outdated, or
+    directly to build it ahead of the first load. Requires the 'pyarrow' package.
+
+    Returns:
+        Optional[str]: The path of the snapshot, or None if it could not be written.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        logger.warning("Writing a columnar snapshot requires the 'pyarrow' package.")
+        return None
+
+    snapshot_path = _get_snapshot_path()
+    if snapshot_path is None:
+        return None
+    # Read before the data, so a concurrent write leaves the snapshot outdated
+    write_generation = _read_write_generation(_get_db_path())
+    if write_generation is None:
+        return None
+    df_comments = load_data_from_sqlite(use_snapshot=False)
+    if df_comments.empty:
+        logger.warning("No data in the database. Columnar snapshot not written.")
+        return None
+
+    for column in SNAPSHOT_CATEGORICAL_COLUMNS:
+        if column in df_comments.columns:
+            df_comments[column] = df_comments[column].astype("category")
+
+    temporary_path = f"{snapshot_path}.tmp"
+    try:
+        table = pa.Table.from_pandas(df_comments, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                SNAPSHOT_GENERATION_KEY: str(write_generation).encode(),
+            }
+        )
+        with pa.OSFile(temporary_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temporary_path, snapshot_path)
+    except (pa.ArrowException, OSError) as e:
+        logger.error(f"Error writing columnar snapshot '{snapshot_path}': {e}")
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        return None
+
+    logger.info(
+        f"Wrote columnar snapshot of '{config.TABLE_NAME}' with {table.num_rows} rows to '{snapshot_path}'."
+    )
+    return snapshot_path
+
+
+def iter_data_from_sqlite(
+    chunksize: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+    event_names: Optional[Sequence[str]] = None,
+    time_periods: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams data from the SQLite database as DataFrame chunks of at most 'chunksize'
+    rows, so memory use is bounded by the chunk size rather than the table size.
+    Accepts the same column selection, filters and row limit as load_data_from_sqlite;
+    each chunk has the same column types as the DataFrame it returns.
+
+    Args:
+        chunksize (Optional[int]): Rows per chunk. Defaults to config.SQLITE_READ_CHUNK_SIZE.
+        columns (Optional[Sequence[str]]): The columns to load. Defaults to all columns.
+        event_names (Optional[Sequence[str]]): Only load comments of these events.
+        time_periods (Optional[Sequence[str]]): Only load comments of these time periods.
+        limit (Optional[int]): The maximum number of rows to load in total.
+
+    Yields:
+        pd.DataFrame: The next chunk of rows. Nothing is yielded if loading fails.
+    """
+    db_path = _get_db_path()
+    if db_path is None:
+        return
+    if not os.path.exists(db_path):
+        logger.warning(f"Database file '{db_path}' does not exist. No data to stream.")
+        return
+    if chunksize is None:
+        chunksize = getattr(config, "SQLITE_READ_CHUNK_SIZE", 50000)
+
+    conn = _connect(db_path)
+    try:
+        declared_types = _declared_types(conn, config.TABLE_NAME)
+        query, params = _build_select_query(
+            config.TABLE_NAME, declared_types, columns, event_names, time_periods, limit
+        )
+        logger.info(
+            f"Streaming '{config.TABLE_NAME}' from '{db_path}' in chunks of {chunksize} rows."
+        )
+        for chunk in pd.read_sql_query(query, conn, params=params, chunksize=chunksize):
+            yield _restore_column_types(chunk, declared_types)
+    except pd.io.sql.DatabaseError as e:
+        logger.error(f"Database error while streaming data from '{db_path}': {e}")
+    except ValueError as e:
+        logger.error(f"Invalid query for streaming data from '{db_path}': {e}")
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error while streaming data from '{db_path}': {e}")
+    finally:
+        conn.close()
+
+
 def check_db_exists_and_has_data() -> bool:
     """
     Checks if the SQLite database file exists and if the specified table contains data.
@@ -151,7 +428,7 @@ def check_db_exists_and_has_data() -> bool:
         return False
 
     try:
-        with sqlite3.connect(db_path) as conn:
+        with closing(_connect(db_path)) as conn:
             cursor = conn.cursor()
 
             # Check if table exists
@@ -186,3 +463,713 @@ def check_db_exists_and_has_data() -> bool:
             f"An unexpected error occurred during DB check for '{db_path}': {e}"
         )
         return False
+
+
+def _get_db_path() -> Optional[str]:
+    """
+    Returns the path of the SQLite database, or None if config.DATABASE_NAME or
+    config.TABLE_NAME is not set.
+    """
+    if not getattr(config, "DATABASE_NAME", None):
+        logger.error("config.DATABASE_NAME is not defined or is empty.")
+        return None
+    if not getattr(config, "TABLE_NAME", None):
+        logger.error("config.TABLE_NAME is not defined or is empty.")
+        return None
+    return os.path.join(DATA_BASE_DIR, "processed", config.DATABASE_NAME)
+
+
+def _column_type(column: str, series: Optional[pd.Series] = None) -> str:
+    """
+    Returns the declared SQLite type of a comments table column: the type from
+    COMMENTS_TABLE_SCHEMA, or one derived from the pandas dtype for other columns.
+    """
+    if column in COMMENTS_TABLE_SCHEMA:
+        return COMMENTS_TABLE_SCHEMA[column]
+    if series is None:
+        return "TEXT"
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "TIMESTAMP"
+    if pd.api.types.is_bool_dtype(series):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    return "TEXT"
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """
+    Opens the SQLite database with the configured pragmas: WAL journaling, so readers
+    do not block the writer, 'synchronous=NORMAL' (safe with WAL), and the page size,
+    page cache size and memory-mapped I/O size from config.
+    The page size only takes effect for a new database file.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA page_size = {int(getattr(config, 'SQLITE_PAGE_SIZE', 4096))}")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # A negative cache_size is in KiB rather than pages
+    conn.execute(
+        f"PRAGMA cache_size = {-int(getattr(config, 'SQLITE_CACHE_SIZE_KIB', 65536))}"
+    )
+    conn.execute(f"PRAGMA mmap_size = {int(getattr(config, 'SQLITE_MMAP_SIZE', 0))}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+def _declared_types(conn: sqlite3.Connection, table_name: str) -> Dict[str, str]:
+    """Returns the declared type of each column of a table."""
+    return {
+        row[1]: (row[2] or "").upper()
+        for row in conn.execute(f"PRAGMA table_info({_quote(table_name)})")
+    }
+
+
+def _restore_column_types(
+    df: pd.DataFrame, declared_types: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Converts columns read from SQLite back to the dtypes of the processed DataFrame:
+    TIMESTAMP columns to datetime64 and BOOLEAN columns to bool, or to the nullable
+    'boolean' dtype if they contain NULLs. Tables written before the explicit schema
+    declare booleans as INTEGER; the column types of COMMENTS_TABLE_SCHEMA apply to them.
+    """
+    for column in df.columns:
+        sql_type = declared_types.get(column, "")
+        if sql_type not in ("TIMESTAMP", "BOOLEAN"):
+            sql_type = COMMENTS_TABLE_SCHEMA.get(column, "")
+        if sql_type == "TIMESTAMP":
+            df[column] = pd.to_datetime(df[column], errors="coerce")
+        elif sql_type == "BOOLEAN":
+            df[column] = (
+                df[column].astype("boolean")
+                if df[column].isna().any()
+                else df[column].astype(bool)
+            )
+    return df
+
+
+def _build_select_query(
+    table_name: str,
+    declared_types: Dict[str, str],
+    columns: Optional[Sequence[str]] = None,
+    event_names: Optional[Sequence[str]] = None,
+    time_periods: Optional[Sequence[str]] = None,
+    limit: Optional[int] = None,
+) -> Tuple[str, List[Any]]:
+    """
+    Compiles a column selection, filters and a row limit into a parameterized SELECT
+    statement. Column names are checked against the table's columns; filter values and
+    the limit are bound as parameters.
+
+    Args:
+        table_name (str): The table to read.
+        declared_types (Dict[str, str]): The table's columns, as returned by _declared_types.
+        columns (Optional[Sequence[str]]): The columns to select; all columns if None.
+        event_names (Optional[Sequence[str]]): Allowed 'event_name' values.
+        time_periods (Optional[Sequence[str]]): Allowed 'time_period' values.
+        limit (Optional[int]): The maximum number of rows.
+
+    Raises:
+        ValueError: If none of the requested columns exist.
+
+    Returns:
+        Tuple[str, List[Any]]: The SQL statement and its parameters.
+    """
+    if columns is None:
+        select_list = "*"
+    else:
+        unknown_columns = [column for column in columns if column not in declared_types]
+        if unknown_columns:
+            logger.warning(
+                f"Skipping columns not found in table '{table_name}': {unknown_columns}"
+            )
+        selected = [
+            column for column in dict.fromkeys(columns) if column in declared_types
+        ]
+        if not selected:
+            raise ValueError(
+                f"None of the columns {list(columns)} exist in '{table_name}'."
+            )
+        select_list = ", ".join(_quote(column) for column in selected)
+
+    conditions: List[str] = []
+    params: List[Any] = []
+    for column, values in (("event_name", event_names), ("time_period", time_periods)):
+        if values is None:
+            continue
+        values = list(values)
+        if not values:
+            # An empty filter matches no rows
+            conditions.append("0")
+            continue
+        conditions.append(f"{_quote(column)} IN ({', '.join('?' for _ in values)})")
+        params.extend(values)
+
+    query = f"SELECT {select_list} FROM {_quote(table_name)}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(int(limit))
+    return query, params
+
+
+def _get_snapshot_path() -> Optional[str]:
+    """Returns the path of the columnar snapshot of the comments table."""
+    db_path = _get_db_path()
+    if db_path is None:
+        return None
+    return os.path.join(os.path.dirname(db_path), f"{config.TABLE_NAME}.arrow")
+
+
+def _read_write_generation(db_path: Optional[str]) -> Optional[int]:
+    """
+    Returns the write generation of the database, its 'user_version', or None if it
+    cannot be read. Modification times are no use for this: any connection can leave a
+    newer WAL file behind without writing.
+    """
+    if db_path is None or not os.path.exists(db_path):
+        return None
+    try:
+        with closing(_connect(db_path)) as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+    except sqlite3.Error as e:
+        logger.error(
+            f"SQLite error while reading the write generation of '{db_path}': {e}"
+        )
+        return None
+
+
+def _bump_write_generation(conn: sqlite3.Connection) -> None:
+    """
+    Increments the write generation of the database. Called inside the transaction of
+    every write, so it is committed together with the data.
+    """
+    generation = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.execute(f"PRAGMA user_version = {int(generation) + 1}")
+
+
+def _snapshot_generation(schema: Any) -> Optional[int]:
+    """Returns the write generation recorded in a snapshot's schema, if any."""
+    value = (schema.metadata or {}).get(SNAPSHOT_GENERATION_KEY)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _load_from_snapshot(
+    db_path: str,
+    columns: Optional[Sequence[str]],
+    event_names: Optional[Sequence[str]],
+    time_periods: Optional[Sequence[str]],
+    limit: Optional[int],
+) -> Optional[pd.DataFrame]:
+    """
+    Loads data from the memory-mapped columnar snapshot if it was built from the
+    database's current write generation. Only the selected columns are materialized;
+    columns without missing values are handed to pandas without copying.
+    Dictionary-encoded columns are decoded after filtering, so the dtypes match a load
+    from SQLite.
+
+    Returns:
+        Optional[pd.DataFrame]: The data, or None if the snapshot is missing, outdated
+                                or unreadable, in which case the caller rebuilds it or
+                                reads from SQLite.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return None
+
+    snapshot_path = _get_snapshot_path()
+    if snapshot_path is None:
+        return None
+    if not os.path.exists(snapshot_path):
+        logger.info("Columnar snapshot is missing.")
+        return None
+
+    try:
+        with pa.memory_map(snapshot_path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            write_generation = _read_write_generation(db_path)
+            if (
+                write_generation is None
+                or _snapshot_generation(reader.schema) != write_generation
+            ):
+                logger.info("Columnar snapshot is older than the database.")
+                return None
+            table = reader.read_all()
+
+        if columns is not None:
+            unknown_columns = [c for c in columns if c not in table.column_names]
+            if unknown_columns:
+                logger.warning(
+                    f"Skipping columns not found in table '{config.TABLE_NAME}': {unknown_columns}"
+                )
+            selected = [c for c in dict.fromkeys(columns) if c in table.column_names]
+            if not selected:
+                logger.error(
+                    f"None of the columns {list(columns)} exist in '{config.TABLE_NAME}'."
+                )
+                return pd.DataFrame()
+        else:
+            selected = table.column_names
+
+        mask = None
+        for column, values in (
+            ("event_name", event_names),
+            ("time_period", time_periods),
+        ):
+            if values is None:
+                continue
+            condition = pc.is_in(
+                table[column].cast(pa.string()),
+                value_set=pa.array(list(values), pa.string()),
+            )
+            mask = condition if mask is None else pc.and_(mask, condition)
+
+        table = table.select(selected)
+        if mask is not None:
+            table = table.filter(mask)
+        if limit is not None:
+            table = table.slice(0, int(limit))
+        for index, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                table = table.set_column(
+                    index, field.name, table.column(index).cast(field.type.value_type)
+                )
+
+        df_comments = table.to_pandas(split_blocks=True)
+    except (pa.ArrowException, OSError, KeyError) as e:
+        logger.warning(f"Could not read columnar snapshot '{snapshot_path}': {e}.")
+        return None
+
+    logger.info(
+        f"Successfully loaded '{config.TABLE_NAME}' with {len(df_comments)} rows from columnar snapshot '{snapshot_path}'."
+    )
+    return df_comments
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Runs a block in one explicit transaction, including DDL statements, which sqlite3
+    would otherwise execute outside of it. Commits on success and rolls back on error.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        yield conn
+
+
+def _quote(identifier: str) -> str:
+    """Quotes an SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _table_columns(conn: sqlite3.Connection, table_name: str) -> List[Tuple[str, int]]:
+    """Returns (column name, primary key position) for each column of a table."""
+    return [
+        (row[1], row[5])
+        for row in conn.execute(f"PRAGMA table_info({_quote(table_name)})")
+    ]
+
+
+def _create_comments_table(
+    conn: sqlite3.Connection, table_name: str, columns: List[Tuple[str, str]]
+) -> None:
+    """Creates the comments table from (column name, declared type) pairs and the composite primary key."""
+    column_definitions = [
+        f"{_quote(name)} {sql_type}"
+        + (" NOT NULL" if name in PRIMARY_KEY_COLUMNS else "")
+        for name, sql_type in columns
+    ]
+    primary_key = ", ".join(_quote(column) for column in PRIMARY_KEY_COLUMNS)
+    conn.execute(
+        f"CREATE TABLE {_quote(table_name)} ("
+        + ", ".join(column_definitions)
+        + f", PRIMARY KEY ({primary_key}))"
+    )
+
+
+def _create_indexes(conn: sqlite3.Connection, table_name: str) -> None:
+    """Creates the secondary indexes of INDEXED_COLUMNS that do not exist yet."""
+    for column in INDEXED_COLUMNS:
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{table_name}_{column}')} "
+            f"ON {_quote(table_name)} ({_quote(column)})"
+        )
+
+
+def _ensure_comments_table(
+    conn: sqlite3.Connection, table_name: str, df: pd.DataFrame
+) -> None:
+    """
+    Makes sure the comments table exists with the declared types of
+    COMMENTS_TABLE_SCHEMA, a primary key on PRIMARY_KEY_COLUMNS, the secondary indexes
+    and every column of the DataFrame.
+    A table written by an older version with to_sql(if_exists="replace") has no primary
+    key and pandas' inferred types; it is rebuilt in place, keeping the last row of any
+    duplicate key. Columns the DataFrame adds are appended with ALTER TABLE.
+
+    Args:
+        conn (sqlite3.Connection): An open connection, inside a transaction.
+        table_name (str): The name of the comments table.
+        df (pd.DataFrame): The rows about to be written.
+
+    Raises:
+        ValueError: If an existing table lacks a primary key column.
+    """
+    existing = [
+        (row[1], row[2], row[5])
+        for row in conn.execute(f"PRAGMA table_info({_quote(table_name)})")
+    ]
+    if not existing:
+        _create_comments_table(
+            conn,
+            table_name,
+            [(column, _column_type(column, df[column])) for column in df.columns],
+        )
+        _create_indexes(conn, table_name)
+        logger.info(
+            f"Created table '{table_name}' with primary key {PRIMARY_KEY_COLUMNS}."
+        )
+        return
+
+    existing_names = [name for name, _, _ in existing]
+    primary_key = tuple(
+        name for name, _, pk in sorted(existing, key=lambda c: c[2]) if pk
+    )
+    outdated_types = [
+        name
+        for name, sql_type, _ in existing
+        if name in COMMENTS_TABLE_SCHEMA and sql_type != COMMENTS_TABLE_SCHEMA[name]
+    ]
+    if primary_key != PRIMARY_KEY_COLUMNS or outdated_types:
+        missing_key_columns = [
+            c for c in PRIMARY_KEY_COLUMNS if c not in existing_names
+        ]
+        if missing_key_columns:
+            raise ValueError(
+                f"Table '{table_name}' has no {missing_key_columns} column(s) and cannot be migrated."
+            )
+        logger.info(
+            f"Migrating table '{table_name}' to the typed schema with primary key {PRIMARY_KEY_COLUMNS}."
+        )
+        legacy_table = f"{table_name}_legacy"
+        conn.execute(
+            f"ALTER TABLE {_quote(table_name)} RENAME TO {_quote(legacy_table)}"
+        )
+        _create_comments_table(
+            conn,
+            table_name,
+            [
+                (name, COMMENTS_TABLE_SCHEMA.get(name, sql_type or "TEXT"))
+                for name, sql_type, _ in existing
+            ],
+        )
+        # Later rows win for duplicate keys, as they would with a full replace
+        columns = ", ".join(_quote(name) for name in existing_names)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {_quote(table_name)} ({columns}) "
+            f"SELECT {columns} FROM {_quote(legacy_table)} ORDER BY rowid"
+        )
+        conn.execute(f"DROP TABLE {_quote(legacy_table)}")
+
+    for column in df.columns:
+        if column not in existing_names:
+            conn.execute(
+                f"ALTER TABLE {_quote(table_name)} ADD COLUMN {_quote(column)} "
+                f"{_column_type(column, df[column])}"
+            )
+            logger.info(f"Added column '{column}' to table '{table_name}'.")
+    _create_indexes(conn, table_name)
+
+
+def _ensure_partitions_table(conn: sqlite3.Connection, table_name: str) -> None:
+    """
+    Creates the per-event bookkeeping table if it does not exist, seeded with the events
+    already stored in the comments table.
+    """
+    if _table_columns(conn, PARTITIONS_TABLE_NAME):
+        return
+    conn.execute(
+        f"CREATE TABLE {_quote(PARTITIONS_TABLE_NAME)} ("
+        '"event_name" TEXT PRIMARY KEY, '
+        '"row_count" INTEGER NOT NULL, '
+        '"updated_at" TEXT NOT NULL)'
+    )
+    if not _table_columns(conn, table_name):
+        return
+    conn.execute(
+        f"INSERT INTO {_quote(PARTITIONS_TABLE_NAME)} "
+        '("event_name", "row_count", "updated_at") '
+        f'SELECT "event_name", COUNT(*), ? FROM {_quote(table_name)} GROUP BY "event_name"',
+        (_utc_now(),),
+    )
+
+
+def _utc_now() -> str:
+    """Returns the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _finish_write(conn: sqlite3.Connection) -> None:
+    """
+    Runs after a committed write: updates the query planner statistics and moves the
+    WAL content into the database file. The columnar snapshot is left alone; the write
+    generation marks it as outdated, and the next load rebuilds it, so a write only
+    costs the rows it touches.
+    """
+    conn.execute("PRAGMA optimize")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def _as_chunks(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+) -> Iterable[pd.DataFrame]:
+    """Returns a single DataFrame as a one-element list and passes iterables of chunks through."""
+    return [data] if isinstance(data, pd.DataFrame) else data
+
+
+def _frame_to_rows(df: pd.DataFrame) -> List[Tuple[Any, ...]]:
+    """
+    Converts the rows of a DataFrame to tuples of values sqlite3 can bind, in the same
+    representation to_sql uses: timestamps as 'YYYY-MM-DD HH:MM:SS' text, booleans as
+    integers and missing values as NULL.
+    """
+    converted = []
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = [
+                None if pd.isna(value) else value.isoformat(sep=" ")
+                for value in series.dt.to_pydatetime()
+            ]
+        else:
+            values = series.astype(object).where(series.notna(), None).tolist()
+            if pd.api.types.is_bool_dtype(series):
+                values = [None if value is None else int(value) for value in values]
+        converted.append(values)
+    return list(zip(*converted))
+
+
+def _upsert_rows(
+    conn: sqlite3.Connection, table_name: str, df: pd.DataFrame, chunksize: int
+) -> int:
+    """
+    Writes the rows of a DataFrame with INSERT ... ON CONFLICT DO UPDATE. Rows are
+    converted and passed to executemany 'chunksize' at a time, so the Python copy of the
+    data never exceeds one chunk.
+
+    Returns:
+        int: The number of rows written.
+    """
+    columns = list(df.columns)
+    column_list = ", ".join(_quote(column) for column in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    key = ", ".join(_quote(column) for column in PRIMARY_KEY_COLUMNS)
+    updates = ", ".join(
+        f"{_quote(column)} = excluded.{_quote(column)}"
+        for column in columns
+        if column not in PRIMARY_KEY_COLUMNS
+    )
+    sql = (
+        f"INSERT INTO {_quote(table_name)} ({column_list}) VALUES ({placeholders}) "
+        f"ON CONFLICT ({key}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING")
+    )
+    for start in range(0, len(df), chunksize):
+        conn.executemany(sql, _frame_to_rows(df.iloc[start : start + chunksize]))
+    return len(df)
+
+
+def _finish_event(
+    conn: sqlite3.Connection, table_name: str, event_name: str, comment_ids: Set[str]
+) -> Tuple[int, int]:
+    """
+    Deletes the stored rows of an event whose comment ID was not written, and records
+    the event's row count in the 'event_partitions' table. An event written without any
+    rows is recorded with a row count of 0, even if the comments table does not exist.
+
+    Returns:
+        Tuple[int, int]: The number of stale rows deleted and the event's row count.
+    """
+    if not _table_columns(conn, table_name):
+        conn.execute(
+            f"INSERT OR REPLACE INTO {_quote(PARTITIONS_TABLE_NAME)} "
+            '("event_name", "row_count", "updated_at") VALUES (?, 0, ?)',
+            (event_name, _utc_now()),
+        )
+        return 0, 0
+    stored_ids = {
+        row[0]
+        for row in conn.execute(
+            f'SELECT "comment_id" FROM {_quote(table_name)} WHERE "event_name" = ?',
+            (event_name,),
+        )
+    }
+    stale_ids = stored_ids - comment_ids
+    if stale_ids:
+        conn.executemany(
+            f'DELETE FROM {_quote(table_name)} WHERE "event_name" = ? AND "comment_id" = ?',
+            [(event_name, comment_id) for comment_id in stale_ids],
+        )
+    row_count = conn.execute(
+        f'SELECT COUNT(*) FROM {_quote(table_name)} WHERE "event_name" = ?',
+        (event_name,),
+    ).fetchone()[0]
+    conn.execute(
+        f"INSERT INTO {_quote(PARTITIONS_TABLE_NAME)} "
+        '("event_name", "row_count", "updated_at") VALUES (?, ?, ?) '
+        'ON CONFLICT ("event_name") DO UPDATE SET '
+        '"row_count" = excluded."row_count", "updated_at" = excluded."updated_at"',
+        (event_name, row_count, _utc_now()),
+    )
+    return len(stale_ids), row_count
+
+
+def _write_chunks(
+    conn: sqlite3.Connection,
+    table_name: str,
+    chunks: Iterable[pd.DataFrame],
+    chunksize: int,
+    empty_event_names: Iterable[str] = (),
+) -> int:
+    """
+    Upserts DataFrame chunks one at a time, then removes the stale rows of every event
+    that appeared in them or in empty_event_names and updates their 'event_partitions'
+    entries. Only the comment IDs of the written events are kept in memory between
+    chunks. Must be called inside a transaction.
+
+    Raises:
+        ValueError: If a chunk lacks one of the PRIMARY_KEY_COLUMNS.
+
+    Returns:
+        int: The number of rows written.
+    """
+    rows_written = 0
+    written_ids: Dict[str, Set[str]] = {}
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        missing_key_columns = [
+            column for column in PRIMARY_KEY_COLUMNS if column not in chunk.columns
+        ]
+        if missing_key_columns:
+            raise ValueError(
+                f"Cannot write data without the key column(s) {missing_key_columns}."
+            )
+        _ensure_comments_table(conn, table_name, chunk)
+        rows_written += _upsert_rows(conn, table_name, chunk, chunksize)
+        for event_name, comment_ids in chunk.groupby("event_name", sort=False)[
+            "comment_id"
+        ]:
+            written_ids.setdefault(event_name, set()).update(comment_ids.astype(str))
+    for event_name in empty_event_names:
+        written_ids.setdefault(event_name, set())
+
+    if written_ids:
+        _ensure_partitions_table(conn, table_name)
+    for event_name, comment_ids in written_ids.items():
+        rows_deleted, row_count = _finish_event(
+            conn, table_name, event_name, comment_ids
+        )
+        logger.info(
+            f"Upserted {len(comment_ids)} rows for event '{event_name}' into '{table_name}' "
+            f"({rows_deleted} stale rows deleted, {row_count} rows stored)."
+        )
+    return rows_written
+
+
+def upsert_data_to_sqlite(
+    df_comments: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    chunksize: Optional[int] = None,
+    empty_event_names: Iterable[str] = (),
+) -> None:
+    """
+    Incrementally writes processed comments to the SQLite database.
+    Unlike save_data_to_sqlite, only the rows of the events present in the data are
+    touched: each event's rows are inserted or updated in chunks, rows of that event
+    that are no longer present are deleted, and the event's row count is recorded in the
+    'event_partitions' table. Rows of all other events are left as they are.
+    Everything is written in a single transaction.
+
+    Args:
+        df_comments (Union[pd.DataFrame, Iterable[pd.DataFrame]]): Processed comments
+            with 'event_name' and 'comment_id' columns, or an iterable of such chunks.
+            Chunks are written one at a time; an event's stale rows are only removed
+            after all chunks have been written, so its rows may span several chunks.
+        chunksize (Optional[int]): Rows converted and written per executemany call.
+                                   Defaults to config.SQLITE_WRITE_CHUNK_SIZE.
+        empty_event_names (Iterable[str]): Events that were collected without any
+                                           comments. Their stored rows are deleted and
+                                           they are recorded with a row count of 0, so
+                                           they count as stored.
+    """
+    db_path = _get_db_path()
+    if db_path is None:
+        return
+    if chunksize is None:
+        chunksize = getattr(config, "SQLITE_WRITE_CHUNK_SIZE", 5000)
+
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+    conn = _connect(db_path)
+    try:
+        logger.info(f"Attempting to upsert data into SQLite database: {db_path}")
+        with _transaction(conn):
+            _write_chunks(
+                conn,
+                config.TABLE_NAME,
+                _as_chunks(df_comments),
+                chunksize,
+                empty_event_names,
+            )
+            _bump_write_generation(conn)
+        _finish_write(conn)
+    except (sqlite3.Error, ValueError) as e:
+        logger.error(f"SQLite error during data upsert into '{db_path}': {e}")
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during data upsert into '{db_path}': {e}"
+        )
+    finally:
+        conn.close()
+
+
+def get_stored_event_names() -> Set[str]:
+    """
+    Returns the names of the events stored in the SQLite database, including events
+    recorded without any comments.
+    They are read from the 'event_partitions' table; databases written before it
+    existed fall back to the distinct 'event_name' values of the comments table.
+
+    Returns:
+        Set[str]: The stored event names. Empty if the database does not exist.
+    """
+    db_path = _get_db_path()
+    if db_path is None or not os.path.exists(db_path):
+        return set()
+
+    try:
+        with closing(_connect(db_path)) as conn:
+            tables = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+            }
+            if PARTITIONS_TABLE_NAME in tables:
+                query = f'SELECT "event_name" FROM {_quote(PARTITIONS_TABLE_NAME)}'
+            elif config.TABLE_NAME in tables:
+                query = f'SELECT DISTINCT "event_name" FROM {_quote(config.TABLE_NAME)}'
+            else:
+                return set()
+            return {row[0] for row in conn.execute(query)}
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error while reading stored events from '{db_path}': {e}")
+        return set()
@@ -1,14 +1,16 @@
+import argparse
 import datetime
+import importlib.metadata
 import json
 import logging
 import os
 import re
 import sys
-from typing import Any, Dict, List, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import praw
 from dotenv import load_dotenv
 
 # Import the centralized configuration
@@ -34,31 +36,46 @@ logger = logging.getLogger(__name__)
 try:
     from BA.src.data.database_utils import (
         check_db_exists_and_has_data,
+        get_stored_event_names,
         load_data_from_sqlite,
-        save_data_to_sqlite,
+        upsert_data_to_sqlite,
     )
     from BA.src.data.preprocess import (
-        calculate_days_from_event_start,
-        categorize_time_period,
+        EventIntervalIndex,
+        calculate_days_from_event_start_series,
+        categorize_time_period_series,
         filter_deleted_and_empty_processed_comments,
         initial_clean_dataframe,
     )
-    from BA.src.data.reddit_scraper import get_posts_and_comments, get_reddit_instance
+    from BA.src.data.raw_io import (
+        find_raw_data_file,
+        load_raw_comments_frame,
+        raw_data_basename,
+    )
+    from BA.src.data.stage_cache import StageCache
     from BA.src.features.feature_engineering import (
         categorize_post_type,  # <-- Hinzugefügt
     )
     from BA.src.features.feature_engineering import (
+        KEYWORD_CATEGORY_COLUMNS,
         add_event_name,
-        calculate_comment_score_per_day,
+        add_keyword_features,
+        calculate_comment_score_per_day_series,
+        calculate_comment_to_post_score_ratio_series,
         calculate_post_title_features,
         extract_time_features,
     )
     from BA.src.features.text_features import (
+        SENTIMENT_SCORE_DECIMALS,
+        SENTIMENT_SCORE_KEYS,
         calculate_text_length,
-        contains_any_keyword,
         contains_question,
-        get_sentiment_scores,
-        preprocess_text,
+        get_keyword_tagger,
+        lemma_cache,
+        load_lemma_cache,
+        preprocess_texts,
+        save_lemma_cache,
+        score_sentiments,
     )
     from BA.src.utils.config_loader import get_dota2_teams, get_keywords
 except ImportError as e:
@@ -67,87 +84,472 @@ except ImportError as e:
     )
     sys.exit(1)
 
+# Output columns of the cached sentiment and keyword stages
+SENTIMENT_COLUMNS = [f"{key}_sentiment" for key in SENTIMENT_SCORE_KEYS]
+KEYWORD_FEATURE_COLUMNS = [
+    col
+    for _, flag_col, count_col in KEYWORD_CATEGORY_COLUMNS.values()
+    for col in (flag_col, count_col)
+] + ["matched_keywords"]
+
+
+def _package_version(package: str) -> Optional[str]:
+    """Returns the installed version of a package, or None if it is unknown."""
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _sentiment_columns(
+    df: pd.DataFrame, max_workers: Optional[int] = None
+) -> pd.DataFrame:
+    """Scores 'processed_comment_body' with VADER into the SENTIMENT_COLUMNS."""
+    sentiment_scores = np.round(
+        score_sentiments(df["processed_comment_body"], max_workers=max_workers).astype(
+            np.float64
+        ),
+        SENTIMENT_SCORE_DECIMALS,
+    )
+    return pd.DataFrame(sentiment_scores, columns=SENTIMENT_COLUMNS, index=df.index)
+
 
-def prepare_data() -> pd.DataFrame:
+def process_event_comments(
+    df: pd.DataFrame,
+    event_key: str,
+    event_params: Dict[str, Any],
+    interval_index: Optional[EventIntervalIndex] = None,
+    stage_cache: Optional[StageCache] = None,
+    stage_workers: Optional[int] = None,
+) -> pd.DataFrame:
     """
-    Orchestrates the entire data preparation pipeline:
-    1. Checks for existing processed data in SQLite.
-    2. If not found, collects raw data from Reddit.
-    3. Performs initial cleaning and preprocessing.
-    4. Extracts text features (sentiment, length).
-    5. Categorizes comments by time period relative to events.
-    6. Performs feature engineering (post title features, keyword presence, ratios, post type).
-    7. Combines data from all events.
-    8. Saves the final processed DataFrame to an SQLite database.
+    Runs the cleaning and feature engineering stages for the raw comments of one event.
+    Used for freshly scraped comments as well as for comments replayed from raw files.
+
+    Args:
+        df (pd.DataFrame): The raw comment records of the event.
+        event_key (str): The key of the event in config.TOURNAMENT_CONFIGS.
+        event_params (Dict[str, Any]): The event configuration, including the enriched
+                                       'pre_event_start' and 'post_event_end' dates.
+        interval_index (Optional[EventIntervalIndex]): A shared index over all events'
+                                       windows, used for the time period lookup.
+                                       Without it, the event's dates are used directly.
+        stage_cache (Optional[StageCache]): Cache of the stage outputs. The cleaning,
+                                       text preprocessing, sentiment, time period,
+                                       keyword and post type stages are only recomputed
+                                       when their input columns, code or settings
+                                       changed. Without it, every stage runs.
+        stage_workers (Optional[int]): Worker processes of the text preprocessing and
+                                       sentiment stages. Defaults to
+                                       config.TEXT_PREPROCESS_WORKERS and
+                                       config.SENTIMENT_WORKERS.
 
     Returns:
-        pd.DataFrame: The combined and processed DataFrame. Returns an empty DataFrame
-                      if the pipeline fails or no data is collected/loaded.
+        pd.DataFrame: The processed DataFrame, or an empty DataFrame if no comments remain.
     """
-    logger.info("--- Starting Data Preparation Pipeline ---")
+    event_name = event_params.get("event_name", event_key)
+    start_date = event_params.get("start_date")
+    if stage_cache is None:
+        stage_cache = StageCache(enabled=False)
+    nltk_version = _package_version("nltk")
+
+    logger.info(f"--- Cleaning and Preprocessing for {event_name} ---")
+    df = stage_cache.run_frame(
+        "cleaning",
+        df,
+        lambda frame: initial_clean_dataframe(frame.copy(), f"{event_name} Comments"),
+        code=(initial_clean_dataframe, process_event_comments),
+    )
+    if df.empty:
+        logger.warning(
+            f"DataFrame is empty after initial cleaning for {event_name}. Skipping further processing for this event."
+        )
+        return pd.DataFrame()
+
+    if "comment_body" in df.columns:
+        df = stage_cache.run(
+            "text_preprocessing",
+            df,
+            ["comment_body"],
+            ["processed_comment_body"],
+            lambda frame: pd.DataFrame(
+                {
+                    "processed_comment_body": preprocess_texts(
+                        frame["comment_body"], max_workers=stage_workers
+                    )
+                }
+            ),
+            code=(preprocess_texts, process_event_comments),
+            settings={"nltk": nltk_version},
+        )
+    else:
+        logger.warning(
+            f"'comment_body' column not found for {event_name}. Skipping text preprocessing."
+        )
+        df["processed_comment_body"] = ""
 
-    df_combined_cleaned = pd.DataFrame()
+    df = filter_deleted_and_empty_processed_comments(df, f"{event_name} Comments")
+    if df.empty:
+        logger.warning(
+            f"DataFrame is empty after filtering deleted/empty comments for {event_name}. Skipping further processing for this event."
+        )
+        return pd.DataFrame()
+
+    logger.info("Performing sentiment analysis and calculating text length...")
+    if (
+        "processed_comment_body" in df.columns
+        and not df["processed_comment_body"].empty
+    ):
+        df = stage_cache.run(
+            "sentiment",
+            df,
+            ["processed_comment_body"],
+            SENTIMENT_COLUMNS,
+            lambda frame: _sentiment_columns(frame, max_workers=stage_workers),
+            code=(score_sentiments, _sentiment_columns, process_event_comments),
+            settings={"nltk": nltk_version},
+        )
+    else:
+        logger.warning(
+            f"No 'processed_comment_body' for sentiment analysis in {event_name}. Filling with NaNs."
+        )
+        df["neg_sentiment"] = np.nan
+        df["neu_sentiment"] = np.nan
+        df["pos_sentiment"] = np.nan
+        df["compound_sentiment"] = np.nan
+
+    if "comment_body" in df.columns:
+        df[["char_count", "word_count"]] = (
+            df["comment_body"].apply(calculate_text_length).apply(pd.Series)
+        )
+    else:
+        logger.warning(
+            f"No 'comment_body' for text length calculation in {event_name}. Filling with NaNs."
+        )
+        df["char_count"] = np.nan
+        df["word_count"] = np.nan
 
-    db_name = getattr(config, "DATABASE_NAME", "reddit_data.db")
-    table_name = getattr(config, "TABLE_NAME", "comments")
+    # Time Period Marking and Time Difference
+    logger.info("Categorizing time periods and calculating days from event start...")
+
+    if "comment_created_utc" in df.columns:
+
+        def _time_columns(frame: pd.DataFrame) -> pd.DataFrame:
+            if interval_index is not None and event_key in interval_index.event_keys:
+                time_period = interval_index.categorize(
+                    frame["comment_created_utc"], event_key
+                )
+            else:
+                time_period = categorize_time_period_series(
+                    frame["comment_created_utc"],
+                    event_params["start_date"],
+                    event_params["end_date"],
+                    event_params[
+                        "pre_event_start"
+                    ],  # Calculated start date of the pre-event window
+                    event_params[
+                        "post_event_end"
+                    ],  # Calculated end date of the post-event window
+                )
+            return pd.DataFrame(
+                {
+                    "time_period": time_period,
+                    "days_from_event_start": calculate_days_from_event_start_series(
+                        frame["comment_created_utc"], start_date
+                    ),
+                },
+                index=frame.index,
+            )
+
+        df = stage_cache.run(
+            "time_periods",
+            df,
+            ["comment_created_utc"],
+            ["time_period", "days_from_event_start"],
+            _time_columns,
+            code=(
+                categorize_time_period_series,
+                calculate_days_from_event_start_series,
+                process_event_comments,
+            ),
+            settings={
+                key: event_params.get(key)
+                for key in (
+                    "start_date",
+                    "end_date",
+                    "pre_event_start",
+                    "post_event_end",
+                )
+            },
+        )
+    else:
+        logger.warning(
+            f"No 'comment_created_utc' for time period categorization in {event_name}. Filling with NaNs."
+        )
+        df["time_period"] = "Unknown"
+        df["days_from_event_start"] = np.nan
+
+    # Feature Engineering
+    logger.info("--- Feature Engineering ---")
+    df = calculate_post_title_features(df.copy())
+    df["contains_question"] = df["comment_body"].apply(contains_question)
+    df["author_karma"] = 0  # Placeholder: Implement actual karma fetching if needed
+
+    keyword_sources = sorted(
+        {source_col for source_col, _, _ in KEYWORD_CATEGORY_COLUMNS.values()}
+    )
+    if all(source_col in df.columns for source_col in keyword_sources):
+        keywords_data = get_keywords()
+        df = stage_cache.run(
+            "keyword_features",
+            df,
+            keyword_sources,
+            KEYWORD_FEATURE_COLUMNS,
+            lambda frame: add_keyword_features(frame[keyword_sources].copy()),
+            code=(add_keyword_features, get_keyword_tagger, process_event_comments),
+            settings={
+                "teams": get_dota2_teams(),
+                "keywords": {
+                    key: keywords_data.get(key, [])
+                    for key in (
+                        "player_keywords",
+                        "hero_keywords",
+                        "tournament_event_keywords",
+                    )
+                },
+                "separator": getattr(config, "MATCHED_KEYWORDS_SEPARATOR", "|"),
+            },
+        )
+    else:
+        df = add_keyword_features(df.copy())
+
+    # NEW: Categorize post type
+    post_type_sources = ["post_id", "post_title", "selftext"]
+    if all(col in df.columns for col in post_type_sources):
+        df = stage_cache.run(
+            "post_type",
+            df,
+            post_type_sources,
+            ["post_type"],
+            lambda frame: categorize_post_type(frame[post_type_sources].copy()),
+            code=(categorize_post_type, process_event_comments),
+            settings=get_keywords().get("post_type_keywords", {}),
+        )
+    else:
+        df = categorize_post_type(
+            df.copy()
+        )  # Pass a copy to avoid SettingWithCopyWarning
+
+    # Handle potential division by zero for ratios
+    df["comment_to_post_score_ratio"] = calculate_comment_to_post_score_ratio_series(df)
+    df["comment_score_per_day"] = calculate_comment_score_per_day_series(df)
+
+    df = add_event_name(df.copy(), event_name)
+    df = extract_time_features(df.copy())
+
+    return df
+
+
+def _init_event_worker(lemma_items: List[Tuple[str, str]]) -> None:
+    """
+    Initializes an event processing worker process. Its lemma cache starts as a copy of
+    the parent's, and the entries it adds are reported back by _process_event_in_worker.
+    """
+    lemma_cache.clear()
+    lemma_cache.update(lemma_items)
+    lemma_cache.track_new_entries()
+
+
+def _process_event_in_worker(
+    df: pd.DataFrame,
+    event_key: str,
+    event_params: Dict[str, Any],
+    interval_index: Optional[EventIntervalIndex],
+    stage_cache: StageCache,
+) -> Tuple[pd.DataFrame, List[Tuple[str, str]], int, int, Dict[str, Dict[str, int]]]:
+    """
+    Runs process_event_comments for one event in a worker process. The event already
+    runs in parallel with the others, so its stages do not start worker pools of their own.
+
+    Returns:
+        Tuple[pd.DataFrame, List[Tuple[str, str]], int, int, Dict[str, Dict[str, int]]]:
+            The processed DataFrame, the lemma cache entries added, the lemma cache hits
+            and misses and the stage cache statistics of this event.
+    """
+    hits, misses = lemma_cache.hits, lemma_cache.misses
+    stage_cache.stats = {}
+    df = process_event_comments(
+        df, event_key, event_params, interval_index, stage_cache, stage_workers=1
+    )
+    return (
+        df,
+        lemma_cache.pop_new_entries(),
+        lemma_cache.hits - hits,
+        lemma_cache.misses - misses,
+        stage_cache.stats,
+    )
+
+
+def process_event_frames(
+    event_frames: Dict[str, pd.DataFrame],
+    tournament_configs: Dict[str, Dict[str, Any]],
+    interval_index: Optional[EventIntervalIndex] = None,
+    stage_cache: Optional[StageCache] = None,
+    max_workers: Optional[int] = None,
+) -> List[pd.DataFrame]:
+    """
+    Runs process_event_comments for every event. Events are independent, so with more
+    than one worker each event is processed in its own worker process; the wall time
+    then approaches that of the slowest event instead of the sum over all events.
+    The lemma cache entries and stage cache statistics of the workers are merged back.
+
+    Args:
+        event_frames (Dict[str, pd.DataFrame]): The raw comments per event key.
+        tournament_configs (Dict[str, Dict[str, Any]]): Event configurations as in
+                                                        config.TOURNAMENT_CONFIGS.
+        interval_index (Optional[EventIntervalIndex]): The shared index over all events'
+                                                       windows.
+        stage_cache (Optional[StageCache]): Cache of the stage outputs.
+        max_workers (Optional[int]): Number of worker processes. Defaults to
+                                     config.PREPARE_DATA_EVENT_WORKERS. With one worker
+                                     or one event, the events are processed in this
+                                     process and the stages use their own worker pools.
+
+    Raises:
+        LookupError: If NLTK data needed for text processing is missing.
+
+    Returns:
+        List[pd.DataFrame]: The non-empty processed DataFrames, in the order of
+                            event_frames.
+    """
+    if max_workers is None:
+        max_workers = getattr(config, "PREPARE_DATA_EVENT_WORKERS", 1)
+    if stage_cache is None:
+        stage_cache = StageCache(enabled=False)
+    max_workers = max(1, min(int(max_workers), len(event_frames)))
+
+    all_dfs: List[pd.DataFrame] = []
+    if max_workers == 1:
+        for event_key, df in event_frames.items():
+            df = process_event_comments(
+                df,
+                event_key,
+                tournament_configs[event_key],
+                interval_index,
+                stage_cache,
+            )
+            if not df.empty:
+                all_dfs.append(df)
+        return all_dfs
+
+    logger.info(
+        f"Processing {len(event_frames)} events with {max_workers} worker processes..."
+    )
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_event_worker,
+        initargs=(lemma_cache.items(),),
+    ) as executor:
+        futures = {
+            event_key: executor.submit(
+                _process_event_in_worker,
+                df,
+                event_key,
+                tournament_configs[event_key],
+                interval_index,
+                stage_cache,
+            )
+            for event_key, df in event_frames.items()
+        }
+        for event_key, future in futures.items():
+            event_name = tournament_configs[event_key].get("event_name", event_key)
+            try:
+                df, new_lemmas, hits, misses, stage_stats = future.result()
+            except LookupError:
+                # Missing NLTK data fails every event, not just this one
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Error processing the comments of {event_name}: {e}. Skipping this event."
+                )
+                continue
+            lemma_cache.merge(new_lemmas, hits, misses)
+            stage_cache.merge_stats(stage_stats)
+            if not df.empty:
+                all_dfs.append(df)
+    return all_dfs
+
+
+def collect_reddit_event_frames(
+    tournament_configs: Dict[str, Dict[str, Any]],
+) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Collects the raw comments of every configured event from Reddit.
+
+    Args:
+        tournament_configs (Dict[str, Dict[str, Any]]): Event configurations as in
+                                                        config.TOURNAMENT_CONFIGS.
+
+    Returns:
+        Optional[Dict[str, pd.DataFrame]]: The raw comments per event key, an empty
+                                           DataFrame for events Reddit returned no
+                                           comments for (events that failed are left
+                                           out), or None if the Reddit instance could
+                                           not be initialized.
+    """
     reddit_subreddit_name = getattr(config, "REDDIT_SUBREDDIT_NAME", "dota2")
     reddit_post_limit = getattr(config, "REDDIT_POST_LIMIT", 1000)
     reddit_comment_limit = getattr(config, "REDDIT_COMMENT_LIMIT", 50)
     reddit_max_posts_to_process = getattr(config, "REDDIT_MAX_POSTS_TO_PROCESS", 15)
-    pre_post_window_days = getattr(config, "PRE_POST_WINDOW_DAYS", 7)
-    tournament_configs = getattr(config, "TOURNAMENT_CONFIGS", {})
+    reddit_scraper_backend = getattr(config, "REDDIT_SCRAPER_BACKEND", "sync")
 
-    if check_db_exists_and_has_data():
+    # The scraper pulls in praw, so it is only imported when Reddit is actually used
+    from BA.src.data.reddit_scraper import (
+        collect_all_events,
+        get_posts_and_comments,
+        get_reddit_instance,
+    )
+
+    try:
+        reddit = get_reddit_instance()
+        subreddit = reddit.subreddit(reddit_subreddit_name)
         logger.info(
-            f"\nProcessed data found in '{db_name}'. Loading data directly from database."
+            f"Reddit instance initialized for subreddit: {reddit_subreddit_name}."
         )
-        df_comments_loaded = load_data_from_sqlite()
-        if not df_comments_loaded.empty:
-            df_combined_cleaned = df_comments_loaded
-            logger.info(f"Loaded {len(df_combined_cleaned)} rows from database.")
-        else:
-            logger.warning(
-                "Database exists but returned an empty DataFrame. Proceeding with data collection."
-            )
-    else:
-        logger.info(
-            f"\nNo processed data found in '{db_name}'. Proceeding with data collection and processing."
+    except Exception as e:
+        logger.error(f"Failed to initialize Reddit instance or access subreddit: {e}")
+        return None
+
+    # With the async backend, all events are collected up front in one event loop
+    comments_by_event: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    if reddit_scraper_backend == "async" and tournament_configs:
+        logger.info("Collecting all events concurrently (async scraper backend)...")
+        comments_by_event = collect_all_events(
+            subreddit,
+            tournament_configs,
+            post_limit=reddit_post_limit,
+            comment_limit=reddit_comment_limit,
+            max_posts_to_process=reddit_max_posts_to_process,
         )
 
-        try:
-            reddit = get_reddit_instance()
-            subreddit = reddit.subreddit(reddit_subreddit_name)
-            logger.info(
-                f"Reddit instance initialized for subreddit: {reddit_subreddit_name}."
-            )
-        except Exception as e:
-            logger.error(
-                f"Failed to initialize Reddit instance or access subreddit: {e}"
-            )
-            logger.info("--- Data Preparation Pipeline Aborted ---")
-            return pd.DataFrame()
+    event_frames: Dict[str, pd.DataFrame] = {}
+    for event_key, event_params in tournament_configs.items():
+        event_name = event_params.get("event_name", event_key)
+        query = event_params.get("query")
+        start_date = event_params.get("start_date")
+        end_date = event_params.get("end_date")
 
-        logger.info("\n--- DATENSAMMLUNG ---")
-        all_dfs: List[pd.DataFrame] = []
-        if not tournament_configs:
+        if not all([query, start_date, end_date]):
             logger.warning(
-                "No tournament configurations found in config.TOURNAMENT_CONFIGS. Skipping data collection."
+                f"Skipping event '{event_name}' due to missing query, start_date, or end_date in config."
             )
+            continue
 
-        for event_key, event_params in tournament_configs.items():
-            event_name = event_params.get("event_name", event_key)
-            query = event_params.get("query")
-            start_date = event_params.get("start_date")
-            end_date = event_params.get("end_date")
-
-            if not all([query, start_date, end_date]):
-                logger.warning(
-                    f"Skipping event '{event_name}' due to missing query, start_date, or end_date in config."
-                )
-                continue
-
-            logger.info(f"\nCollecting data for {event_name} (Query: '{query}')...")
-            try:
+        logger.info(f"\nCollecting data for {event_name} (Query: '{query}')...")
+        try:
+            if comments_by_event is not None:
+                comments = comments_by_event.get(event_key, [])
+            else:
                 comments = get_posts_and_comments(
                     subreddit,
                     query=query,
@@ -157,192 +559,238 @@ def prepare_data() -> pd.DataFrame:
                     comment_limit=reddit_comment_limit,
                     max_posts_to_process=reddit_max_posts_to_process,
                 )
-                df = pd.DataFrame(comments)
-                if df.empty:
-                    logger.warning(
-                        f"No comments collected for {event_name}. Skipping further processing for this event."
-                    )
-                    continue
-                logger.info(
-                    f"Successfully collected {df.shape[0]} comments for {event_name}."
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error collecting data for {event_name}: {e}. Skipping this event."
-                )
-                continue
-
-            logger.info(f"--- Cleaning and Preprocessing for {event_name} ---")
-            df = initial_clean_dataframe(df.copy(), f"{event_name} Comments")
+            df = pd.DataFrame(comments)
             if df.empty:
                 logger.warning(
-                    f"DataFrame is empty after initial cleaning for {event_name}. Skipping further processing for this event."
+                    f"No comments collected for {event_name}. Skipping further processing for this event."
                 )
+                event_frames[event_key] = df
                 continue
+            logger.info(
+                f"Successfully collected {df.shape[0]} comments for {event_name}."
+            )
+            event_frames[event_key] = df
+        except Exception as e:
+            logger.error(
+                f"Error collecting data for {event_name}: {e}. Skipping this event."
+            )
+    return event_frames
 
-            if "comment_body" in df.columns:
-                df["processed_comment_body"] = df["comment_body"].apply(preprocess_text)
-            else:
-                logger.warning(
-                    f"'comment_body' column not found for {event_name}. Skipping text preprocessing."
-                )
-                df["processed_comment_body"] = ""
 
-            df = filter_deleted_and_empty_processed_comments(
-                df, f"{event_name} Comments"
-            )
-            if df.empty:
-                logger.warning(
-                    f"DataFrame is empty after filtering deleted/empty comments for {event_name}. Skipping further processing for this event."
-                )
-                continue
+def load_raw_event_frames(
+    tournament_configs: Dict[str, Dict[str, Any]], max_workers: Optional[int] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Replays previously scraped raw files from config.RAW_DATA_PATH instead of calling
+    Reddit. The raw file of each event is located by its query and date range and the
+    files are parsed in parallel worker processes.
 
-            logger.info("Performing sentiment analysis and calculating text length...")
-            if (
-                "processed_comment_body" in df.columns
-                and not df["processed_comment_body"].empty
-            ):
-                df["sentiment_scores"] = df["processed_comment_body"].apply(
-                    get_sentiment_scores
-                )
-                df["neg_sentiment"] = df["sentiment_scores"].apply(lambda x: x["neg"])
-                df["neu_sentiment"] = df["sentiment_scores"].apply(lambda x: x["neu"])
-                df["pos_sentiment"] = df["sentiment_scores"].apply(lambda x: x["pos"])
-                df["compound_sentiment"] = df["sentiment_scores"].apply(
-                    lambda x: x["compound"]
-                )
-            else:
-                logger.warning(
-                    f"No 'processed_comment_body' for sentiment analysis in {event_name}. Filling with NaNs."
-                )
-                df["sentiment_scores"] = None
-                df["neg_sentiment"] = np.nan
-                df["neu_sentiment"] = np.nan
-                df["pos_sentiment"] = np.nan
-                df["compound_sentiment"] = np.nan
-
-            if "comment_body" in df.columns:
-                df[["char_count", "word_count"]] = (
-                    df["comment_body"].apply(calculate_text_length).apply(pd.Series)
-                )
-            else:
-                logger.warning(
-                    f"No 'comment_body' for text length calculation in {event_name}. Filling with NaNs."
-                )
-                df["char_count"] = np.nan
-                df["word_count"] = np.nan
+    Args:
+        tournament_configs (Dict[str, Dict[str, Any]]): Event configurations as in
+                                                        config.TOURNAMENT_CONFIGS.
+        max_workers (Optional[int]): Number of worker processes. Defaults to
+                                     config.RAW_REPLAY_WORKERS.
 
-            # Time Period Marking and Time Difference
-            logger.info(
-                "Categorizing time periods and calculating days from event start..."
+    Returns:
+        Dict[str, pd.DataFrame]: The raw comments per event key. Events without a raw
+                                 file or without comments are left out.
+    """
+    if max_workers is None:
+        max_workers = getattr(config, "RAW_REPLAY_WORKERS", 1)
+
+    raw_files: Dict[str, str] = {}
+    for event_key, event_params in tournament_configs.items():
+        event_name = event_params.get("event_name", event_key)
+        query = event_params.get("query")
+        start_date = event_params.get("start_date")
+        end_date = event_params.get("end_date")
+        if not all([query, start_date, end_date]):
+            logger.warning(
+                f"Skipping event '{event_name}' due to missing query, start_date, or end_date in config."
+            )
+            continue
+        raw_file = find_raw_data_file(raw_data_basename(query, start_date, end_date))
+        if raw_file is None:
+            logger.warning(
+                f"No raw data file found for {event_name} in '{config.RAW_DATA_PATH}'. Skipping this event."
             )
+            continue
+        raw_files[event_key] = raw_file
 
-            if "comment_created_utc" in df.columns:
-
-                df["time_period"] = df.apply(
-                    lambda row: categorize_time_period(
-                        row["comment_created_utc"],
-                        event_params["start_date"],
-                        event_params["end_date"],
-                        event_params[
-                            "pre_event_start"
-                        ],  # Calculated start date of the pre-event window
-                        event_params[
-                            "post_event_end"
-                        ],  # Calculated end date of the post-event window
-                    ),
-                    axis=1,
-                )
+    if not raw_files:
+        return {}
 
-                df["days_from_event_start"] = df.apply(
-                    lambda row: calculate_days_from_event_start(
-                        row["comment_created_utc"], start_date
-                    ),
-                    axis=1,
+    logger.info(
+        f"Replaying {len(raw_files)} raw files with {min(max_workers, len(raw_files))} worker processes..."
+    )
+    event_frames: Dict[str, pd.DataFrame] = {}
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(max_workers, len(raw_files)))
+    ) as executor:
+        futures = {
+            event_key: executor.submit(load_raw_comments_frame, raw_file)
+            for event_key, raw_file in raw_files.items()
+        }
+        for event_key, future in futures.items():
+            event_name = tournament_configs[event_key].get("event_name", event_key)
+            try:
+                df = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Error reading raw data file '{raw_files[event_key]}' for {event_name}: {e}. Skipping this event."
                 )
-            else:
+                continue
+            if df.empty:
                 logger.warning(
-                    f"No 'comment_created_utc' for time period categorization in {event_name}. Filling with NaNs."
+                    f"Raw data file '{raw_files[event_key]}' for {event_name} contains no comments. Skipping this event."
                 )
-                df["time_period"] = "Unknown"
-                df["days_from_event_start"] = np.nan
-
-            # Feature Engineering
-            logger.info("--- Feature Engineering ---")
-            df = calculate_post_title_features(df.copy())
-            df["contains_question"] = df["comment_body"].apply(contains_question)
-            df["author_karma"] = (
-                0  # Placeholder: Implement actual karma fetching if needed
+                continue
+            logger.info(
+                f"Loaded {df.shape[0]} raw comments for {event_name} from '{raw_files[event_key]}'."
             )
+            event_frames[event_key] = df
+    return event_frames
 
-            dota2_teams = get_dota2_teams()
-            keywords_data = get_keywords()
-            player_keywords = keywords_data.get("player_keywords", [])
-            hero_keywords = keywords_data.get("hero_keywords", [])
-            tournament_event_keywords = keywords_data.get(
-                "tournament_event_keywords", []
-            )
 
-            if "comment_body" in df.columns:
-                df["contains_team_name"] = df["comment_body"].apply(
-                    lambda x: contains_any_keyword(x, dota2_teams)
-                )
-            else:
-                df["contains_team_name"] = False
+def prepare_data(
+    source: Optional[str] = None, use_stage_cache: Optional[bool] = None
+) -> pd.DataFrame:
+    """
+    Orchestrates the entire data preparation pipeline:
+    1. Checks for existing processed data in SQLite. Events already stored are not
+       collected again.
+    2. Collects the missing events from Reddit, or replays the raw files of all events
+       in config.RAW_DATA_PATH when the source is 'raw'. If Reddit cannot be reached,
+       the events already stored are returned.
+    3. Performs initial cleaning and preprocessing, one worker process per event
+       (see process_event_frames).
+    4. Extracts text features (sentiment, length).
+    5. Categorizes comments by time period relative to events.
+    6. Performs feature engineering (post title features, keyword presence, ratios, post type).
+    7. Combines data from all events.
+    8. Upserts the processed events into the SQLite database, leaving other events'
+       rows untouched.
+
+    Args:
+        source (Optional[str]): 'reddit' to scrape the events with no processed data, or
+                                'raw' to always rebuild the processed data from the raw
+                                files without network access.
+                                Defaults to config.DATA_SOURCE.
+        use_stage_cache (Optional[bool]): Reuse the cached outputs of processing stages
+                                whose inputs, code and settings are unchanged (see
+                                StageCache). Defaults to config.STAGE_CACHE_ENABLED.
 
-            if "processed_comment_body" in df.columns:
-                df["contains_player_keyword"] = df["processed_comment_body"].apply(
-                    lambda x: contains_any_keyword(x, player_keywords)
-                )
-                df["contains_hero_keyword"] = df["processed_comment_body"].apply(
-                    lambda x: contains_any_keyword(x, hero_keywords)
-                )
-                df["contains_event_keyword"] = df["processed_comment_body"].apply(
-                    lambda x: contains_any_keyword(x, tournament_event_keywords)
-                )
-            else:
-                df["contains_player_keyword"] = False
-                df["contains_hero_keyword"] = False
-                df["contains_event_keyword"] = False
-
-            # NEW: Categorize post type
-            df = categorize_post_type(
-                df.copy()
-            )  # Pass a copy to avoid SettingWithCopyWarning
-
-            # Handle potential division by zero for ratios
-            df["comment_to_post_score_ratio"] = df.apply(
-                lambda row: (
-                    row["comment_score"] / (row["post_score"] + 1)
-                    if pd.notna(row["post_score"]) and row["post_score"] != 0
-                    else row["comment_score"] if pd.notna(row["comment_score"]) else 0
-                ),
-                axis=1,
+    Returns:
+        pd.DataFrame: The combined and processed DataFrame. Returns an empty DataFrame
+                      if the pipeline fails or no data is collected/loaded.
+    """
+    logger.info("--- Starting Data Preparation Pipeline ---")
+
+    df_combined_cleaned = pd.DataFrame()
+    stored_events: Set[str] = set()
+
+    db_name = getattr(config, "DATABASE_NAME", "reddit_data.db")
+    tournament_configs = getattr(config, "TOURNAMENT_CONFIGS", {})
+    if source is None:
+        source = getattr(config, "DATA_SOURCE", "reddit")
+    if source not in ("reddit", "raw"):
+        logger.error(f"Unknown data source '{source}'. Use 'reddit' or 'raw'.")
+        return pd.DataFrame()
+    # One index over all configured event windows, shared by every event
+    interval_index = EventIntervalIndex(tournament_configs)
+
+    if source == "raw":
+        logger.info(
+            f"\nReplay mode: rebuilding processed data from raw files in '{config.RAW_DATA_PATH}'."
+        )
+    elif check_db_exists_and_has_data():
+        stored_events = get_stored_event_names()
+        missing_configs = {
+            event_key: event_params
+            for event_key, event_params in tournament_configs.items()
+            if event_params.get("event_name", event_key) not in stored_events
+        }
+        if not missing_configs:
+            logger.info(
+                f"\nProcessed data found in '{db_name}'. Loading data directly from database."
             )
-            df["comment_score_per_day"] = df.apply(
-                calculate_comment_score_per_day, axis=1
+            df_comments_loaded = load_data_from_sqlite()
+            if not df_comments_loaded.empty:
+                logger.info(f"Loaded {len(df_comments_loaded)} rows from database.")
+                logger.info("--- Data Preparation Pipeline Completed ---")
+                return df_comments_loaded
+            logger.warning(
+                "Database exists but returned an empty DataFrame. Proceeding with data collection."
+            )
+            stored_events = set()
+        else:
+            logger.info(
+                f"\nProcessed data found in '{db_name}' for {sorted(stored_events)}. "
+                f"Collecting only the missing events: {list(missing_configs)}."
             )
+            tournament_configs = missing_configs
+    else:
+        logger.info(
+            f"\nNo processed data found in '{db_name}'. Proceeding with data collection and processing."
+        )
 
-            df = add_event_name(df.copy(), event_name)
-            df = extract_time_features(df.copy())
+    logger.info("\n--- DATENSAMMLUNG ---")
+    if not tournament_configs:
+        logger.warning(
+            "No tournament configurations found in config.TOURNAMENT_CONFIGS. Skipping data collection."
+        )
 
-            all_dfs.append(df)
+    if source == "raw":
+        event_frames = load_raw_event_frames(tournament_configs)
+    else:
+        event_frames = collect_reddit_event_frames(tournament_configs)
+        if event_frames is None:
+            if stored_events:
+                logger.warning(
+                    f"Reddit is unavailable, so the missing events {list(tournament_configs)} "
+                    "were not collected. Returning the events stored in the database."
+                )
+                logger.info("--- Data Preparation Pipeline Completed ---")
+                return load_data_from_sqlite()
+            logger.info("--- Data Preparation Pipeline Aborted ---")
+            return pd.DataFrame()
+
+    # Events without comments are only recorded, so they are not collected again
+    empty_event_names = [
+        tournament_configs[event_key].get("event_name", event_key)
+        for event_key, df in event_frames.items()
+        if df.empty
+    ]
+    event_frames = {
+        event_key: df for event_key, df in event_frames.items() if not df.empty
+    }
+
+    all_dfs: List[pd.DataFrame] = []
+    stage_cache = StageCache(enabled=use_stage_cache)
+    if event_frames:
+        load_lemma_cache()
+        all_dfs = process_event_frames(
+            event_frames, tournament_configs, interval_index, stage_cache
+        )
+        save_lemma_cache()
+        stage_cache.log_stats()
 
-        # Data Storage
+    # Data Storage
+    if all_dfs or empty_event_names:
+        logger.info("\n--- Saving processed data to SQLite database ---")
         if all_dfs:
-            logger.info("\n--- Saving processed data to SQLite database ---")
             df_combined_cleaned = pd.concat(all_dfs, ignore_index=True)
 
-            # Remove 'sentiment_scores' column before saving, as SQLite cannot store dictionaries
-            if "sentiment_scores" in df_combined_cleaned.columns:
-                df_combined_cleaned.drop(columns=["sentiment_scores"], inplace=True)
+        upsert_data_to_sqlite(df_combined_cleaned, empty_event_names=empty_event_names)
+        logger.info("\n--- Data storage in SQLite complete ---")
 
-            save_data_to_sqlite(df_combined_cleaned)
-            logger.info("\n--- Data storage in SQLite complete ---")
-        else:
-            logger.warning(
-                "No DataFrames were collected or processed. Skipping SQLite save."
-            )
+        if stored_events:
+            # Only the missing events were processed; return every stored event
+            df_combined_cleaned = load_data_from_sqlite()
+    else:
+        logger.warning(
+            "No DataFrames were collected or processed. Skipping SQLite save."
+        )
 
     logger.info("--- Data Preparation Pipeline Completed ---")
     return df_combined_cleaned
@@ -373,8 +821,28 @@ if __name__ == "__main__":
         format="%(asctime)s - %(levelname)s - %(message)s",
         handlers=[file_handler, stream_handler],  # Use the configured handlers
     )
+    parser = argparse.ArgumentParser(description="Run the data preparation pipeline.")
+    parser.add_argument(
+        "--source",
+        choices=["reddit", "raw"],
+        default=None,
+        help="'raw' rebuilds the processed data from the raw files without Reddit credentials.",
+    )
+    parser.add_argument(
+        "--no-stage-cache",
+        action="store_true",
+        help="Recompute every processing stage instead of reusing cached stage outputs.",
+    )
+    args = parser.parse_args()
+
     logger.info("Running prepare_data.py as a standalone script...")
-    prepared_data = prepare_data()
+    try:
+        prepared_data = prepare_data(
+            source=args.source, use_stage_cache=False if args.no_stage_cache else None
+        )
+    except LookupError as e:
+        logger.error(f"{e} This data is critical for text processing. Exiting.")
+        sys.exit(1)
     if not prepared_data.empty:
         logger.info(
             f"Data preparation successful. Prepared DataFrame shape: {prepared_data.shape}"
@@ -2,8 +2,9 @@ import datetime
 import logging
 import os
 import sys
-from typing import Any, Union
+from typing import Any, Dict, List, Union
 
+import numpy as np
 import pandas as pd
 
 # Import the centralized configuration
@@ -241,3 +242,253 @@ def calculate_days_from_event_start(
         return None
 
     return (comment_date - event_start).days
+
+
+def _to_naive_datetime_series(timestamps: pd.Series) -> pd.Series:
+    """
+    Converts a Series of timestamps to tz-naive datetime64 values, accepting the same
+    inputs as categorize_time_period: UTC epoch seconds, date strings or datetimes.
+    Values that cannot be parsed become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        converted = timestamps
+    elif pd.api.types.is_numeric_dtype(timestamps):
+        converted = pd.to_datetime(timestamps, unit="s", errors="coerce")
+    else:
+        converted = pd.to_datetime(timestamps, errors="coerce", format="mixed")
+    if converted.dt.tz is not None:
+        converted = converted.dt.tz_convert("UTC").dt.tz_localize(None)
+    return converted
+
+
+def categorize_time_period_series(
+    comment_timestamps: pd.Series,
+    event_start_date: datetime.datetime,
+    event_end_date: datetime.datetime,
+    pre_event_start_date: datetime.datetime,
+    post_event_end_date: datetime.datetime,
+) -> pd.Series:
+    """
+    Vectorized version of categorize_time_period for a whole Series of timestamps.
+    Each timestamp is compared against the event boundaries in one pass with np.select
+    instead of calling the scalar function row by row; the boundaries are inclusive in
+    the same way ('During Event' includes both the start and the end date).
+
+    Args:
+        comment_timestamps (pd.Series): The creation timestamps of the comments, ideally
+                                        as datetime64. Epoch seconds and date strings are
+                                        converted first.
+        event_start_date (datetime.datetime): The official start date of the event.
+        event_end_date (datetime.datetime): The official end date of the event.
+        pre_event_start_date (datetime.datetime): The calculated start date of the 'Before Event' window.
+        post_event_end_date (datetime.datetime): The calculated end date of the 'After Event' window.
+
+    Returns:
+        pd.Series: The categorized time period of each comment, with the same index.
+                   Strings that cannot be parsed are labelled
+                   'Error: Invalid Timestamp Format'; missing timestamps fall in
+                   'Outside Window', as in the scalar function.
+    """
+    timestamps = _to_naive_datetime_series(comment_timestamps)
+    values = timestamps.to_numpy(dtype="datetime64[ns]")
+    start, end, pre_start, post_end = (
+        np.datetime64(pd.Timestamp(date), "ns")
+        for date in (
+            event_start_date,
+            event_end_date,
+            pre_event_start_date,
+            post_event_end_date,
+        )
+    )
+
+    periods = np.select(
+        [
+            (values >= start) & (values <= end),
+            (values >= pre_start) & (values < start),
+            (values > end) & (values <= post_end),
+        ],
+        ["During Event", "Before Event", "After Event"],
+        default="Outside Window",
+    ).astype(object)
+
+    unparsable = timestamps.isna().to_numpy() & comment_timestamps.notna().to_numpy()
+    periods[unparsable] = "Error: Invalid Timestamp Format"
+    return pd.Series(periods, index=comment_timestamps.index, name="time_period")
+
+
+def calculate_days_from_event_start_series(
+    comment_dates: pd.Series, event_start: datetime.datetime
+) -> pd.Series:
+    """
+    Vectorized version of calculate_days_from_event_start for a whole Series.
+    Like timedelta.days, the difference is floored, so a comment one hour before the
+    event start is on day -1.
+
+    Args:
+        comment_dates (pd.Series): The creation dates of the comments.
+        event_start (datetime.datetime): The start date of the event.
+
+    Returns:
+        pd.Series: The difference in days, as int64, or as float64 with NaN for missing
+                   or unparsable dates.
+    """
+    dates = _to_naive_datetime_series(comment_dates)
+    days = (dates - pd.Timestamp(event_start)) // pd.Timedelta(days=1)
+    if days.notna().all():
+        days = days.astype("int64")
+    return days.rename("days_from_event_start")
+
+
+# Time period labels by the codes used in EventIntervalIndex
+TIME_PERIOD_LABELS = ("Outside Window", "Before Event", "During Event", "After Event")
+
+
+class EventIntervalIndex:
+    """
+    Interval index over the time windows of several events, used to assign comments to
+    the event(s) and time period they fall into with one vectorized lookup.
+
+    Every event contributes the boundaries of its 'Before Event' [pre_event_start,
+    start_date), 'During Event' [start_date, end_date] and 'After Event' (end_date,
+    post_event_end] windows. All boundaries are merged into one sorted array, which
+    splits the time axis into segments whose period is constant for every event, and a
+    segment x event table holds the period codes (indices into TIME_PERIOD_LABELS).
+    A lookup is a single searchsorted over the boundaries plus a table gather, so it
+    costs the same for overlapping events (e.g. OG_RM24 and TOPSON_RM24) as for one.
+
+    Args:
+        tournament_configs (Dict[str, Dict[str, Any]]): Event configurations as in
+            config.TOURNAMENT_CONFIGS, enriched with 'pre_event_start' and
+            'post_event_end'. Events missing a date are skipped with a warning.
+    """
+
+    _REQUIRED_DATES = ("pre_event_start", "start_date", "end_date", "post_event_end")
+
+    def __init__(self, tournament_configs: Dict[str, Dict[str, Any]]) -> None:
+        self.event_keys: List[str] = []
+        self.event_names: List[str] = []
+        bounds = []
+        one_ns = np.timedelta64(1, "ns")
+        for event_key, event_params in tournament_configs.items():
+            if not all(event_params.get(date) for date in self._REQUIRED_DATES):
+                logger.warning(
+                    f"Event '{event_key}' is missing one of {self._REQUIRED_DATES}. It is not indexed."
+                )
+                continue
+            pre_start, start, end, post_end = (
+                np.datetime64(pd.Timestamp(event_params[date]), "ns")
+                for date in self._REQUIRED_DATES
+            )
+            # Half-open [lower, upper) boundaries for all three windows
+            bounds.append([pre_start, start, end + one_ns, post_end + one_ns])
+            self.event_keys.append(event_key)
+            self.event_names.append(event_params.get("event_name", event_key))
+
+        event_bounds = (
+            np.array(bounds, dtype="datetime64[ns]").reshape(-1, 4).view("i8")
+        )
+        self._event_starts = event_bounds[:, 1]
+        self._boundaries = np.unique(event_bounds)
+
+        # Segment i (1 <= i < len) is [boundaries[i - 1], boundaries[i]); segment 0 lies
+        # before all boundaries. The period is constant within a segment, so it can be
+        # evaluated at the segment's lower bound.
+        lower = np.concatenate([[np.iinfo(np.int64).min], self._boundaries])[
+            :, np.newaxis
+        ]
+        pre_start, start, end_exclusive, post_exclusive = event_bounds.T
+        self._codes = np.select(
+            [
+                (lower >= start) & (lower < end_exclusive),
+                (lower >= pre_start) & (lower < start),
+                (lower >= end_exclusive) & (lower < post_exclusive),
+            ],
+            [2, 1, 3],
+            default=0,
+        ).astype(np.int8)
+
+    def period_codes(self, timestamps: pd.Series) -> np.ndarray:
+        """
+        Returns the period code of every timestamp for every indexed event.
+
+        Args:
+            timestamps (pd.Series): Comment timestamps (see categorize_time_period_series).
+
+        Returns:
+            np.ndarray: An int8 array of shape (len(timestamps), number of events) with
+                        indices into TIME_PERIOD_LABELS. Missing timestamps are
+                        'Outside Window' for all events.
+        """
+        values = (
+            _to_naive_datetime_series(timestamps)
+            .to_numpy(dtype="datetime64[ns]")
+            .view("i8")
+        )
+        return self._codes[self._segments(values)]
+
+    def _segments(self, values: np.ndarray) -> np.ndarray:
+        """Returns the segment of each timestamp, given as int64 nanoseconds."""
+        # NaT is the smallest int64 and lands in segment 0, outside all windows
+        return np.searchsorted(self._boundaries, values, side="right")
+
+    def categorize(self, timestamps: pd.Series, event_key: str) -> pd.Series:
+        """
+        Returns the time period of every timestamp relative to one event, with the same
+        labels as categorize_time_period_series. Only that event's codes are gathered.
+
+        Args:
+            timestamps (pd.Series): Comment timestamps.
+            event_key (str): The key of the event in the tournament configurations.
+
+        Raises:
+            KeyError: If the event is not indexed.
+
+        Returns:
+            pd.Series: The time period labels, with the index of 'timestamps'.
+        """
+        if event_key not in self.event_keys:
+            raise KeyError(f"Event '{event_key}' is not in the interval index.")
+        converted = _to_naive_datetime_series(timestamps)
+        segments = self._segments(converted.to_numpy(dtype="datetime64[ns]").view("i8"))
+        codes = self._codes[segments, self.event_keys.index(event_key)]
+        periods = np.array(TIME_PERIOD_LABELS, dtype=object)[codes]
+        unparsable = converted.isna().to_numpy() & timestamps.notna().to_numpy()
+        periods[unparsable] = "Error: Invalid Timestamp Format"
+        return pd.Series(periods, index=timestamps.index, name="time_period")
+
+    def attribute(self, timestamps: pd.Series) -> pd.DataFrame:
+        """
+        Assigns every timestamp to all events whose window (pre-event to post-event)
+        contains it, in one pass over all events.
+
+        Args:
+            timestamps (pd.Series): Comment timestamps, e.g. the 'comment_created_utc'
+                                    column of a frame combining several events.
+
+        Returns:
+            pd.DataFrame: One row per (comment, event) match, indexed by the index of
+                          'timestamps', with the columns 'event_key', 'event_name',
+                          'time_period' and 'days_from_event_start'. Comments outside
+                          every window have no row; comments in overlapping windows
+                          have one row per event.
+        """
+        codes = self.period_codes(timestamps)
+        rows, events = np.nonzero(codes)
+        values = (
+            _to_naive_datetime_series(timestamps)
+            .to_numpy(dtype="datetime64[ns]")
+            .view("i8")
+        )
+        nanoseconds_per_day = 86_400 * 10**9
+        return pd.DataFrame(
+            {
+                "event_key": np.array(self.event_keys, dtype=object)[events],
+                "event_name": np.array(self.event_names, dtype=object)[events],
+                "time_period": np.array(TIME_PERIOD_LABELS, dtype=object)[
+                    codes[rows, events]
+                ],
+                "days_from_event_start": (values[rows] - self._event_starts[events])
+                // nanoseconds_per_day,
+            },
+            index=timestamps.index[rows],
+        )
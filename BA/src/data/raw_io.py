@@ -0,0 +1,276 @@
+import datetime
+import gzip
+import json
+import logging
+import os
+import sys
+from typing import IO, Any, Dict, Iterable, Iterator, Optional
+
+import pandas as pd
+
+# Import the centralized configuration
+project_root_for_import = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+if project_root_for_import not in sys.path:
+    sys.path.insert(0, project_root_for_import)
+
+import config
+
+# Get a logger instance for this module
+logger = logging.getLogger(__name__)
+
+# File extensions of the raw comment formats, by compression
+RAW_FILE_EXTENSIONS = {
+    None: ".jsonl",
+    "gzip": ".jsonl.gz",
+    "zstd": ".jsonl.zst",
+}
+DATETIME_RECORD_FIELDS = ("post_created_utc", "comment_created_utc")
+
+
+def serialize_comment_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns a copy of a comment record with datetime values converted to ISO strings.
+
+    Args:
+        record (Dict[str, Any]): A comment record as produced by the scraper.
+
+    Returns:
+        Dict[str, Any]: A JSON-serializable copy of the record.
+    """
+    serializable = record.copy()
+    for key, value in serializable.items():
+        if isinstance(value, datetime.datetime):
+            serializable[key] = value.isoformat()
+    return serializable
+
+
+def deserialize_comment_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts the datetime fields of a serialized comment record back to pandas Timestamps.
+
+    Args:
+        record (Dict[str, Any]): A record read from a raw file or checkpoint journal.
+
+    Returns:
+        Dict[str, Any]: The same record, with 'post_created_utc' and 'comment_created_utc'
+                        parsed.
+    """
+    for key in DATETIME_RECORD_FIELDS:
+        if isinstance(record.get(key), str):
+            record[key] = pd.to_datetime(record[key])
+    return record
+
+
+def compression_from_path(path: str) -> Optional[str]:
+    """Returns the compression implied by a file extension: 'gzip', 'zstd' or None."""
+    if path.endswith(".gz"):
+        return "gzip"
+    if path.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def open_raw_file(
+    path: str, mode: str = "r", compression: Optional[str] = None
+) -> IO[str]:
+    """
+    Opens a raw data file in text mode. Unless given, the compression is picked from the
+    file extension ('.gz' for gzip, '.zst' for zstd, anything else uncompressed).
+
+    Args:
+        path (str): The path of the file.
+        mode (str): 'r' to read or 'w' to write.
+        compression (Optional[str]): 'gzip', 'zstd' or None to detect from the path.
+
+    Raises:
+        ImportError: If a '.zst' file is opened and the optional 'zstandard' package
+                     is not installed.
+
+    Returns:
+        IO[str]: A text file object using UTF-8 encoding.
+    """
+    if compression is None:
+        compression = compression_from_path(path)
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "Reading or writing '.zst' raw files requires the 'zstandard' package."
+            ) from e
+        return zstandard.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RawCommentWriter:
+    """
+    Streams comment records to a compact newline-delimited JSON file as they are
+    produced. Records are written to '<path>.part' and the file is only renamed to its
+    final path when the writer is closed without an error, so readers never see a
+    half-written file. An empty file is discarded on close.
+
+    Use it as a context manager:
+
+        with RawCommentWriter(path) as writer:
+            writer.write_many(records)
+
+    Args:
+        path (str): The final path of the raw file. Its extension selects the compression.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.records_written = 0
+        self._part_path = f"{path}.part"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file: Optional[IO[str]] = open_raw_file(
+            self._part_path, "w", compression=compression_from_path(path)
+        )
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Serializes a single comment record as one JSON line."""
+        self._file.write(
+            json.dumps(
+                serialize_comment_record(record),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        )
+        self._file.write("\n")
+        self.records_written += 1
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Serializes several comment records, one JSON line each."""
+        for record in records:
+            self.write(record)
+
+    def close(self, commit: bool = True) -> bool:
+        """
+        Closes the file. With commit, the part file is moved to the final path; otherwise
+        (or if no records were written) it is deleted.
+
+        Returns:
+            bool: True if the final file was written.
+        """
+        if self._file is None:
+            return False
+        self._file.close()
+        self._file = None
+        if commit and self.records_written > 0:
+            os.replace(self._part_path, self.path)
+            return True
+        os.remove(self._part_path)
+        return False
+
+    def __enter__(self) -> "RawCommentWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(commit=exc_type is None)
+
+
+def raw_data_basename(
+    query: str, start_date: datetime.datetime, end_date: datetime.datetime
+) -> str:
+    """
+    Returns the file name stem of the raw data of one query and date range, shared by
+    the raw data file and its checkpoint journal.
+    """
+    return f"raw_reddit_comments_{query.replace(' ', '_').replace('/', '_')}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}"
+
+
+def raw_data_file_path(basename: str, compression: Optional[str] = None) -> str:
+    """
+    Builds the path of a raw data file in config.RAW_DATA_PATH.
+
+    Args:
+        basename (str): The file name without extension.
+        compression (Optional[str]): None, 'gzip' or 'zstd'.
+
+    Raises:
+        ValueError: If the compression is not supported.
+
+    Returns:
+        str: The full path of the raw file.
+    """
+    if compression not in RAW_FILE_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported raw data compression '{compression}'. Use one of {list(RAW_FILE_EXTENSIONS)}."
+        )
+    return os.path.join(
+        config.RAW_DATA_PATH, basename + RAW_FILE_EXTENSIONS[compression]
+    )
+
+
+def iter_raw_comments(path: str, parse_dates: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the comment records of a raw data file one at a time.
+    Newline-delimited files ('.jsonl', '.jsonl.gz', '.jsonl.zst') are streamed line by
+    line. Legacy '.json' files, which hold a single JSON list, are read in one go.
+
+    Args:
+        path (str): The path of the raw file.
+        parse_dates (bool): Convert the datetime fields to pandas Timestamps.
+
+    Yields:
+        Dict[str, Any]: One comment record per iteration.
+    """
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        for record in records:
+            yield deserialize_comment_record(record) if parse_dates else record
+        return
+
+    with open_raw_file(path, "r") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    f"Skipping malformed line {line_number} in raw file '{path}': {e}"
+                )
+                continue
+            yield deserialize_comment_record(record) if parse_dates else record
+
+
+def find_raw_data_file(basename: str) -> Optional[str]:
+    """
+    Finds the raw data file for a file name stem in config.RAW_DATA_PATH, in any of the
+    supported formats including legacy '.json'. If several exist, the most recently
+    modified one wins.
+
+    Args:
+        basename (str): The file name stem, as returned by raw_data_basename.
+
+    Returns:
+        Optional[str]: The path of the raw file, or None if there is none.
+    """
+    candidates = [
+        os.path.join(config.RAW_DATA_PATH, basename + extension)
+        for extension in list(RAW_FILE_EXTENSIONS.values()) + [".json"]
+    ]
+    existing = [path for path in candidates if os.path.exists(path)]
+    if not existing:
+        return None
+    return max(existing, key=os.path.getmtime)
+
+
+def load_raw_comments_frame(path: str) -> pd.DataFrame:
+    """
+    Loads a raw data file into a DataFrame with the same columns and types as the
+    DataFrame built from freshly scraped comments.
+
+    Args:
+        path (str): The path of the raw file.
+
+    Returns:
+        pd.DataFrame: One row per comment record.
+    """
+    return pd.DataFrame(iter_raw_comments(path))
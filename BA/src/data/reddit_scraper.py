@@ -1,12 +1,19 @@
+import asyncio
 import datetime
+import hashlib
 import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 import praw
+import prawcore
 from dotenv import load_dotenv
 from praw.models import Comment, Submission, Subreddit
 from tenacity import (
@@ -25,14 +32,101 @@ if project_root_for_import not in sys.path:
     sys.path.insert(0, project_root_for_import)
 
 import config
+from BA.src.data.raw_io import (
+    RawCommentWriter,
+    deserialize_comment_record,
+    raw_data_basename,
+    raw_data_file_path,
+    serialize_comment_record,
+)
 
 # Get a logger instance for this module
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket used to keep concurrent Reddit API requests below a
+    requests-per-minute budget. PRAW still honours Reddit's rate limit headers on
+    its own; this bucket only keeps our worker pool from bursting past it.
+
+    Args:
+        rate_per_minute (float): Number of tokens added to the bucket per minute.
+        capacity (int): Maximum number of tokens the bucket can hold (burst size).
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 1) -> None:
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive.")
+        self.rate_per_minute = rate_per_minute
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        Takes `tokens` from the bucket if available.
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the number of seconds to
+                   wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.rate_per_minute / 60.0
+            )
+            self._last_refill = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) * 60.0 / self.rate_per_minute
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Blocks the calling thread until `tokens` are available."""
+        wait = self._reserve(tokens)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._reserve(tokens)
+
+
+_rate_limiter: Optional[TokenBucket] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def _get_rate_limiter() -> TokenBucket:
+    """
+    Returns the process-wide token bucket shared by every scraping call,
+    creating it from config.REDDIT_REQUESTS_PER_MINUTE on first use.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = TokenBucket(
+                getattr(config, "REDDIT_REQUESTS_PER_MINUTE", 60),
+                getattr(config, "REDDIT_RATE_LIMIT_BURST", 5),
+            )
+    return _rate_limiter
+
+
+class RateLimitedRequestor(prawcore.Requestor):
+    """
+    prawcore requestor that takes one token from the shared rate limiter for every HTTP
+    request. A single PRAW call can issue several requests (one per listing page, one
+    per replace_more batch, token refreshes and retries), and each one is charged.
+    """
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        _get_rate_limiter().acquire()
+        return super().request(*args, **kwargs)
+
+
 def get_reddit_instance() -> praw.Reddit:
     """
     Initializes and returns a PRAW Reddit instance using credentials from .env file.
+    Every HTTP request of the instance draws from the shared rate limiter.
 
     Raises:
         ValueError: If Reddit API credentials (client ID, client secret, user agent)
@@ -66,6 +160,7 @@ def get_reddit_instance() -> praw.Reddit:
         client_id=REDDIT_CLIENT_ID,
         client_secret=REDDIT_CLIENT_SECRET,
         user_agent=REDDIT_USER_AGENT,
+        requestor_class=RateLimitedRequestor,
         # username=os.getenv('REDDIT_USERNAME'), # Uncomment if user auth is needed
         # password=os.getenv('REDDIT_PASSWORD')  # Uncomment if user auth is needed
     )
@@ -73,6 +168,62 @@ def get_reddit_instance() -> praw.Reddit:
     return reddit
 
 
+# --- Per-thread Reddit instances ---
+# PRAW is not thread-safe: a Reddit instance must not be used by several threads at
+# once. Worker threads therefore fetch through their own clone of the caller's instance,
+# built from the same credentials.
+
+_REDDIT_CLONE_SETTINGS = (
+    "client_id",
+    "client_secret",
+    "user_agent",
+    "username",
+    "password",
+    "refresh_token",
+    "redirect_uri",
+    "oauth_url",
+    "reddit_url",
+)
+_thread_local = threading.local()
+
+
+def _clone_reddit_instance(reddit: praw.Reddit) -> praw.Reddit:
+    """
+    Creates a new Reddit instance with the credentials, endpoints and requestor class of
+    an existing one. The clone has its own HTTP session and access token.
+
+    Args:
+        reddit (praw.Reddit): The instance to clone.
+
+    Returns:
+        praw.Reddit: An independent instance using the same credentials.
+    """
+    settings = {
+        name: getattr(reddit.config, name)
+        for name in _REDDIT_CLONE_SETTINGS
+        if getattr(reddit.config, name) is not praw.config.Config.CONFIG_NOT_SET
+    }
+    return praw.Reddit(
+        requestor_class=type(reddit._core._requestor),
+        check_for_updates=False,
+        **settings,
+    )
+
+
+def _get_thread_reddit(reddit: praw.Reddit) -> praw.Reddit:
+    """
+    Returns the calling thread's own clone of a Reddit instance, creating it on first
+    use. Each worker thread reuses its clone for all the requests it makes.
+    """
+    clones = getattr(_thread_local, "reddit_clones", None)
+    if clones is None:
+        clones = _thread_local.reddit_clones = {}
+    entry = clones.get(id(reddit))
+    if entry is None or entry[0] is not reddit:
+        entry = clones[id(reddit)] = (reddit, _clone_reddit_instance(reddit))
+    return entry[1]
+
+
 @retry(
     wait=wait_exponential(multiplier=1, min=4, max=10),
     stop=stop_after_attempt(5),
@@ -158,6 +309,576 @@ def _get_submission_comments(submission: Submission) -> List[Comment]:
     return list(submission.comments.list())
 
 
+# --- Listing cache ---
+# The top listing does not depend on the query, so it is downloaded once per run and
+# shared by every event. Listings are persisted with the submission fields the
+# scraper reads, and are turned back into lazy PRAW Submission objects on reuse.
+
+_LISTING_SUBMISSION_FIELDS = (
+    "id",
+    "title",
+    "url",
+    "created_utc",
+    "score",
+    "num_comments",
+    "upvote_ratio",
+    "is_self",
+    "selftext",
+    "link_flair_text",
+    "permalink",
+)
+
+# Listings fetched or loaded in this process: key -> (fetched_at, submissions)
+_listing_memory_cache: Dict[str, Tuple[float, List[Submission]]] = {}
+_listing_key_locks: Dict[str, threading.Lock] = {}
+_listing_locks_guard = threading.Lock()
+
+
+def _listing_cache_key(
+    subreddit_name: str,
+    listing_type: str,
+    time_filter: str,
+    limit: int,
+    query: Optional[str] = None,
+) -> str:
+    """Builds a filesystem-safe cache key for a listing."""
+    key = f"{listing_type}_{subreddit_name}_{time_filter}_{limit}".lower()
+    if query is not None:
+        query_hash = hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+        key = f"{key}_{query_hash}"
+    return key
+
+
+def _submission_to_cache_record(submission: Submission) -> Dict[str, Any]:
+    """Extracts the fields needed by the scraper from a submission."""
+    record = {field: getattr(submission, field) for field in _LISTING_SUBMISSION_FIELDS}
+    record["author"] = submission.author.name if submission.author else "[deleted]"
+    return record
+
+
+def _load_listing_from_disk(
+    subreddit_obj: Subreddit, cache_path: str, ttl_seconds: float
+) -> Optional[Tuple[float, List[Submission]]]:
+    """
+    Loads a cached listing from disk if it exists and is younger than ttl_seconds.
+
+    Returns:
+        Optional[Tuple[float, List[praw.models.Submission]]]: The time the listing was
+            fetched and the cached submissions, or None on a miss.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable listing cache '{cache_path}': {e}")
+        return None
+
+    fetched_at = cached.get("fetched_at", 0)
+    age = time.time() - fetched_at
+    if age > ttl_seconds:
+        logger.info(
+            f"Listing cache '{cache_path}' is {age / 3600:.1f}h old (TTL {ttl_seconds / 3600:.1f}h). Refetching."
+        )
+        return None
+
+    reddit = subreddit_obj._reddit
+    return fetched_at, [
+        Submission(reddit, _data=dict(record))
+        for record in cached.get("submissions", [])
+    ]
+
+
+def _save_listing_to_disk(cache_path: str, submissions: List[Submission]) -> None:
+    """Writes a listing to the on-disk cache. Failures are logged, not raised."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        payload = {
+            "fetched_at": time.time(),
+            "submissions": [_submission_to_cache_record(s) for s in submissions],
+        }
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write listing cache '{cache_path}': {e}")
+
+
+def _get_cached_listing(
+    subreddit_obj: Subreddit,
+    listing_type: str,
+    limit: int,
+    time_filter: str,
+    query: Optional[str] = None,
+    thread_local_reddit: bool = False,
+) -> List[Submission]:
+    """
+    Returns a subreddit listing ('top' or 'search'), served from the in-process cache,
+    then from the on-disk cache in config.REDDIT_LISTING_CACHE_DIR, and only fetched from
+    Reddit if both miss. Both caches expire after config.REDDIT_LISTING_CACHE_TTL_SECONDS;
+    without a positive TTL, only the in-process cache is used and it does not expire.
+    Concurrent callers asking for the same listing wait for a single fetch instead of
+    each downloading it. Worker threads must pass thread_local_reddit, so the listing is
+    fetched through the thread's own Reddit instance.
+
+    Args:
+        subreddit_obj (praw.models.Subreddit): The PRAW Subreddit object.
+        listing_type (str): Either 'top' or 'search'.
+        limit (int): The maximum number of submissions to return.
+        time_filter (str): The time period of the listing (e.g., 'all', 'year').
+        query (Optional[str]): The search query; required for 'search' listings.
+        thread_local_reddit (bool): Fetch through the calling thread's own clone of the
+                                    subreddit's Reddit instance.
+
+    Returns:
+        List[praw.models.Submission]: The listing's submissions.
+    """
+    key = _listing_cache_key(
+        subreddit_obj.display_name, listing_type, time_filter, limit, query
+    )
+    with _listing_locks_guard:
+        key_lock = _listing_key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        cache_dir = getattr(config, "REDDIT_LISTING_CACHE_DIR", None)
+        ttl_seconds = getattr(config, "REDDIT_LISTING_CACHE_TTL_SECONDS", 0)
+        cache_path = os.path.join(cache_dir, f"{key}.json") if cache_dir else None
+
+        if key in _listing_memory_cache:
+            fetched_at, submissions = _listing_memory_cache[key]
+            age = time.time() - fetched_at
+            if ttl_seconds <= 0 or age <= ttl_seconds:
+                logger.info(f"  - Reusing cached '{listing_type}' listing ({key}).")
+                return submissions
+            logger.info(
+                f"  - Cached '{listing_type}' listing ({key}) is {age / 3600:.1f}h old (TTL {ttl_seconds / 3600:.1f}h). Refetching."
+            )
+
+        submissions = None
+        fetched_at = time.time()
+        if cache_path and ttl_seconds > 0:
+            cached_listing = _load_listing_from_disk(
+                subreddit_obj, cache_path, ttl_seconds
+            )
+            if cached_listing is not None:
+                fetched_at, submissions = cached_listing
+                logger.info(
+                    f"  - Loaded '{listing_type}' listing with {len(submissions)} posts from cache '{cache_path}'."
+                )
+
+        if submissions is None:
+            if thread_local_reddit:
+                subreddit_obj = _get_thread_reddit(subreddit_obj._reddit).subreddit(
+                    subreddit_obj.display_name
+                )
+            if listing_type == "search":
+                submissions = _get_subreddit_search_results(
+                    subreddit_obj, query, limit, time_filter
+                )
+            elif listing_type == "top":
+                submissions = _get_subreddit_top_results(
+                    subreddit_obj, limit, time_filter
+                )
+            else:
+                raise ValueError(f"Unsupported listing type: '{listing_type}'.")
+            if cache_path and ttl_seconds > 0:
+                _save_listing_to_disk(cache_path, submissions)
+
+        _listing_memory_cache[key] = (fetched_at, submissions)
+        return submissions
+
+
+def clear_listing_cache(remove_files: bool = False) -> None:
+    """
+    Empties the in-process listing cache. With remove_files, the on-disk cache in
+    config.REDDIT_LISTING_CACHE_DIR is deleted as well.
+    """
+    with _listing_locks_guard:
+        _listing_memory_cache.clear()
+    cache_dir = getattr(config, "REDDIT_LISTING_CACHE_DIR", None)
+    if remove_files and cache_dir and os.path.isdir(cache_dir):
+        for file_name in os.listdir(cache_dir):
+            if file_name.endswith(".json"):
+                os.remove(os.path.join(cache_dir, file_name))
+        logger.info(f"Removed listing cache files from '{cache_dir}'.")
+
+
+# --- Checkpoint journal ---
+# Every completed submission is appended to a JSONL journal next to the raw data, so
+# an interrupted run can resume without refetching the submissions it already has.
+
+
+class CheckpointJournal:
+    """
+    Append-only JSONL journal of completed submissions for one query and date range.
+    Each line holds a submission ID and its serialized comment records. Appends are
+    flushed and fsynced, and are safe to call from worker threads.
+
+    Args:
+        path (str): The path of the journal file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Reads the journal. A truncated last line (from a crash mid-write) is ignored.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Comment records per completed submission ID.
+        """
+        completed: Dict[str, List[Dict[str, Any]]] = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Skipping unreadable line {line_number} in checkpoint journal '{self.path}'."
+                    )
+                    continue
+                completed[entry["post_id"]] = [
+                    deserialize_comment_record(r) for r in entry.get("comments", [])
+                ]
+        return completed
+
+    def append(self, post_id: str, records: List[Dict[str, Any]]) -> None:
+        """Records one completed submission together with its comment records."""
+        line = json.dumps(
+            {
+                "post_id": post_id,
+                "completed_at": datetime.datetime.now().isoformat(),
+                "comments": [serialize_comment_record(r) for r in records],
+            },
+            ensure_ascii=False,
+        )
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def remove(self) -> None:
+        """Deletes the journal file, e.g. once the raw data has been saved."""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def _open_checkpoint(
+    query: str,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    resume: Optional[bool],
+) -> Tuple[Optional[CheckpointJournal], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Opens the checkpoint journal for a query and, in resume mode, loads the submissions
+    it already holds. Without resume, an existing journal is discarded.
+
+    Returns:
+        Tuple[Optional[CheckpointJournal], Dict[str, List[Dict[str, Any]]]]: The journal
+            (None if config.RAW_DATA_PATH is not set) and the already completed submissions.
+    """
+    if not getattr(config, "RAW_DATA_PATH", None):
+        return None, {}
+    if resume is None:
+        resume = getattr(config, "REDDIT_RESUME_FROM_CHECKPOINT", True)
+
+    journal = CheckpointJournal(
+        os.path.join(
+            config.RAW_DATA_PATH,
+            f"{raw_data_basename(query, start_date, end_date)}.checkpoint.jsonl",
+        )
+    )
+    if not resume:
+        journal.remove()
+        return journal, {}
+
+    completed = journal.load()
+    if completed:
+        logger.info(
+            f"Resuming '{query}' from checkpoint '{journal.path}': {len(completed)} submissions already collected."
+        )
+    return journal, completed
+
+
+def _build_comment_record(submission: Submission, comment: Comment) -> Dict[str, Any]:
+    """
+    Flattens a comment and its parent submission into the raw record schema.
+
+    Args:
+        submission (praw.models.Submission): The submission the comment belongs to.
+        comment (praw.models.Comment): The comment to convert.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the post and comment fields.
+    """
+    # Safely get author name, handling deleted authors
+    post_author_name = submission.author.name if submission.author else "[deleted]"
+    comment_author_name = comment.author.name if comment.author else "[deleted]"
+
+    return {
+        "post_id": submission.id,
+        "post_title": submission.title,
+        "post_url": submission.url,
+        "post_author": post_author_name,
+        "post_created_utc": pd.to_datetime(submission.created_utc, unit="s"),
+        "post_score": submission.score,
+        "post_num_comments": submission.num_comments,
+        "upvote_ratio": submission.upvote_ratio,
+        "is_self": submission.is_self,
+        "selftext": (submission.selftext if submission.is_self else ""),
+        "link_flair_text": submission.link_flair_text,
+        "permalink": submission.permalink,
+        "comment_id": comment.id,
+        "comment_body": comment.body,
+        "comment_author": comment_author_name,
+        "comment_created_utc": pd.to_datetime(comment.created_utc, unit="s"),
+        "comment_score": comment.score,
+        "comment_permalink": comment.permalink,
+    }
+
+
+def _fetch_submission_comment_records(
+    submission: Submission,
+    index: int,
+    total: int,
+    comment_limit: int,
+    journal: Optional[CheckpointJournal] = None,
+    thread_local_reddit: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Fetches the comment tree of one submission and returns its top comments as records.
+    API errors are logged and result in an empty list, so one failing submission
+    does not abort the whole collection. Successfully fetched submissions are appended
+    to the checkpoint journal, if given. Worker threads must pass thread_local_reddit,
+    so the comment tree is fetched through the thread's own Reddit instance.
+
+    Args:
+        submission (praw.models.Submission): The submission to fetch comments for.
+        index (int): Position of the submission in the processing list (for logging).
+        total (int): Total number of submissions being processed (for logging).
+        comment_limit (int): Maximum number of most upvoted comments to keep.
+        journal (Optional[CheckpointJournal]): Journal to record the completed submission in.
+        thread_local_reddit (bool): Fetch through the calling thread's own clone of the
+                                    submission's Reddit instance. The post fields of the
+                                    records are still read from the given submission.
+
+    Returns:
+        List[Dict[str, Any]]: The comment records for this submission.
+    """
+    logger.info(
+        f"  Processing comments for post {index+1}/{total} (ID: {submission.id}, Score: {submission.score}, Title: '{submission.title[:50]}...')..."
+    )
+    try:
+        comment_source = submission
+        if thread_local_reddit:
+            comment_source = Submission(
+                _get_thread_reddit(submission._reddit), id=submission.id
+            )
+        all_comments_for_post = _get_submission_comments(comment_source)
+
+        logger.info(
+            f"    Found {len(all_comments_for_post)} comments (including replies) for post '{submission.id}'."
+        )
+
+        # Filter out MoreComments objects that might remain if limit was too low or due to PRAW behavior
+        actual_comments = [c for c in all_comments_for_post if isinstance(c, Comment)]
+
+        sorted_comments = sorted(actual_comments, key=lambda c: c.score, reverse=True)[
+            :comment_limit
+        ]
+        records = [_build_comment_record(submission, c) for c in sorted_comments]
+        if journal is not None:
+            journal.append(submission.id, records)
+        return records
+    except (
+        praw.exceptions.APIException,
+        praw.exceptions.RedditAPIException,
+        praw.exceptions.ClientException,
+    ) as e:
+        logger.error(
+            f"    Reddit API error fetching comments for post '{submission.id}': {e}"
+        )
+    except Exception as e:
+        logger.error(
+            f"    An unexpected error occurred fetching comments for post '{submission.id}': {e}"
+        )
+    return []
+
+
+def _validate_search_arguments(
+    subreddit_obj: Subreddit,
+    query: str,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+) -> bool:
+    """
+    Validates the arguments shared by the synchronous and asynchronous scrapers.
+    Logs the reason and returns False if the search should be skipped.
+    """
+    if not isinstance(subreddit_obj, Subreddit):
+        logger.error(
+            "Invalid subreddit_obj provided. Must be a praw.models.Subreddit instance."
+        )
+        return False
+    if not isinstance(query, str) or not query.strip():
+        logger.error("Query must be a non-empty string. Skipping.")
+        return False
+    if not isinstance(start_date, datetime.datetime) or not isinstance(
+        end_date, datetime.datetime
+    ):
+        logger.error("start_date and end_date must be datetime objects. Skipping.")
+        return False
+    if start_date > end_date:
+        logger.warning("start_date is after end_date. No posts will be found.")
+        return False
+    return True
+
+
+def _select_submissions(
+    combined_results: List[Submission],
+    query: str,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    max_posts_to_process: int,
+) -> List[Submission]:
+    """
+    Filters listing results to the date range, removes duplicates and returns the
+    highest-scoring submissions, limited to max_posts_to_process.
+
+    Args:
+        combined_results (List[praw.models.Submission]): Search and top listing results.
+        query (str): The search query (for logging).
+        start_date (datetime.datetime): The start date for filtering posts (inclusive).
+        end_date (datetime.datetime): The end date for filtering posts (inclusive).
+        max_posts_to_process (int): Maximum number of submissions to return.
+
+    Returns:
+        List[praw.models.Submission]: The submissions to process comments from.
+    """
+    all_submissions_dict: Dict[str, Submission] = (
+        {}
+    )  # Use a dict to store unique submissions by ID
+    for sub in combined_results:
+        # Filter by date range immediately
+        submission_date = datetime.datetime.fromtimestamp(sub.created_utc)
+        if start_date <= submission_date <= end_date:
+            all_submissions_dict[sub.id] = sub
+
+    # Convert dict to list, sort by score, and take only max_posts_to_process
+    all_submissions_list = sorted(
+        all_submissions_dict.values(), key=lambda sub: sub.score, reverse=True
+    )
+
+    # Limit the number of posts we actually process comments from
+    submissions_to_process = all_submissions_list[:max_posts_to_process]
+
+    logger.info(
+        f"Found {len(all_submissions_dict)} unique submissions for '{query}' within the date range."
+    )
+    logger.info(
+        f"Processing comments from the top {len(submissions_to_process)} highest-scoring submissions (max {max_posts_to_process})..."
+    )
+    return submissions_to_process
+
+
+def _open_raw_writer(
+    query: str, start_date: datetime.datetime, end_date: datetime.datetime
+) -> Optional[RawCommentWriter]:
+    """
+    Opens a streaming writer for the raw comments of one query in config.RAW_DATA_PATH,
+    compressed according to config.RAW_DATA_COMPRESSION.
+
+    Returns:
+        Optional[RawCommentWriter]: The writer, or None if raw data cannot be saved.
+    """
+    # Ensure RAW_DATA_PATH exists from config
+    if not hasattr(config, "RAW_DATA_PATH") or not config.RAW_DATA_PATH:
+        logger.error(
+            "config.RAW_DATA_PATH is not defined or is empty. Cannot save raw data."
+        )
+        return None
+
+    try:
+        raw_data_filepath = raw_data_file_path(
+            raw_data_basename(query, start_date, end_date),
+            getattr(config, "RAW_DATA_COMPRESSION", None),
+        )
+        return RawCommentWriter(raw_data_filepath)
+    except Exception as e:
+        logger.error(f"Error opening raw data file for '{query}': {e}")
+        return None
+
+
+def _finish_raw_writer(
+    writer: Optional[RawCommentWriter],
+    journal: Optional[CheckpointJournal],
+    query: str,
+) -> None:
+    """
+    Commits the raw data file of a completed collection and removes its checkpoint
+    journal, also when no comments were collected. The journal is only kept if the raw
+    file could not be saved, since it then holds the only copy of the records.
+    """
+    if writer is None:
+        return
+    try:
+        if writer.close():
+            logger.info(
+                f"Raw collected comments ({writer.records_written}) saved to: {writer.path}"
+            )
+        else:
+            logger.info(f"No comments collected for '{query}', skipping raw data save.")
+    except Exception as e:
+        logger.error(f"Error saving raw comments to '{writer.path}': {e}")
+        return
+    if journal is not None:
+        journal.remove()
+
+
+def _stream_submission_records(
+    submissions: List[Submission],
+    journaled_records: Dict[str, List[Dict[str, Any]]],
+    fetched_records: Iterator[List[Dict[str, Any]]],
+    writer: Optional[RawCommentWriter],
+) -> List[Dict[str, Any]]:
+    """
+    Walks the processed submissions in order, taking each submission's records from the
+    checkpoint journal or else from the next fetched result, and streams them to the raw
+    writer as soon as they are available.
+
+    Args:
+        submissions (List[praw.models.Submission]): All submissions being processed, in order.
+        journaled_records (Dict[str, List[Dict[str, Any]]]): Records of submissions already
+                                                             completed in an earlier run.
+        fetched_records (Iterator[List[Dict[str, Any]]]): Records of the remaining
+                                                          submissions, in order.
+        writer (Optional[RawCommentWriter]): The raw data writer, if raw data is saved.
+
+    Returns:
+        List[Dict[str, Any]]: The collected comment records in submission order.
+    """
+    collected_comments: List[Dict[str, Any]] = []
+    for submission in submissions:
+        records = journaled_records.get(submission.id)
+        if records is None:
+            records = next(fetched_records)
+        if writer is not None:
+            writer.write_many(records)
+        collected_comments.extend(records)
+    return collected_comments
+
+
 def get_posts_and_comments(
     subreddit_obj: Subreddit,
     query: str,
@@ -166,12 +887,21 @@ def get_posts_and_comments(
     post_limit: int = 1000,
     comment_limit: int = 50,
     max_posts_to_process: int = 15,
+    max_workers: Optional[int] = None,
+    resume: Optional[bool] = None,
 ) -> List[Dict[str, Any]]:
     """
     Fetches posts based on a query within a specific date range and extracts top comments.
-    Combines results from search and top listings for better coverage.
-    Limits the number of posts from which comments are actually processed.
-    Also saves the raw collected comments to a JSON file.
+    Combines results from search and top listings for better coverage. Both listings go
+    through the listing cache, so the query-independent top listing is only downloaded
+    once per run and then filtered locally by date for each event.
+    Limits the number of posts from which comments are actually processed; their comment
+    trees can be fetched by a bounded pool of worker threads sharing one rate limiter,
+    each fetching through its own Reddit instance.
+    Every completed submission is appended to a checkpoint journal in config.RAW_DATA_PATH.
+    The raw collected comments are streamed, in submission order, to a newline-delimited
+    JSON file (compressed per config.RAW_DATA_COMPRESSION); the journal is removed once
+    that file is complete.
 
     Args:
         subreddit_obj (praw.models.Subreddit): The PRAW Subreddit object.
@@ -182,6 +912,12 @@ def get_posts_and_comments(
         comment_limit (int): Maximum number of top-level, most upvoted comments per post.
         max_posts_to_process (int): Maximum number of unique posts to process comments from.
                                     These will be the highest-scoring posts found.
+        max_workers (Optional[int]): Number of submissions whose comment trees are fetched
+                                     concurrently. Defaults to config.REDDIT_COMMENT_FETCH_WORKERS;
+                                     1 processes submissions one after another.
+        resume (Optional[bool]): Skip submissions already recorded in the checkpoint journal
+                                 of an interrupted run. Defaults to
+                                 config.REDDIT_RESUME_FROM_CHECKPOINT.
 
     Returns:
         List[Dict[str, Any]]: A list of dictionaries, where each dictionary represents a comment
@@ -190,50 +926,31 @@ def get_posts_and_comments(
     logger.info(
         f"\nSearching for posts with query: '{query}' from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}..."
     )
-    collected_comments: List[Dict[str, Any]] = []
 
-    if not isinstance(subreddit_obj, Subreddit):
-        logger.error(
-            "Invalid subreddit_obj provided. Must be a praw.models.Subreddit instance."
-        )
-        return []
-    if not isinstance(query, str) or not query.strip():
-        logger.error("Query must be a non-empty string. Skipping.")
-        return []
-    if not isinstance(start_date, datetime.datetime) or not isinstance(
-        end_date, datetime.datetime
-    ):
-        logger.error("start_date and end_date must be datetime objects. Skipping.")
-        return []
-    if start_date > end_date:
-        logger.warning("start_date is after end_date. No posts will be found.")
+    if not _validate_search_arguments(subreddit_obj, query, start_date, end_date):
         return []
 
-    all_submissions_dict: Dict[str, Submission] = (
-        {}
-    )  # Use a dict to store unique submissions by ID
     try:
         # Attempt to get posts from various sources
         logger.info(f"Fetching posts via search for query: '{query}'...")
-        search_results = _get_subreddit_search_results(
-            subreddit_obj, query, post_limit, "all"
+        search_results = _get_cached_listing(
+            subreddit_obj, "search", post_limit, "all", query=query
         )
         logger.info(f"  - Found {len(search_results)} posts via search for '{query}'.")
 
         logger.info(
             f"Fetching top posts from subreddit: '{subreddit_obj.display_name}'..."
         )
-        top_results = _get_subreddit_top_results(subreddit_obj, post_limit, "year")
+        top_results = _get_cached_listing(subreddit_obj, "top", post_limit, "year")
         logger.info(f"  - Found {len(top_results)} posts via top (time_filter='year').")
 
-        combined_results = search_results + top_results
-
-        for sub in combined_results:
-            # Filter by date range immediately
-            submission_date = datetime.datetime.fromtimestamp(sub.created_utc)
-            if start_date <= submission_date <= end_date:
-                all_submissions_dict[sub.id] = sub
-
+        submissions_to_process = _select_submissions(
+            search_results + top_results,
+            query,
+            start_date,
+            end_date,
+            max_posts_to_process,
+        )
     except (
         praw.exceptions.APIException,
         praw.exceptions.RedditAPIException,
@@ -247,20 +964,176 @@ def get_posts_and_comments(
         )
         return []
 
-    # Convert dict to list, sort by score, and take only max_posts_to_process
-    all_submissions_list = sorted(
-        all_submissions_dict.values(), key=lambda sub: sub.score, reverse=True
-    )
+    if not submissions_to_process:
+        logger.info(
+            f"No submissions found for '{query}' within the specified date range. Skipping comment collection."
+        )
+        return []
 
-    # Limit the number of posts we actually process comments from
-    submissions_to_process = all_submissions_list[:max_posts_to_process]
+    journal, journaled_records = _open_checkpoint(query, start_date, end_date, resume)
+    pending_submissions = [
+        sub for sub in submissions_to_process if sub.id not in journaled_records
+    ]
+    if len(pending_submissions) < len(submissions_to_process):
+        logger.info(
+            f"Skipping {len(submissions_to_process) - len(pending_submissions)} submissions already in the checkpoint journal."
+        )
+
+    total = len(pending_submissions)
+    if max_workers is None:
+        max_workers = getattr(config, "REDDIT_COMMENT_FETCH_WORKERS", 1)
+    max_workers = max(1, min(int(max_workers), max(total, 1)))
+
+    # Raw records are streamed to disk per submission, in submission order
+    writer = _open_raw_writer(query, start_date, end_date)
+    try:
+        if max_workers == 1:
+            collected_comments = _stream_submission_records(
+                submissions_to_process,
+                journaled_records,
+                (
+                    _fetch_submission_comment_records(
+                        submission, i, total, comment_limit, journal
+                    )
+                    for i, submission in enumerate(pending_submissions)
+                ),
+                writer,
+            )
+        else:
+            logger.info(
+                f"Fetching comment trees with {max_workers} concurrent workers (rate limit: {_get_rate_limiter().rate_per_minute:.0f} requests/minute)..."
+            )
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="reddit-comments"
+            ) as executor:
+                # executor.map yields results in submission order
+                collected_comments = _stream_submission_records(
+                    submissions_to_process,
+                    journaled_records,
+                    executor.map(
+                        _fetch_submission_comment_records,
+                        pending_submissions,
+                        range(total),
+                        repeat(total),
+                        repeat(comment_limit),
+                        repeat(journal),
+                        repeat(True),
+                    ),
+                    writer,
+                )
+    except BaseException:
+        # Keep the journal, drop the partial raw file
+        if writer is not None:
+            writer.close(commit=False)
+        raise
 
     logger.info(
-        f"Found {len(all_submissions_dict)} unique submissions for '{query}' within the date range."
+        f"Successfully collected {len(collected_comments)} comments for query: '{query}'."
     )
+    _finish_raw_writer(writer, journal, query)
+
+    return collected_comments
+
+
+# --- Asynchronous scraping engine ---
+# PRAW is synchronous, so each coroutine hands the existing retrying helpers to a
+# worker thread, which fetches through its own Reddit instance. All requests still draw
+# from the shared token bucket above, which lets every configured event be collected
+# concurrently in a single event loop.
+
+
+async def async_get_posts_and_comments(
+    subreddit_obj: Subreddit,
+    query: str,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    post_limit: int = 1000,
+    comment_limit: int = 50,
+    max_posts_to_process: int = 15,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    resume: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Coroutine counterpart of get_posts_and_comments with the same output schema.
+    The search and top listings are requested concurrently, followed by the comment
+    trees of all selected submissions. The records of each submission are streamed to
+    the raw data file as soon as its comment tree arrives, so the file follows the
+    completion order; the returned records keep the submission order.
+
+    Args:
+        subreddit_obj (praw.models.Subreddit): The PRAW Subreddit object.
+        query (str): The search query for posts.
+        start_date (datetime.datetime): The start date for filtering posts (inclusive).
+        end_date (datetime.datetime): The end date for filtering posts (inclusive).
+        post_limit (int): Maximum number of posts to fetch from Reddit's API for each method.
+        comment_limit (int): Maximum number of most upvoted comments per post.
+        max_posts_to_process (int): Maximum number of unique posts to process comments from.
+        semaphore (Optional[asyncio.Semaphore]): Bounds the number of API calls in flight.
+                                                 Share one semaphore across events to bound
+                                                 the whole run.
+        resume (Optional[bool]): Skip submissions already in the checkpoint journal.
+                                 Defaults to config.REDDIT_RESUME_FROM_CHECKPOINT.
+
+    Returns:
+        List[Dict[str, Any]]: A list of comment records, as returned by get_posts_and_comments.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(
+            getattr(config, "REDDIT_COMMENT_FETCH_WORKERS", 1)
+        )
+
+    async def _run(func, *args, **kwargs):
+        async with semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
     logger.info(
-        f"Processing comments from the top {len(submissions_to_process)} highest-scoring submissions (max {max_posts_to_process})..."
+        f"\n[async] Searching for posts with query: '{query}' from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}..."
     )
+    if not _validate_search_arguments(subreddit_obj, query, start_date, end_date):
+        return []
+
+    try:
+        search_results, top_results = await asyncio.gather(
+            _run(
+                _get_cached_listing,
+                subreddit_obj,
+                "search",
+                post_limit,
+                "all",
+                query,
+                thread_local_reddit=True,
+            ),
+            _run(
+                _get_cached_listing,
+                subreddit_obj,
+                "top",
+                post_limit,
+                "year",
+                thread_local_reddit=True,
+            ),
+        )
+        logger.info(
+            f"  - Found {len(search_results)} posts via search and {len(top_results)} via top for '{query}'."
+        )
+        submissions_to_process = _select_submissions(
+            search_results + top_results,
+            query,
+            start_date,
+            end_date,
+            max_posts_to_process,
+        )
+    except (
+        praw.exceptions.APIException,
+        praw.exceptions.RedditAPIException,
+        praw.exceptions.ClientException,
+    ) as e:
+        logger.error(f"Reddit API error during post search for '{query}': {e}")
+        return []
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during post search for '{query}': {e}"
+        )
+        return []
 
     if not submissions_to_process:
         logger.info(
@@ -268,115 +1141,147 @@ def get_posts_and_comments(
         )
         return []
 
-    for i, submission in enumerate(submissions_to_process):
-        logger.info(
-            f"  Processing comments for post {i+1}/{len(submissions_to_process)} (ID: {submission.id}, Score: {submission.score}, Title: '{submission.title[:50]}...')..."
+    journal, journaled_records = _open_checkpoint(query, start_date, end_date, resume)
+    pending_submissions = [
+        sub for sub in submissions_to_process if sub.id not in journaled_records
+    ]
+    total = len(pending_submissions)
+
+    async def _fetch(index: int, submission: Submission):
+        records = await _run(
+            _fetch_submission_comment_records,
+            submission,
+            index,
+            total,
+            comment_limit,
+            journal,
+            thread_local_reddit=True,
         )
-        try:
-            all_comments_for_post = _get_submission_comments(submission)
+        return submission.id, records
 
-            logger.info(
-                f"    Found {len(all_comments_for_post)} comments (including replies) for this post."
-            )
+    records_by_post_id = {
+        sub.id: journaled_records[sub.id]
+        for sub in submissions_to_process
+        if sub.id in journaled_records
+    }
+    writer = _open_raw_writer(query, start_date, end_date)
+    tasks: List[asyncio.Task] = []
+    try:
+        if writer is not None:
+            for records in records_by_post_id.values():
+                writer.write_many(records)
+        tasks = [
+            asyncio.ensure_future(_fetch(i, sub))
+            for i, sub in enumerate(pending_submissions)
+        ]
+        for next_completed in asyncio.as_completed(tasks):
+            post_id, records = await next_completed
+            if writer is not None:
+                writer.write_many(records)
+            records_by_post_id[post_id] = records
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        if writer is not None:
+            writer.close(commit=False)
+        raise
 
-            # Filter out MoreComments objects that might remain if limit was too low or due to PRAW behavior
-            actual_comments = [
-                c for c in all_comments_for_post if isinstance(c, Comment)
-            ]
+    collected_comments = [
+        record
+        for sub in submissions_to_process
+        for record in records_by_post_id.get(sub.id, [])
+    ]
+    logger.info(
+        f"Successfully collected {len(collected_comments)} comments for query: '{query}'."
+    )
+    _finish_raw_writer(writer, journal, query)
+    return collected_comments
 
-            sorted_comments = sorted(
-                actual_comments, key=lambda c: c.score, reverse=True
-            )[:comment_limit]
 
-            if sorted_comments:
-                for comment in sorted_comments:
-                    # Safely get author name, handling deleted authors
-                    post_author_name = (
-                        submission.author.name if submission.author else "[deleted]"
-                    )
-                    comment_author_name = (
-                        comment.author.name if comment.author else "[deleted]"
-                    )
+async def async_collect_all_events(
+    subreddit_obj: Subreddit,
+    tournament_configs: Dict[str, Dict[str, Any]],
+    post_limit: int = 1000,
+    comment_limit: int = 50,
+    max_posts_to_process: int = 15,
+    max_concurrency: Optional[int] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Collects the comments of every configured event concurrently in one event loop.
 
-                    collected_comments.append(
-                        {
-                            "post_id": submission.id,
-                            "post_title": submission.title,
-                            "post_url": submission.url,
-                            "post_author": post_author_name,
-                            "post_created_utc": pd.to_datetime(
-                                submission.created_utc, unit="s"
-                            ),
-                            "post_score": submission.score,
-                            "post_num_comments": submission.num_comments,
-                            "upvote_ratio": submission.upvote_ratio,
-                            "is_self": submission.is_self,
-                            "selftext": (
-                                submission.selftext if submission.is_self else ""
-                            ),
-                            "link_flair_text": submission.link_flair_text,
-                            "permalink": submission.permalink,
-                            "comment_id": comment.id,
-                            "comment_body": comment.body,
-                            "comment_author": comment_author_name,
-                            "comment_created_utc": pd.to_datetime(
-                                comment.created_utc, unit="s"
-                            ),
-                            "comment_score": comment.score,
-                            "comment_permalink": comment.permalink,
-                        }
-                    )
-        except (
-            praw.exceptions.APIException,
-            praw.exceptions.RedditAPIException,
-            praw.exceptions.ClientException,
-        ) as e:
-            logger.error(
-                f"    Reddit API error fetching comments for post '{submission.id}': {e}"
+    Args:
+        subreddit_obj (praw.models.Subreddit): The PRAW Subreddit object.
+        tournament_configs (Dict[str, Dict[str, Any]]): Event configurations as in
+                                                        config.TOURNAMENT_CONFIGS.
+        post_limit (int): Maximum number of posts to fetch for each listing.
+        comment_limit (int): Maximum number of most upvoted comments per post.
+        max_posts_to_process (int): Maximum number of posts to process per event.
+        max_concurrency (Optional[int]): Maximum number of API calls in flight across all
+                                         events. Defaults to config.REDDIT_COMMENT_FETCH_WORKERS.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: The comment records per event key. Events with
+                                         missing query or dates are left out.
+    """
+    if max_concurrency is None:
+        max_concurrency = getattr(config, "REDDIT_COMMENT_FETCH_WORKERS", 1)
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    event_keys: List[str] = []
+    coroutines = []
+    for event_key, event_params in tournament_configs.items():
+        query = event_params.get("query")
+        start_date = event_params.get("start_date")
+        end_date = event_params.get("end_date")
+        if not all([query, start_date, end_date]):
+            logger.warning(
+                f"Skipping event '{event_key}' due to missing query, start_date, or end_date in config."
             )
             continue
-        except Exception as e:
-            logger.error(
-                f"    An unexpected error occurred fetching comments for post '{submission.id}': {e}"
+        event_keys.append(event_key)
+        coroutines.append(
+            async_get_posts_and_comments(
+                subreddit_obj,
+                query=query,
+                start_date=start_date,
+                end_date=end_date,
+                post_limit=post_limit,
+                comment_limit=comment_limit,
+                max_posts_to_process=max_posts_to_process,
+                semaphore=semaphore,
             )
-            continue
+        )
 
-    logger.info(
-        f"Successfully collected {len(collected_comments)} comments for query: '{query}'."
-    )
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    collected: Dict[str, List[Dict[str, Any]]] = {}
+    for event_key, result in zip(event_keys, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Error collecting data for {event_key}: {result}")
+            collected[event_key] = []
+        else:
+            collected[event_key] = result
+    return collected
 
-    # Save raw collected comments to JSON file
-    if collected_comments:
-        # Ensure RAW_DATA_PATH exists from config
-        if not hasattr(config, "RAW_DATA_PATH") or not config.RAW_DATA_PATH:
-            logger.error(
-                "config.RAW_DATA_PATH is not defined or is empty. Cannot save raw data."
-            )
-            return collected_comments
-
-        os.makedirs(config.RAW_DATA_PATH, exist_ok=True)
-
-        raw_data_filename = f"raw_reddit_comments_{query.replace(' ', '_').replace('/', '_')}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.json"
-        raw_data_filepath = os.path.join(config.RAW_DATA_PATH, raw_data_filename)
-
-        try:
-            # Convert datetime objects to string for JSON serialization
-            serializable_comments = []
-            for comment_dict in collected_comments:
-                serializable_comment = comment_dict.copy()
-                for key, value in serializable_comment.items():
-                    if isinstance(value, datetime.datetime):
-                        serializable_comment[key] = value.isoformat()
-                serializable_comments.append(serializable_comment)
-
-            with open(raw_data_filepath, "w", encoding="utf-8") as f:
-                json.dump(serializable_comments, f, ensure_ascii=False, indent=4)
-            logger.info(f"Raw collected comments saved to: {raw_data_filepath}")
-        except Exception as e:
-            logger.error(
-                f"Error saving raw comments to JSON at '{raw_data_filepath}': {e}"
-            )
-    else:
-        logger.info(f"No comments collected for '{query}', skipping raw data save.")
 
-    return collected_comments
+def collect_all_events(
+    subreddit_obj: Subreddit,
+    tournament_configs: Dict[str, Dict[str, Any]],
+    post_limit: int = 1000,
+    comment_limit: int = 50,
+    max_posts_to_process: int = 15,
+    max_concurrency: Optional[int] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Synchronous entry point that runs async_collect_all_events in a fresh event loop.
+    See async_collect_all_events for the arguments.
+    """
+    return asyncio.run(
+        async_collect_all_events(
+            subreddit_obj,
+            tournament_configs,
+            post_limit=post_limit,
+            comment_limit=comment_limit,
+            max_posts_to_process=max_posts_to_process,
+            max_concurrency=max_concurrency,
+        )
+    )
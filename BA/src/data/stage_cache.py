@@ -0,0 +1,344 @@
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+import pandas as pd
+
+# Import the centralized configuration
+project_root_for_import = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+if project_root_for_import not in sys.path:
+    sys.path.insert(0, project_root_for_import)
+
+import config
+
+# Get a logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Bumped when the layout of the cached files changes, invalidating every entry
+STAGE_CACHE_FORMAT_VERSION = 1
+
+
+def hash_frame(
+    df: pd.DataFrame, columns: Optional[Sequence[str]] = None
+) -> Optional[str]:
+    """
+    Returns a content hash of (some columns of) a DataFrame: column names, dtypes, row
+    order and values, but not the index.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to hash.
+        columns (Optional[Sequence[str]]): The columns to hash. Defaults to all.
+
+    Returns:
+        Optional[str]: A hex digest, or None if a column holds unhashable values.
+    """
+    frame = df if columns is None else df[list(columns)]
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        json.dumps(
+            [
+                [str(c) for c in frame.columns],
+                [str(t) for t in frame.dtypes],
+                len(frame),
+            ]
+        ).encode("utf-8")
+    )
+    try:
+        row_hashes = pd.util.hash_pandas_object(frame, index=False)
+    except TypeError as e:
+        logger.debug(f"Cannot hash columns {list(frame.columns)}: {e}")
+        return None
+    digest.update(row_hashes.to_numpy().tobytes())
+    # Object columns hash missing values like their string form, so add the null mask
+    digest.update(frame.isna().to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def hash_settings(settings: Any) -> str:
+    """Returns a hex digest of JSON-like settings (dicts, lists, dates are stringified)."""
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def hash_source(code: Iterable[Any]) -> str:
+    """
+    Returns a hex digest of the source files defining the given modules or functions,
+    used as the code version of a stage: editing one of the files invalidates it.
+
+    Args:
+        code (Iterable[Any]): Modules, classes or functions.
+
+    Returns:
+        str: A hex digest of the source file contents.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(
+        {inspect.getsourcefile(inspect.unwrap(obj)) or "" for obj in code}
+    ):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class StageCache:
+    """
+    Content-addressed cache of the outputs of the prepare_data stages.
+    An entry is keyed by the stage name, a hash of the stage's input data, the hash of
+    the source files implementing it and a hash of the settings it depends on, so a
+    stage is recomputed exactly when one of those changes. Entries are pickled
+    DataFrames in '<directory>/<stage>/<key>.pkl'. Each stage keeps at most
+    max_entries_per_stage entries: storing a new one deletes the least recently used.
+
+    Args:
+        directory (Optional[str]): The cache directory. Defaults to config.STAGE_CACHE_DIR.
+        enabled (Optional[bool]): Use the cache at all. Defaults to
+                                  config.STAGE_CACHE_ENABLED. A disabled cache only
+                                  runs the stages.
+        max_entries_per_stage (Optional[int]): Entries kept per stage, 0 for no limit.
+                                               Defaults to
+                                               config.STAGE_CACHE_MAX_ENTRIES_PER_STAGE.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        max_entries_per_stage: Optional[int] = None,
+    ) -> None:
+        self.directory = directory or getattr(
+            config,
+            "STAGE_CACHE_DIR",
+            os.path.join(config.DATA_DIR, "cache", "stages"),
+        )
+        self.enabled = (
+            getattr(config, "STAGE_CACHE_ENABLED", True) if enabled is None else enabled
+        )
+        self.max_entries_per_stage = (
+            getattr(config, "STAGE_CACHE_MAX_ENTRIES_PER_STAGE", 64)
+            if max_entries_per_stage is None
+            else max_entries_per_stage
+        )
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _entry_path(self, stage: str, key: str) -> str:
+        return os.path.join(self.directory, stage, f"{key}.pkl")
+
+    def _key(
+        self, stage: str, input_hash: str, code: Iterable[Any], settings: Any
+    ) -> str:
+        return hash_settings(
+            [
+                STAGE_CACHE_FORMAT_VERSION,
+                stage,
+                input_hash,
+                hash_source(code),
+                hash_settings(settings),
+            ]
+        )
+
+    def _count(self, stage: str, outcome: str, count: int = 1) -> None:
+        counts = self.stats.setdefault(stage, {"hits": 0, "misses": 0})
+        counts[outcome] += count
+
+    def _load(self, stage: str, key: str) -> Optional[pd.DataFrame]:
+        path = self._entry_path(stage, key)
+        if not os.path.exists(path):
+            return None
+        try:
+            frame = pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable stage cache entry '{path}': {e}")
+            return None
+        try:
+            # The modification time marks when an entry was last used, for prune
+            os.utime(path)
+        except OSError:
+            pass
+        return frame
+
+    def _store(self, stage: str, key: str, frame: pd.DataFrame) -> None:
+        path = self._entry_path(stage, key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            frame.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write stage cache entry '{path}': {e}")
+            return
+        self.prune(stage)
+
+    def run(
+        self,
+        stage: str,
+        df: pd.DataFrame,
+        input_columns: Sequence[str],
+        output_columns: Sequence[str],
+        compute: Callable[[pd.DataFrame], pd.DataFrame],
+        code: Iterable[Any] = (),
+        settings: Any = None,
+    ) -> pd.DataFrame:
+        """
+        Adds the output columns of a stage to a DataFrame, from the cache if the stage
+        already ran on the same input columns with the same code and settings.
+
+        Args:
+            stage (str): The stage name, also the cache subdirectory.
+            df (pd.DataFrame): The DataFrame the columns are added to.
+            input_columns (Sequence[str]): The only columns the stage reads.
+            output_columns (Sequence[str]): The columns the stage produces.
+            compute (Callable[[pd.DataFrame], pd.DataFrame]): Computes the output columns
+                from df, aligned with its index.
+            code (Iterable[Any]): Modules or functions whose source files make up the
+                                  stage's code version.
+            settings (Any): JSON-like configuration the stage depends on.
+
+        Returns:
+            pd.DataFrame: df with the output columns set.
+        """
+        output_columns = list(output_columns)
+        input_hash = hash_frame(df, input_columns) if self.enabled else None
+        key = self._key(stage, input_hash, code, settings) if input_hash else None
+
+        outputs = self._load(stage, key) if key else None
+        if (
+            outputs is not None
+            and list(outputs.columns) == output_columns
+            and len(outputs) == len(df)
+        ):
+            self._count(stage, "hits")
+            logger.info(f"Stage '{stage}': loaded {len(df)} rows from the cache.")
+            outputs.index = df.index
+        else:
+            outputs = compute(df)[output_columns]
+            if key:
+                self._count(stage, "misses")
+                self._store(stage, key, outputs.reset_index(drop=True))
+
+        for column in output_columns:
+            df[column] = outputs[column]
+        return df
+
+    def run_frame(
+        self,
+        stage: str,
+        df: pd.DataFrame,
+        compute: Callable[[pd.DataFrame], pd.DataFrame],
+        code: Iterable[Any] = (),
+        settings: Any = None,
+    ) -> pd.DataFrame:
+        """
+        Runs a stage that reads and returns a whole DataFrame, e.g. one dropping rows,
+        from the cache if it already ran on the same data with the same code and settings.
+
+        Args:
+            stage (str): The stage name, also the cache subdirectory.
+            df (pd.DataFrame): The input DataFrame.
+            compute (Callable[[pd.DataFrame], pd.DataFrame]): The stage itself.
+            code (Iterable[Any]): Modules or functions whose source files make up the
+                                  stage's code version.
+            settings (Any): JSON-like configuration the stage depends on.
+
+        Returns:
+            pd.DataFrame: The stage's output DataFrame.
+        """
+        input_hash = hash_frame(df) if self.enabled else None
+        key = self._key(stage, input_hash, code, settings) if input_hash else None
+
+        output = self._load(stage, key) if key else None
+        if output is not None:
+            self._count(stage, "hits")
+            logger.info(f"Stage '{stage}': loaded {len(output)} rows from the cache.")
+            return output
+
+        output = compute(df)
+        if key:
+            self._count(stage, "misses")
+            self._store(stage, key, output)
+        return output
+
+    def merge_stats(self, stats: Dict[str, Dict[str, int]]) -> None:
+        """Adds the hits and misses counted by a copy of this cache, e.g. in a worker."""
+        for stage, counts in stats.items():
+            for outcome, count in counts.items():
+                self._count(stage, outcome, count)
+
+    def log_stats(self) -> None:
+        """Logs the hits and misses of each stage since this cache was created."""
+        for stage, counts in self.stats.items():
+            logger.info(
+                f"Stage cache '{stage}': {counts['hits']} hits, {counts['misses']} misses."
+            )
+
+    def prune(
+        self, stage: Optional[str] = None, max_entries: Optional[int] = None
+    ) -> int:
+        """
+        Deletes the least recently used entries of one stage, or of each stage, beyond
+        a maximum number of entries.
+
+        Args:
+            stage (Optional[str]): The stage to prune. Defaults to all stages.
+            max_entries (Optional[int]): Entries kept per stage, 0 for no limit.
+                                         Defaults to max_entries_per_stage.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        if max_entries is None:
+            max_entries = self.max_entries_per_stage
+        if not max_entries or max_entries <= 0:
+            return 0
+        if stage is None:
+            if not os.path.isdir(self.directory):
+                return 0
+            stages = sorted(
+                name
+                for name in os.listdir(self.directory)
+                if os.path.isdir(os.path.join(self.directory, name))
+            )
+        else:
+            stages = [stage]
+
+        removed = 0
+        for name in stages:
+            stage_dir = os.path.join(self.directory, name)
+            try:
+                entries = [
+                    entry
+                    for entry in os.scandir(stage_dir)
+                    if entry.is_file() and entry.name.endswith(".pkl")
+                ]
+                entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+            except OSError:
+                continue
+            for entry in entries[max_entries:]:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError as e:
+                    logger.warning(
+                        f"Could not delete stage cache entry '{entry.path}': {e}"
+                    )
+        if removed:
+            logger.info(f"Pruned {removed} least recently used stage cache entries.")
+        return removed
+
+    def clear(self, stage: Optional[str] = None) -> None:
+        """
+        Deletes the cached entries of one stage, or of all stages.
+
+        Args:
+            stage (Optional[str]): The stage to clear. Defaults to all stages.
+        """
+        path = self.directory if stage is None else os.path.join(self.directory, stage)
+        shutil.rmtree(path, ignore_errors=True)
@@ -3,8 +3,10 @@ import logging
 import os
 import re  # Import re for regex operations
 import sys
-from typing import Any, List, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 # Import the centralized configuration
@@ -15,14 +17,31 @@ if project_root_for_import not in sys.path:
     sys.path.insert(0, project_root_for_import)
 
 import config
-from BA.src.features.text_features import (
-    contains_any_keyword,  # Import contains_any_keyword (for other uses)
+from BA.src.features.text_features import (  # Import contains_any_keyword (for other uses)
+    contains_any_keyword,
+    get_keyword_tagger,
 )
-from BA.src.utils.config_loader import get_keywords  # Import get_keywords
+from BA.src.utils.config_loader import get_dota2_teams, get_keywords
 
 # Get a logger instance for this module
 logger = logging.getLogger(__name__)
 
+# Keyword categories tagged in comments: (source text column, flag column, count column)
+KEYWORD_CATEGORY_COLUMNS = {
+    "team": ("comment_body", "contains_team_name", "team_keyword_count"),
+    "player": (
+        "processed_comment_body",
+        "contains_player_keyword",
+        "player_keyword_count",
+    ),
+    "hero": ("processed_comment_body", "contains_hero_keyword", "hero_keyword_count"),
+    "event": (
+        "processed_comment_body",
+        "contains_event_keyword",
+        "event_keyword_count",
+    ),
+}
+
 
 def calculate_post_title_features(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -39,8 +58,14 @@ def calculate_post_title_features(df: pd.DataFrame) -> pd.DataFrame:
 
     df["post_title"] = df["post_title"].astype(str).fillna("")
 
-    df["post_title_length"] = df["post_title"].apply(len)
-    df["post_title_word_count"] = df["post_title"].apply(lambda x: len(x.split()))
+    # Titles repeat for every comment of a post, so each distinct title is measured once
+    title_codes, unique_titles = pd.factorize(df["post_title"])
+    title_lengths = np.array([len(title) for title in unique_titles], dtype=np.int64)
+    title_word_counts = np.array(
+        [len(title.split()) for title in unique_titles], dtype=np.int64
+    )
+    df["post_title_length"] = title_lengths[title_codes]
+    df["post_title_word_count"] = title_word_counts[title_codes]
     logger.info("Calculated 'post_title_length' and 'post_title_word_count'.")
     return df
 
@@ -85,6 +110,151 @@ def calculate_comment_score_per_day(row: pd.Series) -> Union[float, int]:
         return comment_score
 
 
+def calculate_comment_score_per_day_series(df: pd.DataFrame) -> pd.Series:
+    """
+    Column-wise version of calculate_comment_score_per_day for a whole DataFrame.
+    Uses datetime64 subtraction and np.where instead of a row-wise apply, with the same
+    edge cases: if the comment is not newer than the post, or a timestamp is missing,
+    the original comment score is returned. Columns that are not datetime64 are handled
+    by the row-wise function.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'comment_created_utc', 'post_created_utc' and
+                           'comment_score' columns.
+
+    Returns:
+        pd.Series: The comment score per day since post creation, as float64. All zeros
+                   if a required column is missing.
+    """
+    required_cols = ["comment_created_utc", "post_created_utc", "comment_score"]
+    if not all(col in df.columns for col in required_cols):
+        logger.warning(
+            "Missing 'comment_created_utc', 'post_created_utc', or 'comment_score' column. Cannot calculate comment score per day."
+        )
+        return pd.Series(0, index=df.index, name="comment_score_per_day")
+
+    comment_time = df["comment_created_utc"]
+    post_time = df["post_created_utc"]
+    if not (
+        pd.api.types.is_datetime64_any_dtype(comment_time)
+        and pd.api.types.is_datetime64_any_dtype(post_time)
+    ):
+        logger.debug(
+            "Timestamp columns are not datetime64. Falling back to the row-wise comment score per day."
+        )
+        return df.apply(calculate_comment_score_per_day, axis=1).rename(
+            "comment_score_per_day"
+        )
+
+    comment_score = df["comment_score"].to_numpy(dtype=float)
+    # Same arithmetic as timedelta.total_seconds() / (24 * 3600); NaT gives NaN
+    seconds = (comment_time - post_time).dt.total_seconds().to_numpy()
+    days = seconds / (24 * 3600)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score_per_day = np.where(days > 0, comment_score / days, comment_score)
+    return pd.Series(score_per_day, index=df.index, name="comment_score_per_day")
+
+
+def calculate_comment_to_post_score_ratio(row: pd.Series) -> Union[float, int]:
+    """
+    Calculates 'comment_to_post_score_ratio' as comment_score / (post_score + 1).
+    If the post score is missing or zero, returns the comment score (0 if that is missing).
+    """
+    return (
+        row["comment_score"] / (row["post_score"] + 1)
+        if pd.notna(row["post_score"]) and row["post_score"] != 0
+        else row["comment_score"] if pd.notna(row["comment_score"]) else 0
+    )
+
+
+def calculate_comment_to_post_score_ratio_series(df: pd.DataFrame) -> pd.Series:
+    """
+    Column-wise version of calculate_comment_to_post_score_ratio for a whole DataFrame,
+    with the same edge cases: a missing or zero post score gives the comment score, and
+    a missing comment score then gives 0. A post score of -1 gives an infinite ratio
+    instead of raising ZeroDivisionError.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'comment_score' and 'post_score' columns.
+
+    Returns:
+        pd.Series: The comment to post score ratio, as float64.
+    """
+    comment_score = df["comment_score"].to_numpy(dtype=float)
+    post_score = df["post_score"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(
+            ~np.isnan(post_score) & (post_score != 0),
+            comment_score / (post_score + 1),
+            np.nan_to_num(comment_score, nan=0.0),
+        )
+    return pd.Series(ratio, index=df.index, name="comment_to_post_score_ratio")
+
+
+def _load_keyword_categories() -> Dict[str, List[str]]:
+    """Returns the keyword list of each category of KEYWORD_CATEGORY_COLUMNS."""
+    keywords_data = get_keywords()
+    return {
+        "team": get_dota2_teams(),
+        "player": keywords_data.get("player_keywords", []),
+        "hero": keywords_data.get("hero_keywords", []),
+        "event": keywords_data.get("tournament_event_keywords", []),
+    }
+
+
+def add_keyword_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tags comments with team, player, hero and event keywords in one pass per source
+    column: team names are searched in 'comment_body', the other categories in
+    'processed_comment_body'. Adds per category a boolean flag and the number of
+    distinct matched keywords (see KEYWORD_CATEGORY_COLUMNS), plus 'matched_keywords',
+    the distinct matched terms joined by config.MATCHED_KEYWORDS_SEPARATOR.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame containing the comment text columns.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the keyword columns added. Categories whose
+                      source column is missing get False and 0.
+    """
+    separator = getattr(config, "MATCHED_KEYWORDS_SEPARATOR", "|")
+    keyword_categories = _load_keyword_categories()
+
+    categories_by_source: Dict[str, List[str]] = {}
+    for category, (source_col, _, _) in KEYWORD_CATEGORY_COLUMNS.items():
+        categories_by_source.setdefault(source_col, []).append(category)
+
+    matched_keywords = pd.Series([[] for _ in range(len(df))], index=df.index)
+    for source_col, categories in categories_by_source.items():
+        if source_col not in df.columns:
+            logger.warning(
+                f"Column '{source_col}' not found. Keyword categories {categories} are set to False."
+            )
+            for category in categories:
+                _, flag_col, count_col = KEYWORD_CATEGORY_COLUMNS[category]
+                df[flag_col] = False
+                df[count_col] = 0
+            continue
+
+        tagger = get_keyword_tagger(
+            tuple(
+                (category, tuple(keyword_categories[category]))
+                for category in categories
+            )
+        )
+        tags = tagger.tag_series(df[source_col])
+        for category in categories:
+            _, flag_col, count_col = KEYWORD_CATEGORY_COLUMNS[category]
+            df[flag_col] = tags[category] > 0
+            df[count_col] = tags[category]
+        matched_keywords = matched_keywords + tags["matched_keywords"]
+
+    df["matched_keywords"] = [
+        separator.join(dict.fromkeys(keywords)) for keywords in matched_keywords
+    ]
+    return df
+
+
 def add_event_name(df: pd.DataFrame, event_name: str) -> pd.DataFrame:
     """
     Adds an 'event_name' column to the DataFrame with the specified event name.
@@ -142,11 +312,24 @@ def extract_time_features(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@lru_cache(maxsize=32)
+def _compile_substring_pattern(keywords: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """
+    Compiles the unanchored alternation r"kw1|kw2|..." used for post type keywords,
+    which also matches inside words. Returns None for an empty keyword list.
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
 def categorize_post_type(df: pd.DataFrame) -> pd.DataFrame:
     """
     Categorizes posts based on keywords in their title and selftext into
     'Player Transfer', 'Tournament Result', 'Ranking Update', or 'Other'.
     Uses a flexible keyword matching approach.
+    The post type only depends on the post, so each distinct post (by 'post_id', title
+    and selftext) is classified once and the result is broadcast to its comments.
 
     Args:
         df (pd.DataFrame): The input DataFrame containing 'post_title' and 'selftext' columns.
@@ -174,51 +357,49 @@ def categorize_post_type(df: pd.DataFrame) -> pd.DataFrame:
         df["post_type"] = "Other"
         return df
 
-    # Combine title and selftext for keyword checking
-    df["combined_post_text"] = (
-        df["post_title"].astype(str).fillna("")
-        + " "
-        + df["selftext"].astype(str).fillna("")
-    )
-    df["combined_post_text_lower"] = df[
-        "combined_post_text"
-    ].str.lower()  # Lowercase once for efficiency
-
-    def _flexible_contains_any_keyword(text: str, keyword_list: List[str]) -> bool:
-        if not keyword_list or not text:
-            return False
-        # Use a less strict regex for post type categorization
-        # This will match "keyword" in "keywords", "new team" in "a new team has formed"
-        # It avoids \b for more flexibility, but still escapes keywords
-        # The pattern will be like "keyword1|keyword2|..."
-        pattern = "|".join(re.escape(kw) for kw in keyword_list)
-        # Use re.search for partial matches within words, but still escape keywords
-        # This is the key change for more flexible matching
-        return bool(re.search(pattern, text))
-
-    def _classify_post(text_to_check: str) -> str:  # Corrected: takes text directly
-        # Prioritize more specific categories if there's overlap
-        if _flexible_contains_any_keyword(text_to_check, player_transfer_keywords):
-            logger.debug(f"Classified as 'Player Transfer'")  # Removed post_title
-            return "Player Transfer"
-        if _flexible_contains_any_keyword(text_to_check, tournament_result_keywords):
-            logger.debug(f"Classified as 'Tournament Result'")  # Removed post_title
-            return "Tournament Result"
-        if _flexible_contains_any_keyword(text_to_check, ranking_update_keywords):
-            logger.debug(f"Classified as 'Ranking Update'")  # Removed post_title
-            return "Ranking Update"
-        logger.debug(f"Classified as 'Other'")  # Removed post_title
+    # Prioritize more specific categories if there's overlap.
+    # The patterns avoid \b, so "keyword" also matches in "keywords".
+    post_type_patterns = [
+        (post_type, _compile_substring_pattern(tuple(keywords)))
+        for post_type, keywords in (
+            ("Player Transfer", player_transfer_keywords),
+            ("Tournament Result", tournament_result_keywords),
+            ("Ranking Update", ranking_update_keywords),
+        )
+    ]
+
+    def _classify_post(text_to_check: str) -> str:
+        if text_to_check:
+            for post_type, pattern in post_type_patterns:
+                if pattern is not None and pattern.search(text_to_check):
+                    logger.debug(f"Classified as '{post_type}'")
+                    return post_type
+        logger.debug(f"Classified as 'Other'")
         return "Other"
 
-    df["post_type"] = df["combined_post_text_lower"].apply(
-        _classify_post
-    )  # Apply to the lowercased text
+    # One row per distinct post; comments of the same post share these values
+    post_cols = [
+        col for col in ("post_id", "post_title", "selftext") if col in df.columns
+    ]
+    post_codes = df.groupby(post_cols, dropna=False, sort=False).ngroup().to_numpy()
+    posts = df[post_cols].drop_duplicates()
 
-    # Drop the temporary combined text columns
-    df.drop(columns=["combined_post_text", "combined_post_text_lower"], inplace=True)
+    # Combine title and selftext for keyword checking, lowercased once per post
+    combined_post_text_lower = (
+        posts["post_title"].astype(str).fillna("")
+        + " "
+        + posts["selftext"].astype(str).fillna("")
+    ).str.lower()
+    post_types = np.array(
+        [_classify_post(text) for text in combined_post_text_lower], dtype=object
+    )
 
-    logger.info("Post type categorization complete.")
-    post_type_counts = df["post_type"].value_counts()
+    df["post_type"] = post_types[post_codes]
+    logger.info(
+        f"Categorized {len(posts)} distinct posts for {len(df)} rows into post types."
+    )
+    # Counted per distinct post, not per comment row
+    post_type_counts = pd.Series(post_types, dtype=object).value_counts()
     logger.info(f"Post type distribution:\n{post_type_counts}")
 
     # Log if any specific category is empty
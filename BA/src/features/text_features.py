@@ -1,15 +1,30 @@
+import hashlib
+import importlib.metadata
+import json
 import logging
 import os
 import re
 import string
 import sys
-from typing import Any, Dict, List, Tuple, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import nltk
-from nltk.corpus import stopwords
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
+import numpy as np
+import pandas as pd
 
 # Import the centralized configuration
 project_root_for_import = os.path.abspath(
@@ -23,56 +38,420 @@ import config
 # Get a logger instance for this module
 logger = logging.getLogger(__name__)
 
+# NLTK data packages used by this module and the resource paths they are found under
+NLTK_DATA_PACKAGES = {
+    "stopwords": "corpora/stopwords",
+    "punkt": "tokenizers/punkt",
+    "wordnet": "corpora/wordnet",
+    # Downloaded as a zip that is used without unpacking
+    "vader_lexicon": "sentiment/vader_lexicon.zip",
+}
+
+# NLTK and its data are loaded on first use, not at import time, so that modules which
+# import this one but never process text (e.g. loading cached data) start quickly
+_nltk_lock = threading.RLock()
+_nltk_components: Dict[str, Any] = {}
+_checked_nltk_data: Set[str] = set()
+
 
 # --- NLTK Data Download Check ---
-def check_and_download_nltk_data() -> None:
+def ensure_nltk_data(data_name: str, offline: Optional[bool] = None) -> None:
     """
-    Checks if required NLTK data packages are downloaded. If not, attempts to download them.
-    Exits the program if critical data cannot be downloaded.
+    Checks if an NLTK data package is downloaded. If not, attempts to download it,
+    unless offline mode is enabled. Each package is only checked once per process.
+    Called lazily on first use, possibly in a worker process, so a missing package is
+    raised as an error; exiting is left to the entry points.
+
+    Args:
+        data_name (str): A key of NLTK_DATA_PACKAGES, e.g. 'wordnet'.
+        offline (Optional[bool]): Never try to download. Defaults to config.NLTK_OFFLINE.
+
+    Raises:
+        LookupError: If the package is missing and cannot be downloaded.
     """
-    required_nltk_data = {
-        "stopwords": "corpora/stopwords",
-        "punkt": "tokenizers/punkt",
-        "wordnet": "corpora/wordnet",
-        "vader_lexicon": "sentiment/vader_lexicon",
-    }
+    if data_name in _checked_nltk_data:
+        return
+    if offline is None:
+        offline = getattr(config, "NLTK_OFFLINE", False)
+
+    with _nltk_lock:
+        if data_name in _checked_nltk_data:
+            return
+        import nltk
 
-    for data_name, data_path in required_nltk_data.items():
         try:
-            nltk.data.find(data_path)
+            nltk.data.find(NLTK_DATA_PACKAGES[data_name])
             logger.info(f"NLTK data '{data_name}' already downloaded.")
         except LookupError:
+            if offline:
+                raise LookupError(
+                    f"NLTK data '{data_name}' not found and offline mode is enabled (config.NLTK_OFFLINE)."
+                ) from None
             logger.info(
                 f"NLTK data '{data_name}' not found. Attempting to download now..."
             )
             try:
-                nltk.download(data_name, quiet=True)
+                if not nltk.download(data_name, quiet=True):
+                    raise RuntimeError("nltk.download reported a failure")
                 logger.info(f"NLTK data '{data_name}' downloaded successfully.")
             except Exception as e:
-                logger.error(f"Failed to download NLTK data '{data_name}': {e}")
-                logger.error("This data is critical for text processing. Exiting.")
-                sys.exit(1)  # Exit if critical data cannot be downloaded
-
-
-# Perform the check and download when the module is imported
-check_and_download_nltk_data()
-
-# Initialize NLTK components
-try:
-    stop_words = set(stopwords.words("english"))
-    lemmatizer = WordNetLemmatizer()
-    analyzer = SentimentIntensityAnalyzer()
-except Exception as e:
-    logger.error(
-        f"Failed to initialize NLTK components: {e}. Ensure NLTK data is correctly downloaded."
+                raise LookupError(
+                    f"Failed to download NLTK data '{data_name}': {e}"
+                ) from e
+        _checked_nltk_data.add(data_name)
+
+
+def check_and_download_nltk_data(offline: Optional[bool] = None) -> None:
+    """
+    Checks all NLTK data packages of NLTK_DATA_PACKAGES up front, downloading missing
+    ones unless offline mode is enabled. Not needed before using this module, which
+    checks each package on first use, but useful to fail early.
+
+    Args:
+        offline (Optional[bool]): Never try to download. Defaults to config.NLTK_OFFLINE.
+
+    Raises:
+        LookupError: If a package is missing and cannot be downloaded.
+    """
+    for data_name in NLTK_DATA_PACKAGES:
+        ensure_nltk_data(data_name, offline=offline)
+
+
+def _get_nltk_component(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Returns a process-wide NLTK component, creating it with factory on first use.
+    Creation is guarded by a lock, so concurrent first calls create it only once.
+
+    Raises:
+        LookupError: If the NLTK data of the component is missing.
+        RuntimeError: If the component cannot be created for another reason.
+    """
+    component = _nltk_components.get(name)
+    if component is not None:
+        return component
+    with _nltk_lock:
+        component = _nltk_components.get(name)
+        if component is None:
+            try:
+                component = factory()
+            except LookupError:
+                raise
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to initialize NLTK component '{name}': {e}. Ensure NLTK data is correctly downloaded."
+                ) from e
+            _nltk_components[name] = component
+    return component
+
+
+def _create_stop_words() -> Set[str]:
+    ensure_nltk_data("stopwords")
+    from nltk.corpus import stopwords
+
+    return set(stopwords.words("english"))
+
+
+def _create_lemmatizer() -> Any:
+    ensure_nltk_data("wordnet")
+    from nltk.stem import WordNetLemmatizer
+
+    return WordNetLemmatizer()
+
+
+def _create_analyzer() -> Any:
+    ensure_nltk_data("vader_lexicon")
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
+
+
+def _create_word_tokenizer() -> Callable[[str], List[str]]:
+    ensure_nltk_data("punkt")
+    from nltk.tokenize import word_tokenize
+
+    return word_tokenize
+
+
+def get_stop_words() -> Set[str]:
+    """Returns the English NLTK stop words, loaded on first use."""
+    return _get_nltk_component("stop_words", _create_stop_words)
+
+
+def get_lemmatizer() -> Any:
+    """Returns the shared WordNetLemmatizer, created on first use."""
+    return _get_nltk_component("lemmatizer", _create_lemmatizer)
+
+
+def get_analyzer() -> Any:
+    """Returns the shared VADER SentimentIntensityAnalyzer, created on first use."""
+    return _get_nltk_component("analyzer", _create_analyzer)
+
+
+def word_tokenize(text: str) -> List[str]:
+    """Tokenizes text with NLTK's word_tokenize, loading the tokenizer on first use."""
+    return _get_nltk_component("word_tokenize", _create_word_tokenizer)(text)
+
+
+def _nltk_version() -> Optional[str]:
+    """Returns the installed NLTK version without importing NLTK, or None if unknown."""
+    try:
+        return importlib.metadata.version("nltk")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _lemmatize_with_wordnet(token: str) -> str:
+    return get_lemmatizer().lemmatize(token)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Keeps the module attributes 'stop_words', 'lemmatizer' and 'analyzer', which used
+    to be created at import time, available; they are now created on first access.
+    """
+    getters = {
+        "stop_words": get_stop_words,
+        "lemmatizer": get_lemmatizer,
+        "analyzer": get_analyzer,
+    }
+    if name in getters:
+        return getters[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LemmaCache:
+    """
+    Bounded least-recently-used cache of token -> lemma results. Reddit vocabulary is
+    very skewed, so most tokens are repeats and become a dictionary lookup.
+    When the cache is full, the least recently used token is evicted.
+
+    The cache can be saved to and loaded from a JSON file between runs, and copied into
+    worker processes with items()/update(). Workers can track the entries they add, so
+    the parent process can merge them back with merge(). A file written with another
+    NLTK version, and so possibly another WordNet, is not loaded.
+
+    Args:
+        lemmatize_func (Callable[[str], str]): The function computing a lemma on a miss.
+        maxsize (int): The maximum number of cached tokens.
+    """
+
+    FILE_VERSION = 1
+
+    def __init__(self, lemmatize_func: Callable[[str], str], maxsize: int) -> None:
+        self._lemmatize_func = lemmatize_func
+        self.maxsize = max(1, int(maxsize))
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._new_entries: Optional[List[Tuple[str, str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lemmatize(self, token: str) -> str:
+        """Returns the lemma of a token, computing and caching it on a miss."""
+        entries = self._entries
+        lemma = entries.get(token)
+        if lemma is not None:
+            entries.move_to_end(token)
+            self.hits += 1
+            return lemma
+        self.misses += 1
+        lemma = self._lemmatize_func(token)
+        self._store(token, lemma)
+        if self._new_entries is not None:
+            self._new_entries.append((token, lemma))
+        return lemma
+
+    def _store(self, token: str, lemma: str) -> None:
+        self._entries[token] = lemma
+        self._entries.move_to_end(token)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def items(self) -> List[Tuple[str, str]]:
+        """Returns the cached (token, lemma) pairs, least recently used first."""
+        return list(self._entries.items())
+
+    def update(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Adds (token, lemma) pairs as the most recently used entries."""
+        for token, lemma in items:
+            self._store(token, lemma)
+
+    def track_new_entries(self) -> None:
+        """Starts recording the entries added by misses, see pop_new_entries."""
+        self._new_entries = []
+
+    def pop_new_entries(self) -> List[Tuple[str, str]]:
+        """Returns and forgets the entries recorded since the last call."""
+        if self._new_entries is None:
+            return []
+        new_entries, self._new_entries = self._new_entries, []
+        return new_entries
+
+    def merge(self, items: Iterable[Tuple[str, str]], hits: int, misses: int) -> None:
+        """Merges the new entries and the hit/miss counts reported by a worker process."""
+        self.update(items)
+        self.hits += hits
+        self.misses += misses
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            Dict[str, Any]: 'hits', 'misses', 'hit_rate' (0.0 before the first lookup),
+                            'size' and 'maxsize'.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path: str) -> None:
+        """
+        Writes the cached entries and the NLTK version to a JSON file, replacing it
+        atomically.
+
+        Args:
+            path (str): The path of the cache file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.FILE_VERSION,
+                    "nltk": _nltk_version(),
+                    "entries": self.items(),
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> int:
+        """
+        Adds the entries of a JSON file written by save. A missing, unreadable or
+        outdated file, or one written with another NLTK version, is ignored.
+
+        Args:
+            path (str): The path of the cache file.
+
+        Returns:
+            int: The number of entries loaded.
+        """
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read lemma cache '{path}': {e}. Ignoring it.")
+            return 0
+        if not isinstance(data, dict) or data.get("version") != self.FILE_VERSION:
+            logger.warning(f"Lemma cache '{path}' has an unknown format. Ignoring it.")
+            return 0
+        if data.get("nltk") != _nltk_version():
+            logger.info(
+                f"Lemma cache '{path}' was written with NLTK {data.get('nltk')}, not {_nltk_version()}. Ignoring it."
+            )
+            return 0
+        entries = data.get("entries", [])
+        self.update((token, lemma) for token, lemma in entries)
+        return min(len(entries), self.maxsize)
+
+
+lemma_cache = LemmaCache(
+    _lemmatize_with_wordnet, maxsize=getattr(config, "LEMMA_CACHE_SIZE", 100000)
+)
+
+
+def load_lemma_cache(path: Optional[str] = None) -> int:
+    """
+    Loads the persisted lemma cache into the module's lemma_cache.
+
+    Args:
+        path (Optional[str]): The cache file. Defaults to config.LEMMA_CACHE_PATH.
+
+    Returns:
+        int: The number of entries loaded, 0 if there is no cache file.
+    """
+    path = path or getattr(config, "LEMMA_CACHE_PATH", None)
+    if not path:
+        return 0
+    loaded = lemma_cache.load(path)
+    if loaded:
+        logger.info(f"Loaded {loaded} cached lemmas from '{path}'.")
+    return loaded
+
+
+def save_lemma_cache(path: Optional[str] = None) -> None:
+    """
+    Persists the module's lemma_cache and logs its statistics.
+
+    Args:
+        path (Optional[str]): The cache file. Defaults to config.LEMMA_CACHE_PATH.
+    """
+    path = path or getattr(config, "LEMMA_CACHE_PATH", None)
+    stats = lemma_cache.stats()
+    logger.info(
+        f"Lemma cache: {stats['size']} entries, {stats['hits']} hits, {stats['misses']} misses (hit rate {stats['hit_rate']:.1%})."
     )
-    sys.exit(1)
+    if not path:
+        return
+    try:
+        lemma_cache.save(path)
+    except OSError as e:
+        logger.warning(f"Could not save lemma cache to '{path}': {e}")
+
+
+# --- Text Cleaning Patterns ---
+# URLs, then mentions (@username). A mention stops where a URL starts, as if URLs were
+# removed first. Hashtag signs (#) are punctuation and removed with it.
+URL_AND_MENTION_PATTERN = re.compile(r"http\S+|www\S+|\@(?:(?!http\S|www\S)\w)+")
+# Cleaned texts word_tokenize splits exactly like str.split(): lowercase ASCII words
+SIMPLE_CLEANED_TEXT_PATTERN = re.compile(r"[a-z ]*")
+# Words the Treebank tokenizer splits even without apostrophes ("gonna" -> "gon", "na")
+TOKENIZER_CONTRACTION_WORDS = frozenset(
+    {"cannot", "gimme", "gonna", "gotta", "lemme", "wanna", "whaddya", "whatcha"}
+)
+
+
+@lru_cache(maxsize=1)
+def _punctuation_and_digit_table() -> Dict[int, None]:
+    """
+    Returns the str.translate table deleting ASCII punctuation and every Unicode decimal
+    digit (the characters matched by the regex '\\d'). Built on first use.
+    """
+    table: Dict[int, None] = dict.fromkeys(map(ord, string.punctuation))
+    table.update(
+        dict.fromkeys(
+            code_point
+            for code_point in range(sys.maxunicode + 1)
+            if chr(code_point).isdecimal()
+        )
+    )
+    return table
 
 
 def clean_text(text: Union[str, Any]) -> str:
     """
     Cleans text by converting to lowercase, removing URLs, mentions, hashtags,
     numbers, and punctuation. Handles non-string inputs by converting them to string.
+    URLs and mentions are removed with one precompiled pattern, punctuation and digits
+    with one translate table.
 
     Args:
         text (Union[str, Any]): The input text to clean.
@@ -83,18 +462,32 @@ def clean_text(text: Union[str, Any]) -> str:
     if not isinstance(text, str):
         text = str(text)  # Convert non-string inputs to string
 
-    text = text.lower()
-    # Remove URLs
-    text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
-    # Remove mentions (@username) and hashtags (#)
-    text = re.sub(r"\@\w+|\#", "", text)
-    # Remove punctuation
-    text = text.translate(str.maketrans("", "", string.punctuation))
-    # Remove numbers
-    text = re.sub(r"\d+", "", text)
+    text = URL_AND_MENTION_PATTERN.sub("", text.lower())
+    text = text.translate(_punctuation_and_digit_table())
     # Replace multiple spaces with a single space and strip leading/trailing whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return " ".join(text.split())
+
+
+def tokenize_clean_text(text: Union[str, Any]) -> List[str]:
+    """
+    Cleans text like clean_text and returns its tokens as word_tokenize would.
+    Cleaned text of plain lowercase ASCII words without tokenizer contractions is
+    split on spaces directly; anything else is passed to word_tokenize.
+
+    Args:
+        text (Union[str, Any]): The input text to clean and tokenize.
+
+    Returns:
+        List[str]: The tokens, empty if nothing is left after cleaning.
+    """
+    cleaned_text = clean_text(text)
+    if not cleaned_text:
+        return []
+    if SIMPLE_CLEANED_TEXT_PATTERN.fullmatch(cleaned_text):
+        tokens = cleaned_text.split(" ")
+        if TOKENIZER_CONTRACTION_WORDS.isdisjoint(tokens):
+            return tokens
+    return word_tokenize(cleaned_text)
 
 
 def preprocess_text(text: Union[str, Any]) -> str:
@@ -108,17 +501,109 @@ def preprocess_text(text: Union[str, Any]) -> str:
     Returns:
         str: The preprocessed text.
     """
-    cleaned_text = clean_text(text)
-    if not cleaned_text:  # If text is empty after cleaning, return empty string
-        return ""
-
-    tokens = word_tokenize(cleaned_text)
+    tokens = tokenize_clean_text(text)
+    stop_words = get_stop_words()
     processed_tokens = [
-        lemmatizer.lemmatize(word) for word in tokens if word not in stop_words
+        lemma_cache.lemmatize(word) for word in tokens if word not in stop_words
     ]
     return " ".join(processed_tokens)
 
 
+def _init_preprocess_worker(lemma_items: List[Tuple[str, str]]) -> None:
+    """
+    Initializes a text preprocessing worker process. The NLTK components are created on
+    first use, so the stop words, WordNet and the punkt tokenizer models are loaded here
+    once per worker instead of in its first chunk. They are loaded directly rather than
+    through preprocess_text: a warm-up text could take the split fast path and skip
+    punkt, and its lemmas would end up in the cache. The worker's lemma cache then starts
+    as a copy of the parent's.
+    """
+    get_stop_words()
+    get_lemmatizer().lemmatize("x")
+    word_tokenize("x.")
+    lemma_cache.clear()
+    lemma_cache.update(lemma_items)
+    lemma_cache.track_new_entries()
+
+
+def _preprocess_chunk(
+    texts: List[Any],
+) -> Tuple[List[str], List[Tuple[str, str]], int, int]:
+    """
+    Preprocesses one chunk of texts in a worker process.
+
+    Returns:
+        Tuple[List[str], List[Tuple[str, str]], int, int]: The processed texts, the
+            lemma cache entries added and the cache hits and misses of this chunk.
+    """
+    hits, misses = lemma_cache.hits, lemma_cache.misses
+    processed = [preprocess_text(text) for text in texts]
+    return (
+        processed,
+        lemma_cache.pop_new_entries(),
+        lemma_cache.hits - hits,
+        lemma_cache.misses - misses,
+    )
+
+
+def preprocess_texts(
+    texts: Union[pd.Series, Iterable[Any]],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Union[pd.Series, List[str]]:
+    """
+    Applies preprocess_text to many texts, in chunks spread over a pool of worker
+    processes. Each worker initializes NLTK once, and the output keeps the input order.
+    Inputs of at most one chunk, or a single worker, are processed in this process.
+    Workers start from a copy of the lemma cache, and the lemmas they add are merged
+    back into it.
+
+    Args:
+        texts (Union[pd.Series, Iterable[Any]]): The texts to preprocess.
+        max_workers (Optional[int]): Number of worker processes. Defaults to
+                                     config.TEXT_PREPROCESS_WORKERS.
+        chunksize (Optional[int]): Number of texts per task. Defaults to
+                                   config.TEXT_PREPROCESS_CHUNK_SIZE.
+
+    Returns:
+        Union[pd.Series, List[str]]: The preprocessed texts; a Series with the input's
+                                     index and name if a Series was given, else a list.
+    """
+    if max_workers is None:
+        max_workers = getattr(config, "TEXT_PREPROCESS_WORKERS", 1)
+    if chunksize is None:
+        chunksize = getattr(config, "TEXT_PREPROCESS_CHUNK_SIZE", 2000)
+    chunksize = max(1, int(chunksize))
+
+    values = texts.tolist() if isinstance(texts, pd.Series) else list(texts)
+    chunks = [
+        values[start : start + chunksize] for start in range(0, len(values), chunksize)
+    ]
+    max_workers = max(1, min(int(max_workers), len(chunks)))
+
+    if max_workers == 1:
+        processed = [preprocess_text(text) for text in values]
+    else:
+        logger.info(
+            f"Preprocessing {len(values)} texts in {len(chunks)} chunks with {max_workers} worker processes..."
+        )
+        processed = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_preprocess_worker,
+            initargs=(lemma_cache.items(),),
+        ) as executor:
+            for chunk_result, new_lemmas, hits, misses in executor.map(
+                _preprocess_chunk, chunks
+            ):
+                processed.extend(chunk_result)
+                lemma_cache.merge(new_lemmas, hits, misses)
+
+    if isinstance(texts, pd.Series):
+        return pd.Series(processed, index=texts.index, name=texts.name)
+    return processed
+
+
 def get_sentiment_scores(text: Union[str, Any]) -> Dict[str, float]:
     """
     Returns VADER sentiment polarity scores for a given text.
@@ -133,7 +618,113 @@ def get_sentiment_scores(text: Union[str, Any]) -> Dict[str, float]:
     """
     if not isinstance(text, str) or not text.strip():
         return {"neg": 0.0, "neu": 0.0, "pos": 0.0, "compound": 0.0}
-    return analyzer.polarity_scores(text)
+    return get_analyzer().polarity_scores(text)
+
+
+# Order of the columns of the score arrays returned by score_sentiments
+SENTIMENT_SCORE_KEYS = ("neg", "neu", "pos", "compound")
+# VADER rounds its scores to at most 4 decimals, so rounding the float32 scores to
+# SENTIMENT_SCORE_DECIMALS after widening to float64 restores the exact VADER values
+SENTIMENT_SCORE_DECIMALS = 4
+# Scores of already seen texts by content hash, least recently used first
+_sentiment_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+
+def _sentiment_cache_key(text: str) -> bytes:
+    """Returns the content hash under which the scores of a text are cached."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+def _score_sentiment_chunk(texts: List[str]) -> np.ndarray:
+    """Scores a chunk of non-empty texts with VADER, possibly in a worker process."""
+    analyzer = get_analyzer()
+    scores = np.empty((len(texts), len(SENTIMENT_SCORE_KEYS)), dtype=np.float32)
+    for i, text in enumerate(texts):
+        polarity = analyzer.polarity_scores(text)
+        scores[i] = [polarity[key] for key in SENTIMENT_SCORE_KEYS]
+    return scores
+
+
+def score_sentiments(
+    texts: Union[pd.Series, Iterable[Any]],
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Returns VADER sentiment polarity scores for many texts as one array.
+    Each distinct text is scored once: texts are looked up by a content hash in a
+    bounded cache (config.SENTIMENT_CACHE_SIZE), so duplicates within the batch and texts
+    scored by earlier calls are never rescored. The remaining texts are scored in chunks
+    over a pool of worker processes when they span more than one chunk.
+    Non-string and empty texts get zero scores, as in get_sentiment_scores.
+
+    Args:
+        texts (Union[pd.Series, Iterable[Any]]): The texts to score.
+        max_workers (Optional[int]): Number of worker processes. Defaults to
+                                     config.SENTIMENT_WORKERS.
+        chunksize (Optional[int]): Number of texts per task. Defaults to
+                                   config.SENTIMENT_CHUNK_SIZE.
+
+    Returns:
+        np.ndarray: A float32 array of shape (n, 4), with the columns in the order of
+                    SENTIMENT_SCORE_KEYS ('neg', 'neu', 'pos', 'compound').
+    """
+    if max_workers is None:
+        max_workers = getattr(config, "SENTIMENT_WORKERS", 1)
+    if chunksize is None:
+        chunksize = getattr(config, "SENTIMENT_CHUNK_SIZE", 2000)
+    chunksize = max(1, int(chunksize))
+    cache_size = getattr(config, "SENTIMENT_CACHE_SIZE", 200000)
+
+    values = texts.tolist() if isinstance(texts, pd.Series) else list(texts)
+    scores = np.zeros((len(values), len(SENTIMENT_SCORE_KEYS)), dtype=np.float32)
+
+    # Positions of each distinct uncached text, by content hash
+    pending: Dict[bytes, List[int]] = {}
+    pending_texts: List[str] = []
+    for i, text in enumerate(values):
+        if not isinstance(text, str) or not text.strip():
+            continue
+        key = _sentiment_cache_key(text)
+        cached = _sentiment_cache.get(key)
+        if cached is not None:
+            _sentiment_cache.move_to_end(key)
+            scores[i] = cached
+            continue
+        positions = pending.get(key)
+        if positions is None:
+            pending[key] = [i]
+            pending_texts.append(text)
+        else:
+            positions.append(i)
+
+    if not pending_texts:
+        return scores
+
+    chunks = [
+        pending_texts[start : start + chunksize]
+        for start in range(0, len(pending_texts), chunksize)
+    ]
+    max_workers = max(1, min(int(max_workers), len(chunks)))
+    logger.info(
+        f"Scoring sentiment of {len(pending_texts)} distinct texts ({len(values) - len(pending_texts)} of {len(values)} cached, duplicate or empty) with {max_workers} worker process(es)..."
+    )
+    if max_workers == 1:
+        new_scores = _score_sentiment_chunk(pending_texts)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            new_scores = np.concatenate(
+                list(executor.map(_score_sentiment_chunk, chunks))
+            )
+
+    for (key, positions), row in zip(pending.items(), new_scores):
+        scores[positions] = row
+        _sentiment_cache[key] = row
+    while len(_sentiment_cache) > cache_size:
+        _sentiment_cache.popitem(last=False)
+    return scores
 
 
 def calculate_text_length(text: Union[str, Any]) -> Tuple[int, int]:
@@ -153,11 +744,263 @@ def calculate_text_length(text: Union[str, Any]) -> Tuple[int, int]:
     return char_count, word_count
 
 
+def _is_word_char(char: str) -> bool:
+    """Returns True for the characters the regex '\\w' treats as word characters."""
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed list of keywords against texts in a single pass per text.
+    The keywords are stored in a character trie, which is walked from every word
+    boundary of the lowercased text. Matching therefore costs time proportional to the
+    text length (times the longest keyword prefix found), not to the number of keywords.
+
+    The semantics are those of the regex r"\\b(?:kw1|kw2|...)\\b" on the lowercased text:
+    a keyword matches when it occurs with a word boundary on both sides. Keywords
+    themselves are used as given, not lowercased.
+
+    Build it once and reuse it:
+
+        matcher = KeywordMatcher(get_keywords()["hero_keywords"])
+        df["contains_hero_keyword"] = matcher.contains_any_series(df["processed_comment_body"])
+
+    Args:
+        keywords (Iterable[str]): The keywords to search for. Empty strings are ignored.
+    """
+
+    _END = ""  # Trie key marking the end of a keyword (never a single character)
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: List[str] = []
+        self._trie: Dict[str, Any] = {}
+        for keyword in dict.fromkeys(keywords):
+            if not keyword:
+                continue
+            self.keywords.append(keyword)
+            node = self._trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[self._END] = keyword
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    @staticmethod
+    def _normalize(text: Union[str, Any]) -> str:
+        if not isinstance(text, str):
+            text = str(text)  # Convert non-string inputs to string
+        return text.lower()
+
+    def _iter_matches(self, text: str) -> Iterator[str]:
+        """Yields every keyword occurrence in an already lowercased text, by start position."""
+        trie = self._trie
+        end_key = self._END
+        length = len(text)
+        previous_is_word = False
+        for start in range(length):
+            char = text[start]
+            is_word = _is_word_char(char)
+            at_boundary = is_word != previous_is_word
+            previous_is_word = is_word
+            if not at_boundary or char not in trie:
+                continue
+            node = trie
+            position = start
+            while position < length:
+                node = node.get(text[position])
+                if node is None:
+                    break
+                position += 1
+                keyword = node.get(end_key)
+                if keyword is not None and _is_word_char(text[position - 1]) != (
+                    position < length and _is_word_char(text[position])
+                ):
+                    yield keyword
+
+    def contains_any(self, text: Union[str, Any]) -> bool:
+        """
+        Checks whether the text contains any of the keywords as a whole word.
+
+        Args:
+            text (Union[str, Any]): The input text. Non-strings are converted to strings.
+
+        Returns:
+            bool: True if any keyword is found, False otherwise.
+        """
+        if not self._trie:
+            return False
+        for _ in self._iter_matches(self._normalize(text)):
+            return True
+        return False
+
+    def find_all(self, text: Union[str, Any]) -> List[str]:
+        """
+        Returns the distinct keywords found in the text, in order of first occurrence.
+
+        Args:
+            text (Union[str, Any]): The input text. Non-strings are converted to strings.
+
+        Returns:
+            List[str]: The matched keywords. Empty if none is found.
+        """
+        if not self._trie:
+            return []
+        return list(dict.fromkeys(self._iter_matches(self._normalize(text))))
+
+    def contains_any_series(self, texts: pd.Series) -> pd.Series:
+        """
+        Vectorized contains_any over a Series. Each distinct text is scanned only once.
+
+        Args:
+            texts (pd.Series): The texts to search within.
+
+        Returns:
+            pd.Series: Boolean flags aligned with the input index.
+        """
+        if not self._trie:
+            return pd.Series(False, index=texts.index, dtype=bool, name=texts.name)
+        cache: Dict[Any, bool] = {}
+        flags = []
+        for text in texts.tolist():
+            key = text if isinstance(text, str) else self._normalize(text)
+            flag = cache.get(key)
+            if flag is None:
+                flag = cache[key] = self.contains_any(key)
+            flags.append(flag)
+        return pd.Series(flags, index=texts.index, dtype=bool, name=texts.name)
+
+    def find_all_series(self, texts: pd.Series) -> pd.Series:
+        """
+        Vectorized find_all over a Series. Each distinct text is scanned only once.
+
+        Args:
+            texts (pd.Series): The texts to search within.
+
+        Returns:
+            pd.Series: Lists of matched keywords aligned with the input index.
+        """
+        cache: Dict[Any, List[str]] = {}
+        matches = []
+        for text in texts.tolist():
+            key = text if isinstance(text, str) else self._normalize(text)
+            found = cache.get(key)
+            if found is None:
+                found = cache[key] = self.find_all(key)
+            matches.append(list(found))
+        return pd.Series(matches, index=texts.index, dtype=object, name=texts.name)
+
+
+class KeywordTagger:
+    """
+    Tags texts with several keyword categories in a single scan per text.
+    All keywords of all categories share one KeywordMatcher, and each matched keyword
+    is attributed to every category that lists it. Per text, the tagger reports the
+    distinct matched keywords and, per category, how many of them belong to it.
+
+    Args:
+        categories (Dict[str, Iterable[str]]): Keyword lists by category name.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]) -> None:
+        self.categories: List[str] = list(categories)
+        keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in dict.fromkeys(keywords):
+                if keyword:
+                    keyword_categories.setdefault(keyword, []).append(category)
+        self._keyword_categories = {
+            keyword: tuple(names) for keyword, names in keyword_categories.items()
+        }
+        self._matcher = KeywordMatcher(keyword_categories)
+
+    def tag(self, text: Union[str, Any]) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Tags a single text.
+
+        Args:
+            text (Union[str, Any]): The input text. Non-strings are converted to strings.
+
+        Returns:
+            Tuple[List[str], Dict[str, int]]: The distinct matched keywords in order of
+                first occurrence, and the number of them in each category.
+        """
+        matched = self._matcher.find_all(text)
+        counts = dict.fromkeys(self.categories, 0)
+        for keyword in matched:
+            for category in self._keyword_categories[keyword]:
+                counts[category] += 1
+        return matched, counts
+
+    def tag_series(self, texts: pd.Series) -> pd.DataFrame:
+        """
+        Tags every text of a Series. Each distinct text is scanned only once.
+
+        Args:
+            texts (pd.Series): The texts to tag.
+
+        Returns:
+            pd.DataFrame: Aligned with the input index, with a 'matched_keywords' column
+                          holding lists of keywords and one int16 count column per
+                          category, named after the category.
+        """
+        matches = self._matcher.find_all_series(texts)
+        counts = {category: [] for category in self.categories}
+        for matched in matches.tolist():
+            row_counts = dict.fromkeys(self.categories, 0)
+            for keyword in matched:
+                for category in self._keyword_categories[keyword]:
+                    row_counts[category] += 1
+            for category, count in row_counts.items():
+                counts[category].append(count)
+        tags = pd.DataFrame(
+            {
+                category: pd.Series(values, index=texts.index, dtype="int16")
+                for category, values in counts.items()
+            },
+            index=texts.index,
+        )
+        tags.insert(0, "matched_keywords", matches)
+        return tags
+
+
+@lru_cache(maxsize=8)
+def get_keyword_tagger(
+    categories: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> KeywordTagger:
+    """
+    Returns a KeywordTagger for hashable (category, keywords) pairs, built once and cached.
+
+    Args:
+        categories (Tuple[Tuple[str, Tuple[str, ...]], ...]): The keyword tuples by
+            category name, in the order of the output columns.
+
+    Returns:
+        KeywordTagger: The shared tagger for these categories.
+    """
+    return KeywordTagger(dict(categories))
+
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """
+    Returns a KeywordMatcher for a keyword tuple, built once and cached.
+
+    Args:
+        keywords (Tuple[str, ...]): The keywords, as a hashable tuple.
+
+    Returns:
+        KeywordMatcher: The shared matcher for these keywords.
+    """
+    return KeywordMatcher(keywords)
+
+
 def contains_any_keyword(text: Union[str, Any], keyword_list: List[str]) -> bool:
     """
     Checks if the text contains any of the keywords from the provided list.
     The check is case-insensitive and matches whole words.
     Handles non-string inputs and empty keyword lists.
+    The matcher for a keyword list is built once and reused across calls.
 
     Args:
         text (Union[str, Any]): The input text to search within.
@@ -168,13 +1011,7 @@ def contains_any_keyword(text: Union[str, Any], keyword_list: List[str]) -> bool
     """
     if not keyword_list:
         return False
-    if not isinstance(text, str):
-        text = str(text)
-
-    # Create a regex pattern for whole word matching, escaping special characters in keywords
-    # Example: r"\b(?:keyword1|keyword2)\b"
-    pattern = r"\b(?:" + "|".join(re.escape(kw) for kw in keyword_list) + r")\b"
-    return bool(re.search(pattern, text.lower()))
+    return get_keyword_matcher(tuple(keyword_list)).contains_any(text)
 
 
 def contains_question(text: Union[str, Any]) -> bool:
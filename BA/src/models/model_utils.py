@@ -10,8 +10,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-import shap
-import xgboost as xgb
 from scipy.sparse import csr_matrix, hstack
 from scipy.stats import randint, uniform
 from sklearn.compose import ColumnTransformer
@@ -357,6 +355,8 @@ def train_and_tune_xgboost(
         )
         return Pipeline(steps=[]), np.nan, np.nan, {}
 
+    import xgboost as xgb  # Heavy import, only loaded when XGBoost is trained
+
     # Initial XGBoost model within a pipeline
     xgboost_initial_pipeline = Pipeline(
         steps=[
@@ -493,6 +493,8 @@ def interpret_model_shap(
         )
         return
 
+    import shap  # Heavy import (numba, llvmlite), only loaded for interpretation
+
     # Extract the fitted XGBoost model from the pipeline
     xgboost_model = model_pipeline.named_steps["regressor"]
 
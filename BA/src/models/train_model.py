@@ -26,6 +26,14 @@ MODELS_DIR = getattr(config, "MODELS_DIR", "models")
 RANDOM_STATE = getattr(config, "RANDOM_STATE", 42)
 TARGET_VARIABLE = getattr(config, "TARGET_VARIABLE", "comment_score")
 TEST_SIZE = getattr(config, "TEST_SIZE", 0.2)
+# Only the columns used by the model are loaded from the database
+MODEL_INPUT_COLUMNS = (
+    [getattr(config, "TEXT_FEATURE", "processed_comment_body")]
+    + getattr(config, "CATEGORICAL_FEATURES", [])
+    + getattr(config, "NUMERICAL_FEATURES", [])
+    + getattr(config, "BOOLEAN_FEATURES", [])
+    + [TARGET_VARIABLE]
+)
 
 # Setup logging (must be done before importing model_utils if model_utils also sets up logging)
 os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
@@ -124,7 +132,7 @@ def run_model_pipeline() -> None:
 
     # 1. Daten laden
     logger.info("\n--- Loading Data ---")
-    df_comments = load_data_from_sqlite()
+    df_comments = load_data_from_sqlite(columns=MODEL_INPUT_COLUMNS)
     if df_comments.empty:
         logger.error(
             "No data loaded. Please ensure the database contains data. Exiting model pipeline."
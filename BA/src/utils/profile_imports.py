@@ -0,0 +1,261 @@
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import the centralized configuration
+project_root_for_import = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+if project_root_for_import not in sys.path:
+    sys.path.insert(0, project_root_for_import)
+
+import config
+
+# Get a logger instance for this module
+logger = logging.getLogger(__name__)
+
+# Modules whose import cost is measured: one per pipeline command
+ENTRY_POINTS = (
+    "BA.src.data.prepare_data",
+    "BA.src.models.train_model",
+    "BA.src.visualization.plots",
+    "BA.src.analysis.statistical_tests",
+    "BA.src.data.database_utils",
+)
+
+
+def parse_importtime_output(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parses the report written to stderr by 'python -X importtime'.
+
+    Args:
+        stderr (str): The stderr of the profiled interpreter.
+
+    Returns:
+        List[Tuple[str, int, int]]: (module, self time in us, cumulative time in us)
+                                    per imported module, in report order.
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # The header line
+        records.append((fields[2].strip(), self_us, cumulative_us))
+    return records
+
+
+def profile_entry_point(module: str) -> Dict[str, Any]:
+    """
+    Imports a module in a fresh interpreter with '-X importtime' and summarizes the cost.
+
+    Args:
+        module (str): The dotted module name to import.
+
+    Raises:
+        RuntimeError: If the import fails.
+
+    Returns:
+        Dict[str, Any]: 'total_ms' (cumulative import time of the module), 'modules'
+                        (number of modules imported) and 'packages' (self time in ms
+                        per top-level package).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=config.PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Importing '{module}' failed: {result.stderr.strip().splitlines()[-1:]}"
+        )
+    records = parse_importtime_output(result.stderr)
+
+    packages: Dict[str, float] = {}
+    for name, self_us, _ in records:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0.0) + self_us / 1000
+    total_us = next(
+        (cumulative for name, _, cumulative in records if name == module),
+        sum(self_us for _, self_us, _ in records),
+    )
+    return {
+        "total_ms": total_us / 1000,
+        "modules": len(records),
+        "packages": packages,
+    }
+
+
+def profile_entry_points(
+    entry_points: Tuple[str, ...] = ENTRY_POINTS, repeat: int = 3
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Profiles the import of each entry point several times and keeps the median run.
+
+    Args:
+        entry_points (Tuple[str, ...]): The modules to profile.
+        repeat (int): Number of fresh imports per module.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The median run of profile_entry_point per module.
+                                   Modules that fail to import are left out.
+    """
+    profiles: Dict[str, Dict[str, Any]] = {}
+    for module in entry_points:
+        try:
+            runs = [profile_entry_point(module) for _ in range(max(1, repeat))]
+        except RuntimeError as e:
+            logger.error(f"{e} Skipping this entry point.")
+            continue
+        median_total = statistics.median(run["total_ms"] for run in runs)
+        profiles[module] = min(
+            runs, key=lambda run: abs(run["total_ms"] - median_total)
+        )
+    return profiles
+
+
+def _git_commit() -> Optional[str]:
+    """Returns the current git commit of the project, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=config.PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def load_history(path: str) -> List[Dict[str, Any]]:
+    """
+    Reads the recorded import profiles, oldest first.
+
+    Args:
+        path (str): The JSON Lines history file.
+
+    Returns:
+        List[Dict[str, Any]]: One record per profiling run. Empty if there is no file.
+    """
+    if not os.path.exists(path):
+        return []
+    history = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    history.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed line in '{path}'.")
+    return history
+
+
+def append_history(path: str, record: Dict[str, Any]) -> None:
+    """Appends one profiling run to the JSON Lines history file."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def format_report(
+    profiles: Dict[str, Dict[str, Any]],
+    previous: Optional[Dict[str, Any]] = None,
+    top: int = 8,
+) -> str:
+    """
+    Formats the import profiles as text, with the change against a previous run.
+
+    Args:
+        profiles (Dict[str, Dict[str, Any]]): The profiles of profile_entry_points.
+        previous (Optional[Dict[str, Any]]): An earlier history record to compare with.
+        top (int): Number of most expensive packages listed per entry point.
+
+    Returns:
+        str: The report.
+    """
+    previous_profiles = (previous or {}).get("entry_points", {})
+    lines = []
+    for module, profile in profiles.items():
+        line = f"{module}: {profile['total_ms']:.0f} ms, {profile['modules']} modules"
+        if module in previous_profiles:
+            delta = profile["total_ms"] - previous_profiles[module]["total_ms"]
+            line += f" ({delta:+.0f} ms vs {previous.get('commit') or 'previous run'})"
+        lines.append(line)
+        heaviest = sorted(
+            profile["packages"].items(), key=lambda item: item[1], reverse=True
+        )
+        for package, self_ms in heaviest[:top]:
+            lines.append(f"    {package:<24} {self_ms:8.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Profiles the entry points, prints the report and records it in the history."""
+    parser = argparse.ArgumentParser(
+        description="Measure the import time of the pipeline entry points."
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=list(ENTRY_POINTS),
+        help="Modules to profile. Defaults to all pipeline entry points.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Fresh imports per module."
+    )
+    parser.add_argument(
+        "--top", type=int, default=8, help="Heaviest packages listed per module."
+    )
+    parser.add_argument(
+        "--history",
+        default=getattr(
+            config,
+            "IMPORT_PROFILE_HISTORY_PATH",
+            os.path.join(config.PROJECT_ROOT, "import_profile_history.jsonl"),
+        ),
+        help="JSON Lines file the results are appended to.",
+    )
+    parser.add_argument(
+        "--no-record",
+        action="store_true",
+        help="Only print the report; do not append it to the history.",
+    )
+    args = parser.parse_args(argv)
+
+    profiles = profile_entry_points(tuple(args.modules), repeat=args.repeat)
+    history = load_history(args.history)
+    print(format_report(profiles, history[-1] if history else None, top=args.top))
+
+    if not args.no_record and profiles:
+        append_history(
+            args.history,
+            {
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "entry_points": profiles,
+            },
+        )
+        logger.info(f"Import profile appended to '{args.history}'.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=getattr(config, "LOG_LEVEL", logging.INFO),
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    main()
@@ -22,10 +22,6 @@ import config
 logger = logging.getLogger(__name__)
 sns.set_style("whitegrid")
 
-# Ensure output directories exist
-os.makedirs(config.FIGURES_DIR, exist_ok=True)
-os.makedirs(config.REPORTS_DIR, exist_ok=True)
-
 
 def save_plot(fig: plt.Figure, filename: str) -> None:
     """
@@ -35,6 +31,7 @@ def save_plot(fig: plt.Figure, filename: str) -> None:
         fig (plt.Figure): The matplotlib figure object to save.
         filename (str): The name of the file to save the plot as.
     """
+    os.makedirs(config.FIGURES_DIR, exist_ok=True)
     filepath = os.path.join(config.FIGURES_DIR, filename)
     fig.savefig(filepath, dpi=300, bbox_inches="tight")
     plt.close(fig)  # Close the figure to free memory
@@ -50,6 +47,7 @@ def _save_dataframe_as_text(df: pd.DataFrame, filename: str, title: str = "") ->
         filename (str): The name of the text file.
         title (str, optional): An optional title for the text file. Defaults to "".
     """
+    os.makedirs(config.REPORTS_DIR, exist_ok=True)
     filepath = os.path.join(config.REPORTS_DIR, filename)
     with open(filepath, "w", encoding="utf-8") as f:
         if title:
@@ -651,6 +649,38 @@ def plot_boxplot_with_stats(
     save_plot(fig, filename)
 
 
+def explode_matched_keywords(
+    df: pd.DataFrame,
+    matched_col: str = "matched_keywords",
+    keyword_col: str = "extracted_keyword",
+    top_n: int = None,
+) -> pd.DataFrame:
+    """
+    Turns the matched keyword terms of each comment into one row per (comment, keyword),
+    as expected by the keyword heatmaps.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame with the joined matched keyword terms.
+        matched_col (str): The column holding terms joined by config.MATCHED_KEYWORDS_SEPARATOR.
+        keyword_col (str): The name of the output column holding a single keyword.
+        top_n (int, optional): Keep only the most frequent keywords. Defaults to all.
+
+    Returns:
+        pd.DataFrame: The exploded rows. Comments without a matched keyword are dropped.
+    """
+    separator = getattr(config, "MATCHED_KEYWORDS_SEPARATOR", "|")
+    matched = df[matched_col].fillna("").astype(str)
+    exploded = df.drop(columns=[matched_col]).assign(
+        **{keyword_col: matched.str.split(separator, regex=False)}
+    )
+    exploded = exploded.explode(keyword_col)
+    exploded = exploded[exploded[keyword_col] != ""]
+    if top_n is not None:
+        top_keywords = exploded[keyword_col].value_counts().head(top_n).index
+        exploded = exploded[exploded[keyword_col].isin(top_keywords)]
+    return exploded.reset_index(drop=True)
+
+
 def plot_event_keyword_distribution(
     df: pd.DataFrame, keyword_col: str, title: str, filename: str
 ) -> None:
@@ -1053,13 +1083,6 @@ def generate_all_eda_plots(df: pd.DataFrame) -> None:
     #         "Boxplot of Value by Category and Hue", "boxplot_example.png"
     #     )
 
-    # Example of plot_event_keyword_distribution (requires keyword data)
-    # if "extracted_keyword" in df.columns:
-    #     plot_event_keyword_distribution(
-    #         df, "extracted_keyword", "Keyword Distribution Across Events",
-    #         "keyword_distribution_heatmap.png"
-    #     )
-
     # Example of plot_dual_distribution (requires two numerical features)
     # if "feature_A" in df.columns and "feature_B" in df.columns:
     #     plot_dual_distribution(
@@ -1067,11 +1090,29 @@ def generate_all_eda_plots(df: pd.DataFrame) -> None:
     #         "Distribution Comparison of Feature A and Feature B", "dual_distribution_example.png"
     #     )
 
-    # Example of plot_keyword_score_heatmap (requires keyword and score data)
-    # if "extracted_keyword" in df.columns and "comment_score" in df.columns:
-    #     plot_keyword_score_heatmap(
-    #         df, "extracted_keyword", "comment_score",
-    #         "Average Comment Score by Keyword and Event", "keyword_score_heatmap.png"
-    #     )
+    # --- Keyword Plots ---
+    logger.info("\n--- Generating Keyword Plots ---")
+    if "matched_keywords" in df.columns and "event_name" in df.columns:
+        df_keywords = explode_matched_keywords(
+            df, top_n=getattr(config, "KEYWORD_PLOT_TOP_N", 20)
+        )
+        plot_event_keyword_distribution(
+            df_keywords,
+            "extracted_keyword",
+            "Keyword Distribution Across Events",
+            "keyword_distribution_heatmap.png",
+        )
+        if "comment_score" in df_keywords.columns:
+            plot_keyword_score_heatmap(
+                df_keywords,
+                "extracted_keyword",
+                "comment_score",
+                "keyword_score_heatmap.png",
+                "Average Comment Score by Keyword and Event",
+            )
+    else:
+        logger.warning(
+            "Missing 'matched_keywords' or 'event_name' column for keyword plots. Skipping."
+        )
 
     logger.info("\n--- All EDA Plots Generated ---")
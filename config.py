@@ -6,9 +6,22 @@ import os
 # --- Project Structure and Paths ---
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
+# --- Parallelism ---
+# Default size of the process pools below: at most 4, and never more than the CPUs
+DEFAULT_WORKER_PROCESSES = min(4, os.cpu_count() or 1)
+
 # --- Database Configuration ---
 DATABASE_NAME = "reddit_dota2_analysis.db"
 TABLE_NAME = "comments_data"
+# Rows per chunk when data is written to or streamed from the database
+SQLITE_WRITE_CHUNK_SIZE = 5000
+SQLITE_READ_CHUNK_SIZE = 50000
+# Serve loads from a memory-mapped Arrow snapshot of the table (needs pyarrow)
+COLUMNAR_SNAPSHOT_ENABLED = True
+# Connection pragmas: page size (new databases only), page cache and memory-mapped I/O
+SQLITE_PAGE_SIZE = 8192
+SQLITE_CACHE_SIZE_KIB = 64 * 1024
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
 
 DATA_DIR = os.path.join(PROJECT_ROOT, "BA", "data")
 RAW_DATA_PATH = os.path.join(DATA_DIR, "raw")
@@ -22,6 +35,20 @@ REDDIT_SUBREDDIT_NAME = "DotA2"
 REDDIT_POST_LIMIT = 1000
 REDDIT_COMMENT_LIMIT = 50
 REDDIT_MAX_POSTS_TO_PROCESS = 15
+# Raw comments are streamed as newline-delimited JSON; compression: None, "gzip" or "zstd"
+RAW_DATA_COMPRESSION = None
+# Number of submissions whose comment trees are fetched concurrently (1 = sequential)
+REDDIT_COMMENT_FETCH_WORKERS = 4
+# Shared client-side rate limit, charged per HTTP request to Reddit (OAuth clients get 100/min)
+REDDIT_REQUESTS_PER_MINUTE = 60
+REDDIT_RATE_LIMIT_BURST = 5
+# Search/top listings are cached on disk and shared by all events of a run
+REDDIT_LISTING_CACHE_DIR = os.path.join(DATA_DIR, "cache", "listings")
+REDDIT_LISTING_CACHE_TTL_SECONDS = 12 * 3600
+# Resume interrupted collections from the per-query checkpoint journal in RAW_DATA_PATH
+REDDIT_RESUME_FROM_CHECKPOINT = True
+# "sync" collects events one after another, "async" collects all events in one event loop
+REDDIT_SCRAPER_BACKEND = "sync"
 
 # --- Tournament Configurations ---
 TOURNAMENT_CONFIGS = {
@@ -51,9 +78,40 @@ TOURNAMENT_CONFIGS = {
     },
 }
 
+# --- Data Source ---
+# "reddit" scrapes when no processed data exists; "raw" always rebuilds from RAW_DATA_PATH
+DATA_SOURCE = "reddit"
+# Number of worker processes used to parse raw files in replay mode
+RAW_REPLAY_WORKERS = DEFAULT_WORKER_PROCESSES
+
 # --- Data Preprocessing Parameters ---
 PRE_EVENT_DAYS = 7
 POST_EVENT_DAYS = 5
+# Separator of the matched keyword terms stored in the 'matched_keywords' column
+MATCHED_KEYWORDS_SEPARATOR = "|"
+# Never download missing NLTK data; fail instead (for offline or locked-down machines)
+NLTK_OFFLINE = False
+# Worker processes and texts per task for batch text preprocessing; inputs of at most
+# one chunk are processed in the calling process
+TEXT_PREPROCESS_WORKERS = DEFAULT_WORKER_PROCESSES
+TEXT_PREPROCESS_CHUNK_SIZE = 2000
+# Bounded token -> lemma cache for WordNet lemmatization, kept on disk between runs
+LEMMA_CACHE_SIZE = 100000
+LEMMA_CACHE_PATH = os.path.join(DATA_DIR, "cache", "lemma_cache.json")
+# Batch VADER scoring: worker processes, texts per task and cached distinct texts
+SENTIMENT_WORKERS = DEFAULT_WORKER_PROCESSES
+SENTIMENT_CHUNK_SIZE = 2000
+SENTIMENT_CACHE_SIZE = 200000
+# Outputs of the prepare_data stages, keyed by their input data, code and settings
+STAGE_CACHE_ENABLED = True
+STAGE_CACHE_DIR = os.path.join(DATA_DIR, "cache", "stages")
+# Entries kept per stage; storing a new one deletes the least recently used (0 = no limit)
+STAGE_CACHE_MAX_ENTRIES_PER_STAGE = 64
+# Events processed in parallel worker processes by prepare_data (1 = one after another).
+# The pools do not nest: the text preprocessing and sentiment stages of events processed
+# in worker processes run in those processes, and their own pools are only used when
+# the events are processed one after another
+PREPARE_DATA_EVENT_WORKERS = DEFAULT_WORKER_PROCESSES
 
 
 def enrich_tournament_configs(configs, pre_days, post_days):
@@ -91,10 +149,15 @@ XGB_TUNING_CV_FOLDS = 3
 # SHAP Plotting Parameters
 SHAP_TOP_FEATURES_TO_PLOT = 10
 
+# Keyword Plotting Parameters
+KEYWORD_PLOT_TOP_N = 20  # Most frequent keywords shown in the keyword heatmaps
+
 # --- Output Paths for Models, Reports, and Figures ---
 MODELS_DIR = os.path.join(PROJECT_ROOT, "BA", "models")
 REPORTS_DIR = os.path.join(PROJECT_ROOT, "BA", "reports")
 FIGURES_DIR = os.path.join(REPORTS_DIR, "figures")
+# History of the entry point import times recorded by BA/src/utils/profile_imports.py
+IMPORT_PROFILE_HISTORY_PATH = os.path.join(REPORTS_DIR, "import_profile_history.jsonl")
 
 # --- Feature Lists for Model Training ---
 CATEGORICAL_FEATURES = [
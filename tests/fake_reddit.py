@@ -0,0 +1,190 @@
+"""
+A fake Reddit HTTP backend for the scraper tests. PRAW and prawcore run unchanged on
+top of it; only the HTTP session is replaced, so every request PRAW makes (token,
+listing pages, comment trees, morechildren batches) is served and recorded here.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+import praw
+
+from BA.src.data.reddit_scraper import RateLimitedRequestor
+
+SUBREDDIT = "dota2"
+POST_CREATED_UTC = 1720000000  # 2024-07-03
+
+
+class FakeResponse:
+    """The subset of requests.Response used by prawcore."""
+
+    def __init__(self, payload: Any) -> None:
+        self.status_code = 200
+        self.headers: Dict[str, str] = {}
+        self._payload = payload
+
+    def json(self) -> Any:
+        return self._payload
+
+
+def _listing(kind: str, children: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "kind": "Listing",
+        "data": {
+            "after": None,
+            "children": [{"kind": kind, "data": child} for child in children],
+        },
+    }
+
+
+def _post(index: int) -> Dict[str, Any]:
+    return {
+        "id": f"p{index}",
+        "name": f"t3_p{index}",
+        "title": f"Post {index}",
+        "url": f"https://example.com/p{index}",
+        "author": "poster",
+        "created_utc": POST_CREATED_UTC + index,
+        "score": 1000 - index,
+        "num_comments": 3,
+        "upvote_ratio": 0.9,
+        "is_self": True,
+        "selftext": f"Selftext {index}",
+        "link_flair_text": None,
+        "permalink": f"/r/{SUBREDDIT}/comments/p{index}/",
+        "subreddit": SUBREDDIT,
+    }
+
+
+def _comment(post_id: str, index: int) -> Dict[str, Any]:
+    return {
+        "id": f"{post_id}c{index}",
+        "name": f"t1_{post_id}c{index}",
+        "body": f"Comment {index} on {post_id}",
+        "author": "commenter",
+        "created_utc": POST_CREATED_UTC + 600,
+        "score": index,
+        "permalink": f"/r/{SUBREDDIT}/comments/{post_id}/_/{post_id}c{index}/",
+        "link_id": f"t3_{post_id}",
+        "parent_id": f"t3_{post_id}",
+        "replies": "",
+        "subreddit": SUBREDDIT,
+    }
+
+
+class FakeRedditSession:
+    """
+    Serves a subreddit with `num_posts` posts. Each comment tree holds one comment and a
+    "more comments" stub with two more, so replace_more issues a second request.
+
+    Args:
+        num_posts (int): Number of posts in the search and top listings.
+        comment_delay (float): Seconds each comment tree request takes.
+    """
+
+    def __init__(self, num_posts: int = 6, comment_delay: float = 0.0) -> None:
+        self.num_posts = num_posts
+        self.comment_delay = comment_delay
+        self.headers: Dict[str, str] = {}
+        self.requests: List[Dict[str, Any]] = []
+        # Threads that used each requestor, i.e. each Reddit instance
+        self.threads_by_requestor: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> FakeResponse:
+        path = urlparse(url).path.rstrip("/")
+        with self._lock:
+            self.requests.append(
+                {
+                    "time": time.monotonic(),
+                    "thread": threading.current_thread().name,
+                    "method": method.upper(),
+                    "path": path,
+                }
+            )
+
+        if path.endswith("/access_token"):
+            return FakeResponse(
+                {
+                    "access_token": "token",
+                    "expires_in": 3600,
+                    "scope": "*",
+                    "token_type": "bearer",
+                }
+            )
+        if path.endswith("/search") or path.endswith("/top"):
+            return FakeResponse(
+                _listing("t3", [_post(i) for i in range(self.num_posts)])
+            )
+        if path.startswith("/comments/"):
+            time.sleep(self.comment_delay)
+            post_id = path.split("/")[2]
+            more = {
+                "count": 2,
+                "children": [f"{post_id}c8", f"{post_id}c9"],
+                "id": f"{post_id}c8",
+                "name": f"t1_{post_id}c8",
+                "parent_id": f"t3_{post_id}",
+                "depth": 0,
+            }
+            comments = _listing("t1", [_comment(post_id, 1)])
+            comments["data"]["children"].append({"kind": "more", "data": more})
+            return FakeResponse([_listing("t3", [_post(int(post_id[1:]))]), comments])
+        if path.endswith("/morechildren"):
+            post_id = dict(kwargs["data"])["link_id"][len("t3_") :]
+            return FakeResponse(
+                {
+                    "json": {
+                        "errors": [],
+                        "data": {
+                            "things": [
+                                {"kind": "t1", "data": _comment(post_id, 8)},
+                                {"kind": "t1", "data": _comment(post_id, 9)},
+                            ]
+                        },
+                    }
+                }
+            )
+        raise ValueError(f"Unexpected request: {method} {url}")
+
+    def close(self) -> None:
+        pass
+
+
+def make_fake_reddit(session: FakeRedditSession) -> praw.Reddit:
+    """
+    Returns a Reddit instance whose requests go to `session`. Its requestor class records
+    in session.threads_by_requestor which threads used each requestor (and so each
+    Reddit instance), and clones made by the scraper inherit it.
+    """
+
+    class FakeRequestor(RateLimitedRequestor):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            kwargs["session"] = session
+            super().__init__(*args, **kwargs)
+
+        def request(self, *args: Any, **kwargs: Any) -> Any:
+            with session._lock:
+                session.threads_by_requestor.setdefault(id(self), set()).add(
+                    threading.current_thread().name
+                )
+            return super().request(*args, **kwargs)
+
+    return praw.Reddit(
+        client_id="fake-client",
+        client_secret="fake-secret",
+        user_agent="dota2 analysis tests",
+        requestor_class=FakeRequestor,
+        check_for_updates=False,
+    )
+
+
+def count_requests(session: FakeRedditSession, path_part: Optional[str] = None) -> int:
+    """Counts the recorded requests, optionally only those whose path contains path_part."""
+    return sum(
+        1
+        for request in session.requests
+        if path_part is None or path_part in request["path"]
+    )
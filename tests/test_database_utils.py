@@ -0,0 +1,182 @@
+import os
+
+import pandas as pd
+import pytest
+
+from BA.src.data import database_utils
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Points the database at a temporary data directory."""
+    monkeypatch.setattr(database_utils, "DATA_BASE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _comments(event_name, comment_ids, score=1):
+    count = len(comment_ids)
+    return pd.DataFrame(
+        {
+            "event_name": [event_name] * count,
+            "comment_id": list(comment_ids),
+            "comment_body": [f"{event_name} comment {c}" for c in comment_ids],
+            "comment_created_utc": pd.date_range(
+                "2024-09-01 12:00:00", periods=count, freq="h"
+            ),
+            "comment_score": [score + i for i in range(count)],
+            "is_self": [i % 2 == 0 for i in range(count)],
+            "compound_sentiment": [0.25 * i for i in range(count)],
+            "time_period": ["Pre-Event", "During-Event", "Post-Event"] * (count // 3)
+            + ["Pre-Event"] * (count % 3),
+        }
+    )
+
+
+def _load(**kwargs):
+    df = database_utils.load_data_from_sqlite(use_snapshot=False, **kwargs)
+    return df.sort_values(["event_name", "comment_id"], ignore_index=True)
+
+
+def test_repeated_upsert_replaces_the_stale_rows_of_one_event():
+    database_utils.upsert_data_to_sqlite(
+        pd.concat([_comments("OG_RM24", "abc"), _comments("TI13", "xyz")])
+    )
+    database_utils.upsert_data_to_sqlite(_comments("OG_RM24", "ab", score=50))
+
+    df = _load()
+    og = df[df["event_name"] == "OG_RM24"]
+    assert og["comment_id"].tolist() == ["a", "b"]
+    assert og["comment_score"].tolist() == [50, 51]
+    # Rows of other events are left as they are
+    assert df[df["event_name"] == "TI13"]["comment_id"].tolist() == ["x", "y", "z"]
+    assert database_utils.get_stored_event_names() == {"OG_RM24", "TI13"}
+
+
+def test_events_can_share_comment_ids():
+    database_utils.upsert_data_to_sqlite(
+        pd.concat(
+            [_comments("OG_RM24", "abc"), _comments("TOPSON_RM24", "bcd", score=10)]
+        )
+    )
+
+    df = _load()
+    assert len(df) == 6
+    shared = df[df["comment_id"] == "b"].set_index("event_name")["comment_score"]
+    assert shared.to_dict() == {"OG_RM24": 2, "TOPSON_RM24": 10}
+
+
+def test_empty_events_are_recorded_as_stored():
+    database_utils.upsert_data_to_sqlite(_comments("OG_RM24", "abc"))
+    database_utils.upsert_data_to_sqlite(
+        pd.DataFrame(), empty_event_names=["OG_RM24", "TI13"]
+    )
+
+    assert _load().empty
+    assert database_utils.get_stored_event_names() == {"OG_RM24", "TI13"}
+
+
+def test_empty_events_are_recorded_in_a_new_database():
+    database_utils.upsert_data_to_sqlite(pd.DataFrame(), empty_event_names=["TI13"])
+
+    assert database_utils.get_stored_event_names() == {"TI13"}
+
+
+@pytest.mark.parametrize("use_snapshot", [False, True])
+def test_projection_and_filters_with_limit(use_snapshot):
+    if use_snapshot:
+        pytest.importorskip("pyarrow")
+    database_utils.upsert_data_to_sqlite(
+        pd.concat([_comments("OG_RM24", "abcdef"), _comments("TI13", "uvwxyz")])
+    )
+
+    df = database_utils.load_data_from_sqlite(
+        columns=["comment_id", "comment_score", "not_a_column"],
+        event_names=["TI13"],
+        time_periods=["Pre-Event", "Post-Event"],
+        use_snapshot=use_snapshot,
+    )
+    assert list(df.columns) == ["comment_id", "comment_score"]
+    assert sorted(df["comment_id"]) == ["u", "w", "x", "z"]
+
+    limited = database_utils.load_data_from_sqlite(
+        columns=["event_name"],
+        event_names=["OG_RM24", "TI13"],
+        limit=3,
+        use_snapshot=use_snapshot,
+    )
+    assert len(limited) == 3
+    assert database_utils.load_data_from_sqlite(
+        event_names=[], use_snapshot=use_snapshot
+    ).empty
+
+
+def test_chunked_write_and_read_round_trip():
+    df = pd.concat(
+        [_comments("OG_RM24", "abcdefg"), _comments("TI13", "abcdefg", score=7)],
+        ignore_index=True,
+    )
+    chunks = (df.iloc[start : start + 4] for start in range(0, len(df), 4))
+    database_utils.save_data_to_sqlite(chunks, chunksize=3)
+
+    streamed = list(
+        database_utils.iter_data_from_sqlite(chunksize=5, event_names=["OG_RM24"])
+    )
+    assert [len(chunk) for chunk in streamed] == [5, 2]
+    pd.testing.assert_frame_equal(
+        pd.concat(streamed, ignore_index=True),
+        df[df["event_name"] == "OG_RM24"].reset_index(drop=True),
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(_load(), df, check_dtype=False)
+    assert list(_load().dtypes) == list(pd.concat(streamed).dtypes)
+
+
+def _load_from_snapshot_only():
+    return database_utils._load_from_snapshot(
+        database_utils._get_db_path(), None, None, None, None
+    )
+
+
+def test_snapshot_matches_sqlite():
+    pytest.importorskip("pyarrow")
+    df = pd.concat([_comments("OG_RM24", "abcd"), _comments("TI13", "abc")])
+    df.loc[df.index[0], "comment_body"] = None
+    database_utils.upsert_data_to_sqlite(df)
+
+    # The first load builds the snapshot
+    from_first_load = database_utils.load_data_from_sqlite()
+    from_sqlite = database_utils.load_data_from_sqlite(use_snapshot=False)
+    # Reading from SQLite must not make the snapshot look outdated
+    list(database_utils.iter_data_from_sqlite())
+    database_utils.get_stored_event_names()
+    from_snapshot = _load_from_snapshot_only()
+
+    assert from_snapshot is not None
+    pd.testing.assert_frame_equal(from_snapshot, from_sqlite)
+    pd.testing.assert_frame_equal(from_first_load, from_sqlite)
+
+
+def test_upsert_does_not_rewrite_the_snapshot():
+    pytest.importorskip("pyarrow")
+    database_utils.upsert_data_to_sqlite(_comments("OG_RM24", "abc"))
+    assert len(database_utils.load_data_from_sqlite()) == 3
+    snapshot_path = database_utils._get_snapshot_path()
+    with open(snapshot_path, "rb") as f:
+        old_snapshot = f.read()
+
+    database_utils.upsert_data_to_sqlite(_comments("TI13", "xyz"))
+
+    with open(snapshot_path, "rb") as f:
+        assert f.read() == old_snapshot
+    # The snapshot is outdated, so it is not used until a load rebuilds it
+    assert _load_from_snapshot_only() is None
+    assert len(database_utils.load_data_from_sqlite()) == 6
+    assert len(_load_from_snapshot_only()) == 6
+
+
+def test_snapshot_is_not_rebuilt_by_loads_from_sqlite():
+    pytest.importorskip("pyarrow")
+    database_utils.upsert_data_to_sqlite(_comments("OG_RM24", "abc"))
+
+    assert len(database_utils.load_data_from_sqlite(use_snapshot=False)) == 3
+    assert not os.path.exists(database_utils._get_snapshot_path())
@@ -0,0 +1,218 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from BA.src.features import feature_engineering
+from BA.src.features.text_features import contains_any_keyword
+
+
+def _apply(df, row_fn):
+    return df.apply(row_fn, axis=1).astype(float)
+
+
+@pytest.fixture
+def score_frame():
+    """Comments covering normal, same-second, earlier-than-post and missing values."""
+    post_time = pd.Timestamp("2024-07-01 12:00:00")
+    return pd.DataFrame(
+        {
+            "post_created_utc": [post_time] * 8,
+            "comment_created_utc": [
+                post_time + pd.Timedelta(days=2),
+                post_time + pd.Timedelta(hours=3, seconds=17),
+                post_time,  # zero days since the post
+                post_time - pd.Timedelta(minutes=5),  # clock skew
+                post_time + pd.Timedelta(seconds=1),
+                post_time + pd.Timedelta(days=400),
+                post_time + pd.Timedelta(days=1),
+                post_time + pd.Timedelta(hours=1),
+            ],
+            "comment_score": [10.0, -4.0, 7.0, 3.0, 1.0, 250.0, np.nan, 0.0],
+            "post_score": [99.0, 0.0, np.nan, 5.0, -2.0, 1.0, 12.0, np.nan],
+        }
+    )
+
+
+def test_comment_score_per_day_series_matches_row_wise(score_frame):
+    expected = _apply(score_frame, feature_engineering.calculate_comment_score_per_day)
+    result = feature_engineering.calculate_comment_score_per_day_series(score_frame)
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+    # A comment not newer than its post keeps its score
+    assert result.iloc[2] == 7.0
+    assert result.iloc[3] == 3.0
+    assert np.isnan(result.iloc[6])
+
+
+def test_comment_score_per_day_series_falls_back_for_object_timestamps(score_frame):
+    object_frame = score_frame.astype(
+        {"post_created_utc": object, "comment_created_utc": object}
+    )
+    expected = _apply(object_frame, feature_engineering.calculate_comment_score_per_day)
+    result = feature_engineering.calculate_comment_score_per_day_series(object_frame)
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_comment_to_post_score_ratio_series_matches_row_wise(score_frame):
+    expected = _apply(
+        score_frame, feature_engineering.calculate_comment_to_post_score_ratio
+    )
+    result = feature_engineering.calculate_comment_to_post_score_ratio_series(
+        score_frame
+    )
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+    # A missing or zero post score gives the comment score
+    assert result.iloc[1] == -4.0
+    assert result.iloc[2] == 7.0
+    assert np.isnan(result.iloc[6])
+
+
+def test_comment_to_post_score_ratio_series_missing_scores_give_zero():
+    df = pd.DataFrame({"comment_score": [np.nan, np.nan], "post_score": [np.nan, 0.0]})
+    expected = _apply(df, feature_engineering.calculate_comment_to_post_score_ratio)
+    result = feature_engineering.calculate_comment_to_post_score_ratio_series(df)
+
+    assert result.tolist() == expected.tolist() == [0.0, 0.0]
+
+
+def test_comment_to_post_score_ratio_series_is_infinite_for_post_score_minus_one():
+    df = pd.DataFrame({"comment_score": [5.0, -3.0], "post_score": [-1.0, -1.0]})
+
+    with np.errstate(divide="ignore"):
+        expected = _apply(df, feature_engineering.calculate_comment_to_post_score_ratio)
+    result = feature_engineering.calculate_comment_to_post_score_ratio_series(df)
+
+    assert result.tolist() == expected.tolist() == [np.inf, -np.inf]
+
+
+def test_categorize_post_type_logs_distribution_per_post(caplog):
+    df = pd.DataFrame(
+        {
+            "post_id": ["a", "a", "a", "b"],
+            "post_title": ["Team signs new player"] * 3 + ["Hello"],
+            "selftext": ["", "", "", ""],
+        }
+    )
+
+    with caplog.at_level("INFO", logger=feature_engineering.logger.name):
+        result = feature_engineering.categorize_post_type(df)
+
+    assert result["post_type"].tolist() == ["Player Transfer"] * 3 + ["Other"]
+    distribution = next(
+        r.getMessage() for r in caplog.records if "distribution" in r.getMessage()
+    )
+    assert "Player Transfer    1" in distribution
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    assert any("'Tournament Result'" in message for message in warnings)
+    assert not any("'Player Transfer'" in message for message in warnings)
+
+
+KEYWORD_CATEGORIES = {
+    "team": ["og", "team spirit", "tundra"],
+    "player": ["n0tail", "ana", "yatoro"],
+    "hero": ["anti-mage", "am", "ogre magi", "io"],
+    "event": ["ti", "the international", "riyadh masters"],
+}
+
+
+def _old_flag_and_count(texts, keyword_list):
+    """The per-category flag and distinct keyword count before the keyword tagger."""
+    flags = [contains_any_keyword(text, keyword_list) for text in texts]
+    counts = [
+        sum(contains_any_keyword(text, [keyword]) for keyword in keyword_list)
+        for text in texts
+    ]
+    return flags, counts
+
+
+@pytest.fixture
+def keyword_frame(monkeypatch):
+    monkeypatch.setattr(
+        feature_engineering, "get_dota2_teams", lambda: KEYWORD_CATEGORIES["team"]
+    )
+    monkeypatch.setattr(
+        feature_engineering,
+        "get_keywords",
+        lambda: {
+            "player_keywords": KEYWORD_CATEGORIES["player"],
+            "hero_keywords": KEYWORD_CATEGORIES["hero"],
+            "tournament_event_keywords": KEYWORD_CATEGORIES["event"],
+        },
+    )
+    return pd.DataFrame(
+        {
+            "comment_body": [
+                "OG and Team Spirit, then OG again",
+                "Tundra! tundras",
+                "no keywords",
+                None,
+                "og ana",
+            ],
+            "processed_comment_body": [
+                "ana play ogre magi at ti ti",
+                "yatoro anti-mage am io ti",
+                "",
+                "n0tail",
+                "og",
+            ],
+        },
+        index=[3, 1, 4, 1, 5],
+    )
+
+
+def test_add_keyword_features_matches_contains_any_keyword_per_category(
+    keyword_frame,
+):
+    df = feature_engineering.add_keyword_features(keyword_frame.copy())
+
+    for category, (
+        source_col,
+        flag_col,
+        count_col,
+    ) in feature_engineering.KEYWORD_CATEGORY_COLUMNS.items():
+        flags, counts = _old_flag_and_count(
+            keyword_frame[source_col], KEYWORD_CATEGORIES[category]
+        )
+        assert df[flag_col].tolist() == flags, category
+        assert df[count_col].tolist() == counts, category
+    assert df["team_keyword_count"].tolist() == [2, 1, 0, 0, 1]
+    assert df["hero_keyword_count"].tolist() == [1, 3, 0, 0, 0]
+
+
+def test_add_keyword_features_joins_distinct_matches_in_category_order(
+    keyword_frame,
+):
+    df = feature_engineering.add_keyword_features(keyword_frame.copy())
+
+    assert df["matched_keywords"].tolist() == [
+        "og|team spirit|ana|ogre magi|ti",
+        "tundra|yatoro|anti-mage|am|io|ti",
+        "",
+        "n0tail",
+        "og",
+    ]
+    # Every matched term belongs to a category whose flag is set
+    all_keywords = {
+        keyword: category
+        for category, keywords in KEYWORD_CATEGORIES.items()
+        for keyword in keywords
+    }
+    for _, row in df.iterrows():
+        for keyword in filter(None, row["matched_keywords"].split("|")):
+            _, flag_col, _ = feature_engineering.KEYWORD_CATEGORY_COLUMNS[
+                all_keywords[keyword]
+            ]
+            assert row[flag_col]
+
+
+def test_add_keyword_features_without_processed_text(keyword_frame):
+    df = feature_engineering.add_keyword_features(
+        keyword_frame.drop(columns=["processed_comment_body"])
+    )
+
+    assert df["contains_team_name"].tolist() == [True, True, False, False, True]
+    assert not df["contains_hero_keyword"].any()
+    assert (df["player_keyword_count"] == 0).all()
+    assert df["matched_keywords"].tolist() == ["og|team spirit", "tundra", "", "", "og"]
@@ -0,0 +1,40 @@
+import pandas as pd
+
+from BA.src.visualization.plots import explode_matched_keywords
+
+
+def _matched_frame():
+    return pd.DataFrame(
+        {
+            "event_name": ["TI13", "TI13", "OG_RM24", "OG_RM24", "TI13"],
+            "comment_id": ["a", "b", "c", "d", "e"],
+            "matched_keywords": ["og|ana|ti", "", "og", None, "ti|og"],
+        },
+        index=[7, 3, 5, 1, 0],
+    )
+
+
+def test_explode_matched_keywords_gives_one_row_per_comment_and_keyword():
+    exploded = explode_matched_keywords(_matched_frame())
+
+    assert list(exploded.columns) == ["event_name", "comment_id", "extracted_keyword"]
+    assert exploded.index.tolist() == list(range(6))
+    assert list(zip(exploded["comment_id"], exploded["extracted_keyword"])) == [
+        ("a", "og"),
+        ("a", "ana"),
+        ("a", "ti"),
+        ("c", "og"),
+        ("e", "ti"),
+        ("e", "og"),
+    ]
+    # Comments without a matched keyword are dropped
+    assert not {"b", "d"} & set(exploded["comment_id"])
+
+
+def test_explode_matched_keywords_keeps_the_top_keywords():
+    exploded = explode_matched_keywords(
+        _matched_frame(), keyword_col="keyword", top_n=2
+    )
+
+    assert exploded["keyword"].value_counts().to_dict() == {"og": 3, "ti": 2}
+    assert exploded["comment_id"].tolist() == ["a", "a", "c", "e", "e"]
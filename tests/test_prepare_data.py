@@ -0,0 +1,97 @@
+import nltk
+import pandas as pd
+import pytest
+
+import config
+from BA.src.data import prepare_data
+from BA.src.data.stage_cache import StageCache
+from BA.src.features import text_features
+
+
+class NoProcessPool:
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("A stage started a process pool.")
+
+
+@pytest.fixture
+def event_frame(monkeypatch):
+    """The first event with a raw file, with stage pools that would start for it."""
+    event_frames = prepare_data.load_raw_event_frames(
+        config.TOURNAMENT_CONFIGS, max_workers=1
+    )
+    if not event_frames:
+        pytest.skip("No raw data files for the configured events.")
+    event_key, df = next(iter(event_frames.items()))
+
+    monkeypatch.setattr(text_features, "ProcessPoolExecutor", NoProcessPool)
+    for name in ("TEXT_PREPROCESS_WORKERS", "SENTIMENT_WORKERS"):
+        monkeypatch.setattr(config, name, 4, raising=False)
+    for name in ("TEXT_PREPROCESS_CHUNK_SIZE", "SENTIMENT_CHUNK_SIZE"):
+        monkeypatch.setattr(config, name, 10, raising=False)
+    return event_key, df
+
+
+@pytest.fixture
+def require_nltk_data():
+    for resource in text_features.NLTK_DATA_PACKAGES.values():
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            pytest.skip(f"NLTK data '{resource}' is not installed.")
+
+
+def test_stages_of_an_event_worker_do_not_start_process_pools(
+    event_frame, require_nltk_data
+):
+    event_key, df = event_frame
+
+    processed = prepare_data._process_event_in_worker(
+        df.copy(),
+        event_key,
+        config.TOURNAMENT_CONFIGS[event_key],
+        None,
+        StageCache(enabled=False),
+    )[0]
+
+    assert not processed.empty
+
+
+def test_stages_outside_the_event_pool_use_their_process_pools(event_frame):
+    event_key, df = event_frame
+
+    with pytest.raises(AssertionError, match="process pool"):
+        prepare_data.process_event_comments(
+            df.copy(),
+            event_key,
+            config.TOURNAMENT_CONFIGS[event_key],
+            stage_cache=StageCache(enabled=False),
+        )
+
+
+def test_stored_events_are_returned_when_reddit_is_unavailable(tmp_path, monkeypatch):
+    from BA.src.data import database_utils, reddit_scraper
+
+    monkeypatch.setattr(database_utils, "DATA_BASE_DIR", str(tmp_path))
+    database_utils.upsert_data_to_sqlite(
+        pd.DataFrame(
+            {
+                "event_name": ["TI13", "TI13", "OG_RM24"],
+                "comment_id": ["a", "b", "a"],
+                "comment_score": [1, 2, 3],
+            }
+        )
+    )
+    monkeypatch.setattr(
+        config,
+        "TOURNAMENT_CONFIGS",
+        {key: {"event_name": key} for key in ("TI13", "OG_RM24", "TI8")},
+    )
+
+    def no_credentials():
+        raise ValueError("Reddit API credentials not found.")
+
+    monkeypatch.setattr(reddit_scraper, "get_reddit_instance", no_credentials)
+
+    df = prepare_data.prepare_data(source="reddit", use_stage_cache=False)
+
+    assert sorted(df["event_name"]) == ["OG_RM24", "TI13", "TI13"]
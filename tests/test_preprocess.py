@@ -0,0 +1,225 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from BA.src.data import preprocess
+
+
+def _event(start, end, name, pre_days=7, post_days=5):
+    return {
+        "start_date": start,
+        "end_date": end,
+        "pre_event_start": start - datetime.timedelta(days=pre_days),
+        "post_event_end": end + datetime.timedelta(days=post_days),
+        "event_name": name,
+    }
+
+
+@pytest.fixture
+def overlapping_events():
+    """Two events whose windows overlap without being identical."""
+    return {
+        "OG_RM24": _event(
+            datetime.datetime(2024, 7, 4),
+            datetime.datetime(2024, 7, 28, 23, 59, 59),
+            "OG_RM24",
+        ),
+        "TOPSON_RM24": _event(
+            datetime.datetime(2024, 7, 20),
+            datetime.datetime(2024, 8, 5, 23, 59, 59),
+            "Topson_RM24",
+        ),
+    }
+
+
+def _boundary_timestamps(events):
+    """Every window boundary of the events, and the nanoseconds around them."""
+    one_ns = pd.Timedelta(1, "ns")
+    boundaries = [
+        pd.Timestamp(params[date])
+        for params in events.values()
+        for date in ("pre_event_start", "start_date", "end_date", "post_event_end")
+    ]
+    return pd.Series(
+        sorted(
+            {
+                b + offset
+                for b in boundaries
+                for offset in (-one_ns, pd.Timedelta(0), one_ns)
+            }
+        )
+        + [pd.NaT]
+    )
+
+
+def test_categorize_matches_the_single_event_series(overlapping_events):
+    index = preprocess.EventIntervalIndex(overlapping_events)
+    timestamps = _boundary_timestamps(overlapping_events)
+
+    for event_key, params in overlapping_events.items():
+        expected = preprocess.categorize_time_period_series(
+            timestamps,
+            params["start_date"],
+            params["end_date"],
+            params["pre_event_start"],
+            params["post_event_end"],
+        )
+        pd.testing.assert_series_equal(
+            index.categorize(timestamps, event_key), expected
+        )
+
+
+def test_categorize_of_an_unknown_event_raises(overlapping_events):
+    index = preprocess.EventIntervalIndex(overlapping_events)
+
+    with pytest.raises(KeyError):
+        index.categorize(pd.Series([pd.Timestamp("2024-07-20")]), "TI13")
+
+
+def test_attribute_assigns_comments_to_every_overlapping_event(overlapping_events):
+    index = preprocess.EventIntervalIndex(overlapping_events)
+    timestamps = pd.Series(
+        pd.to_datetime(
+            [
+                "2024-06-26 23:59:59.999999999",  # before both windows
+                "2024-06-27 00:00:00",  # OG pre-event start, inclusive
+                "2024-07-03 23:59:59.999999999",  # OG still before the event
+                "2024-07-20 00:00:00",  # both events
+                "2024-07-28 23:59:59",  # OG end, inclusive
+                "2024-07-28 23:59:59.000000001",  # OG after the event
+                "2024-08-02 23:59:59.000000001",  # past the OG window
+                None,
+            ],
+            format="ISO8601",
+        ),
+        index=list("abcdefgh"),
+    )
+
+    result = index.attribute(timestamps)
+
+    assert list(zip(result.index, result["event_key"], result["time_period"])) == [
+        ("b", "OG_RM24", "Before Event"),
+        ("c", "OG_RM24", "Before Event"),
+        ("d", "OG_RM24", "During Event"),
+        ("d", "TOPSON_RM24", "During Event"),
+        ("e", "OG_RM24", "During Event"),
+        ("e", "TOPSON_RM24", "During Event"),
+        ("f", "OG_RM24", "After Event"),
+        ("f", "TOPSON_RM24", "During Event"),
+        ("g", "TOPSON_RM24", "During Event"),
+    ]
+    assert result.loc["d", "event_name"].tolist() == ["OG_RM24", "Topson_RM24"]
+    for event_key, params in overlapping_events.items():
+        rows = result[result["event_key"] == event_key]
+        expected_days = preprocess.calculate_days_from_event_start_series(
+            timestamps.loc[rows.index], params["start_date"]
+        )
+        np.testing.assert_array_equal(
+            rows["days_from_event_start"].to_numpy(), expected_days.to_numpy()
+        )
+
+
+def test_attribute_matches_categorize_on_the_boundaries(overlapping_events):
+    index = preprocess.EventIntervalIndex(overlapping_events)
+    timestamps = _boundary_timestamps(overlapping_events)
+
+    result = index.attribute(timestamps)
+
+    for event_key in overlapping_events:
+        periods = index.categorize(timestamps, event_key)
+        inside = periods[periods != "Outside Window"]
+        rows = result[result["event_key"] == event_key]
+        assert rows.index.tolist() == inside.index.tolist()
+        assert rows["time_period"].tolist() == inside.tolist()
+
+
+EVENT = _event(
+    datetime.datetime(2024, 7, 4), datetime.datetime(2024, 7, 28, 23, 59, 59), "OG_RM24"
+)
+EVENT_DATES = tuple(
+    EVENT[date]
+    for date in ("start_date", "end_date", "pre_event_start", "post_event_end")
+)
+
+
+def _row_wise_periods(timestamps):
+    return timestamps.apply(
+        lambda timestamp: preprocess.categorize_time_period(timestamp, *EVENT_DATES)
+    )
+
+
+def _series_periods(timestamps):
+    return preprocess.categorize_time_period_series(timestamps, *EVENT_DATES)
+
+
+def test_time_period_series_matches_row_wise_on_the_boundaries():
+    timestamps = _boundary_timestamps({"OG_RM24": EVENT})
+
+    result = _series_periods(timestamps)
+
+    assert result.tolist() == _row_wise_periods(timestamps).tolist()
+    assert set(result) == {
+        "Outside Window",
+        "Before Event",
+        "During Event",
+        "After Event",
+    }
+    assert result.iloc[-1] == "Outside Window"  # NaT
+
+
+def test_time_period_series_matches_row_wise_for_strings():
+    timestamps = pd.Series(
+        [
+            "2024-06-26 23:59:59",
+            "2024-06-27 00:00:00",
+            "2024-07-04T00:00:00",
+            "2024-07-28 23:59:59.000001",
+            "2024-08-02",
+            "not a date",
+        ]
+    )
+
+    result = _series_periods(timestamps)
+
+    assert result.tolist() == _row_wise_periods(timestamps).tolist()
+    assert result.iloc[5] == "Error: Invalid Timestamp Format"
+
+
+def test_time_period_series_matches_row_wise_for_epoch_seconds():
+    seconds = [
+        pd.Timestamp(date).timestamp() + offset
+        for date in EVENT_DATES
+        for offset in (-1, 0, 1)
+    ]
+    for timestamps in (pd.Series(seconds).astype("int64"), pd.Series(seconds) + 0.5):
+        assert (
+            _series_periods(timestamps).tolist()
+            == _row_wise_periods(timestamps).tolist()
+        )
+
+
+def test_days_from_event_start_series_matches_row_wise():
+    start = EVENT_DATES[0]
+    timestamps = pd.Series(
+        [
+            pd.Timestamp(start) + pd.Timedelta(offset)
+            for offset in ("-1ns", "0s", "1ns", "-1h", "23h59min", "1D", "-8D", "30D")
+        ]
+        + [pd.NaT]
+    )
+    expected = timestamps.apply(
+        lambda timestamp: preprocess.calculate_days_from_event_start(timestamp, start)
+    )
+
+    result = preprocess.calculate_days_from_event_start_series(timestamps, start)
+
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy(dtype=float))
+    assert result.tolist()[:8] == [-1, 0, 0, -1, 0, 1, -8, 30]
+    assert (
+        preprocess.calculate_days_from_event_start_series(
+            timestamps.dropna(), start
+        ).dtype
+        == np.int64
+    )
@@ -0,0 +1,116 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import config
+from BA.src.data import raw_io
+
+
+def _records(count=3):
+    return [
+        {
+            "post_id": "p0",
+            "post_title": "Grand Final — TI13",
+            "post_created_utc": pd.Timestamp("2024-09-15 12:00:00"),
+            "comment_id": f"c{i}",
+            "comment_body": f"Comment {i}\nwith a line break and ünïcode",
+            "comment_created_utc": pd.Timestamp("2024-09-15 12:30:00")
+            + pd.Timedelta(minutes=i),
+            "comment_score": i - 1,
+            "link_flair_text": None,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_writer_round_trip(tmp_path, monkeypatch, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    monkeypatch.setattr(config, "RAW_DATA_PATH", str(tmp_path), raising=False)
+    path = raw_io.raw_data_file_path("comments", compression)
+    records = _records()
+
+    with raw_io.RawCommentWriter(path) as writer:
+        writer.write(records[0])
+        writer.write_many(records[1:])
+
+    assert writer.records_written == 3
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+    assert raw_io.compression_from_path(path) == compression
+    assert list(raw_io.iter_raw_comments(path)) == records
+    unparsed = list(raw_io.iter_raw_comments(path, parse_dates=False))
+    assert unparsed[0]["comment_created_utc"] == "2024-09-15T12:30:00"
+    pd.testing.assert_frame_equal(
+        raw_io.load_raw_comments_frame(path), pd.DataFrame(records)
+    )
+
+
+def test_part_file_is_removed_when_the_block_raises(tmp_path):
+    path = str(tmp_path / "comments.jsonl")
+
+    with pytest.raises(RuntimeError):
+        with raw_io.RawCommentWriter(path) as writer:
+            writer.write_many(_records())
+            assert os.path.exists(f"{path}.part")
+            raise RuntimeError("scraper failed")
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_writer_without_records_leaves_no_file(tmp_path):
+    path = str(tmp_path / "comments.jsonl.gz")
+
+    with raw_io.RawCommentWriter(path) as writer:
+        pass
+
+    assert writer.close() is False
+    assert os.listdir(tmp_path) == []
+
+
+def test_malformed_lines_are_skipped(tmp_path, caplog):
+    path = str(tmp_path / "comments.jsonl")
+    records = _records()
+    with raw_io.RawCommentWriter(path) as writer:
+        writer.write_many(records)
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    with open(path, "w", encoding="utf-8") as f:
+        # A broken line, a blank line and a truncated last line
+        f.write("\n".join([lines[0], "{not json", "", lines[1], lines[2][:20]]))
+
+    assert list(raw_io.iter_raw_comments(path)) == records[:2]
+    assert "Skipping malformed line 2" in caplog.text
+    assert "Skipping malformed line 5" in caplog.text
+
+
+def test_legacy_json_files_are_read(tmp_path):
+    path = str(tmp_path / "comments.json")
+    records = _records()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([raw_io.serialize_comment_record(r) for r in records], f)
+
+    assert list(raw_io.iter_raw_comments(path)) == records
+
+
+def test_find_raw_data_file_picks_the_newest_format(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RAW_DATA_PATH", str(tmp_path), raising=False)
+    basename = raw_io.raw_data_basename(
+        "TI 2024/finals", pd.Timestamp("2024-09-01"), pd.Timestamp("2024-09-30")
+    )
+    assert basename == "raw_reddit_comments_TI_2024_finals_20240901_20240930"
+    assert raw_io.find_raw_data_file(basename) is None
+
+    mtimes = {".json": 300, ".jsonl.gz": 100, ".jsonl": 200}
+    for extension, mtime in mtimes.items():
+        path = tmp_path / f"{basename}{extension}"
+        path.write_text("[]", encoding="utf-8")
+        os.utime(path, (mtime, mtime))
+    # Files of other basenames are ignored
+    (tmp_path / f"{basename}_other.jsonl").write_text("", encoding="utf-8")
+
+    assert raw_io.find_raw_data_file(basename) == str(tmp_path / f"{basename}.json")
+    os.utime(tmp_path / f"{basename}.jsonl.gz", (400, 400))
+    assert raw_io.find_raw_data_file(basename) == str(tmp_path / f"{basename}.jsonl.gz")
@@ -0,0 +1,224 @@
+import asyncio
+import datetime
+import os
+import time
+
+import pytest
+
+import config
+from BA.src.data import reddit_scraper
+from tests.fake_reddit import FakeRedditSession, count_requests, make_fake_reddit
+
+START_DATE = datetime.datetime(2024, 1, 1)
+END_DATE = datetime.datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def scraper_env(tmp_path, monkeypatch):
+    """Isolates raw data, checkpoints and listing caches, with a generous rate limit."""
+    monkeypatch.setattr(config, "RAW_DATA_PATH", str(tmp_path / "raw"), raising=False)
+    monkeypatch.setattr(config, "RAW_DATA_COMPRESSION", None, raising=False)
+    monkeypatch.setattr(config, "REDDIT_LISTING_CACHE_TTL_SECONDS", 0, raising=False)
+    monkeypatch.setattr(
+        reddit_scraper, "_rate_limiter", reddit_scraper.TokenBucket(60000, 100)
+    )
+    reddit_scraper.clear_listing_cache()
+    yield tmp_path
+    reddit_scraper.clear_listing_cache()
+
+
+def _collect(session, max_workers):
+    subreddit = make_fake_reddit(session).subreddit("dota2")
+    return reddit_scraper.get_posts_and_comments(
+        subreddit,
+        "test query",
+        START_DATE,
+        END_DATE,
+        max_posts_to_process=session.num_posts,
+        max_workers=max_workers,
+        resume=False,
+    )
+
+
+def test_concurrent_fetch_matches_sequential_and_is_faster(scraper_env):
+    sequential_session = FakeRedditSession(num_posts=6, comment_delay=0.1)
+    start = time.perf_counter()
+    sequential = _collect(sequential_session, max_workers=1)
+    sequential_seconds = time.perf_counter() - start
+
+    concurrent_session = FakeRedditSession(num_posts=6, comment_delay=0.1)
+    start = time.perf_counter()
+    concurrent = _collect(concurrent_session, max_workers=6)
+    concurrent_seconds = time.perf_counter() - start
+
+    # 6 posts with 3 comments each (one loaded with the tree, two via replace_more)
+    assert len(sequential) == 18
+    assert concurrent == sequential
+    assert concurrent_seconds < 0.5 * sequential_seconds
+
+
+def test_worker_threads_never_share_a_reddit_instance(scraper_env):
+    session = FakeRedditSession(num_posts=6, comment_delay=0.05)
+    _collect(session, max_workers=3)
+
+    comment_threads = {
+        request["thread"]
+        for request in session.requests
+        if request["path"].startswith("/comments/")
+    }
+    assert len(comment_threads) == 3
+    assert all(len(threads) == 1 for threads in session.threads_by_requestor.values())
+
+
+def test_rate_limit_is_charged_per_http_request(scraper_env, monkeypatch):
+    rate_per_minute = 1200  # one request every 50 ms
+    bucket = reddit_scraper.TokenBucket(rate_per_minute, capacity=1)
+    acquired = []
+    original_acquire = bucket.acquire
+
+    def counting_acquire(tokens=1.0):
+        acquired.append(tokens)
+        original_acquire(tokens)
+
+    monkeypatch.setattr(bucket, "acquire", counting_acquire)
+    monkeypatch.setattr(reddit_scraper, "_rate_limiter", bucket)
+
+    session = FakeRedditSession(num_posts=4)
+    records = _collect(session, max_workers=4)
+
+    assert len(records) == 12
+    # replace_more issues a morechildren request per post on top of the comment tree
+    assert count_requests(session, "/morechildren") == 4
+    assert len(acquired) == len(session.requests)
+
+    interval = 60.0 / rate_per_minute
+    times = sorted(request["time"] for request in session.requests)
+    for i, request_time in enumerate(times):
+        # The bucket starts with one token, then refills at the configured rate
+        assert request_time - times[0] >= (i - 1) * interval - 0.01
+
+
+def test_async_collection_matches_sync_and_streams_records(scraper_env, monkeypatch):
+    sync_records = _collect(FakeRedditSession(num_posts=6), max_workers=1)
+
+    session = FakeRedditSession(num_posts=6, comment_delay=0.05)
+    comment_requests_at_write = []
+    open_raw_writer = reddit_scraper._open_raw_writer
+
+    def spying_open_raw_writer(*args):
+        writer = open_raw_writer(*args)
+        write_many = writer.write_many
+
+        def spying_write_many(records):
+            comment_requests_at_write.append(count_requests(session, "/comments/"))
+            write_many(records)
+
+        writer.write_many = spying_write_many
+        return writer
+
+    monkeypatch.setattr(reddit_scraper, "_open_raw_writer", spying_open_raw_writer)
+    reddit_scraper.clear_listing_cache()
+    async_records = asyncio.run(
+        reddit_scraper.async_get_posts_and_comments(
+            make_fake_reddit(session).subreddit("dota2"),
+            "test query",
+            START_DATE,
+            END_DATE,
+            max_posts_to_process=6,
+            semaphore=asyncio.Semaphore(2),
+            resume=False,
+        )
+    )
+
+    assert async_records == sync_records
+    # The first submission is written before the last comment tree is requested
+    assert len(comment_requests_at_write) == 6
+    assert comment_requests_at_write[0] < 6
+    assert all(len(threads) == 1 for threads in session.threads_by_requestor.values())
+    raw_files = list((scraper_env / "raw").glob("*.jsonl"))
+    assert len(raw_files) == 1
+    assert len(raw_files[0].read_text(encoding="utf-8").splitlines()) == 18
+
+
+def test_in_process_listing_cache_expires_after_ttl(scraper_env, monkeypatch):
+    monkeypatch.setattr(
+        config, "REDDIT_LISTING_CACHE_DIR", str(scraper_env / "listings"), raising=False
+    )
+    monkeypatch.setattr(config, "REDDIT_LISTING_CACHE_TTL_SECONDS", 0.2, raising=False)
+    session = FakeRedditSession(num_posts=2)
+    subreddit = make_fake_reddit(session).subreddit("dota2")
+
+    first = reddit_scraper._get_cached_listing(subreddit, "top", 10, "year")
+    second = reddit_scraper._get_cached_listing(subreddit, "top", 10, "year")
+    assert second is first
+    assert count_requests(session, "/top") == 1
+
+    time.sleep(0.3)
+    reddit_scraper._get_cached_listing(subreddit, "top", 10, "year")
+    assert count_requests(session, "/top") == 2
+
+
+def test_completed_run_without_comments_removes_the_checkpoint(scraper_env):
+    journal, _ = reddit_scraper._open_checkpoint(
+        "test query", START_DATE, END_DATE, True
+    )
+    journal.append("p0", [])
+    writer = reddit_scraper._open_raw_writer("test query", START_DATE, END_DATE)
+
+    reddit_scraper._finish_raw_writer(writer, journal, "test query")
+
+    assert not os.path.exists(journal.path)
+    assert not os.path.exists(writer.path)
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_resume_skips_journaled_submissions_and_keeps_submission_order(
+    scraper_env, max_workers
+):
+    full = _collect(FakeRedditSession(num_posts=6), max_workers=1)
+    journaled_ids = ["p1", "p3"]
+    journal, _ = reddit_scraper._open_checkpoint(
+        "test query", START_DATE, END_DATE, True
+    )
+    journaled = {}
+    for post_id in journaled_ids:
+        # Mark the journaled records so the result shows where they came from
+        journaled[post_id] = [
+            {**record, "comment_body": f"journaled {record['comment_id']}"}
+            for record in full
+            if record["post_id"] == post_id
+        ]
+        journal.append(post_id, journaled[post_id])
+    # Serve the listings of the resumed run from the new session as well
+    reddit_scraper.clear_listing_cache()
+
+    session = FakeRedditSession(num_posts=6)
+    subreddit = make_fake_reddit(session).subreddit("dota2")
+    resumed = reddit_scraper.get_posts_and_comments(
+        subreddit,
+        "test query",
+        START_DATE,
+        END_DATE,
+        max_posts_to_process=session.num_posts,
+        max_workers=max_workers,
+        resume=True,
+    )
+
+    for post_id in journaled_ids:
+        assert count_requests(session, f"/comments/{post_id}") == 0
+    assert count_requests(session, "/comments/") == 4
+    assert count_requests(session, "/morechildren") == 4
+    expected = [
+        (
+            {**record, "comment_body": f"journaled {record['comment_id']}"}
+            if record["post_id"] in journaled_ids
+            else record
+        )
+        for record in full
+    ]
+    assert resumed == expected
+    assert [record["post_id"] for record in resumed] == [
+        f"p{i}" for i in range(6) for _ in range(3)
+    ]
+    # The journal is removed once the run is complete
+    assert not os.path.exists(journal.path)
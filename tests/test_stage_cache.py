@@ -0,0 +1,67 @@
+import importlib.util
+import os
+import time
+
+import pandas as pd
+
+from BA.src.data.stage_cache import StageCache
+
+
+def _run(cache, value):
+    df = pd.DataFrame({"value": [value]})
+    return cache.run_frame("double", df, lambda frame: frame * 2, settings={})
+
+
+def _entries(cache, stage="double"):
+    return sorted(os.listdir(os.path.join(cache.directory, stage)))
+
+
+def test_store_keeps_the_most_recently_used_entries(tmp_path):
+    cache = StageCache(str(tmp_path), enabled=True, max_entries_per_stage=2)
+
+    _run(cache, 1)
+    time.sleep(0.02)
+    _run(cache, 2)
+    first_two = _entries(cache)
+    time.sleep(0.02)
+    _run(cache, 1)  # a hit marks the entry as used
+    time.sleep(0.02)
+    _run(cache, 3)
+
+    assert len(_entries(cache)) == 2
+    assert cache.stats["double"] == {"hits": 1, "misses": 3}
+    # The entry for 2 was used least recently, so it was deleted
+    _run(cache, 1)
+    assert cache.stats["double"]["hits"] == 2
+    assert len(set(first_two) & set(_entries(cache))) == 1
+
+
+def test_prune_without_limit_keeps_everything(tmp_path):
+    cache = StageCache(str(tmp_path), enabled=True, max_entries_per_stage=0)
+    for value in range(5):
+        _run(cache, value)
+
+    assert len(_entries(cache)) == 5
+    assert cache.prune(max_entries=3) == 2
+    assert len(_entries(cache)) == 3
+
+
+def test_editing_the_stage_code_causes_a_miss(tmp_path):
+    stage_module = tmp_path / "stage_code.py"
+    stage_module.write_text("FACTOR = 2\n")
+    spec = importlib.util.spec_from_file_location("stage_code", stage_module)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    cache = StageCache(str(tmp_path / "cache"), enabled=True)
+    df = pd.DataFrame({"value": [1]})
+
+    def run():
+        return cache.run_frame("double", df, lambda frame: frame * 2, code=(module,))
+
+    run()
+    run()
+    assert cache.stats["double"] == {"hits": 1, "misses": 1}
+
+    stage_module.write_text("FACTOR = 3\n")
+    run()
+    assert cache.stats["double"] == {"hits": 1, "misses": 2}
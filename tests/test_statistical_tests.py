@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from BA.src.analysis import statistical_tests
+
+
+@pytest.fixture
+def comments():
+    """Comments of three events with skewed scores, missing values and categories."""
+    rng = np.random.default_rng(0)
+    size = 1000
+    df = pd.DataFrame(
+        {
+            "event_name": rng.choice(["TI13", "OG_RM24", "TOPSON_RM24"], size=size),
+            "comment_score": rng.lognormal(2.0, 1.5, size=size).round() - 3,
+            "time_period": rng.choice(
+                ["Pre-Event", "During-Event", "Post-Event"], size
+            ),
+            "post_type": rng.choice(["Match", "Meme", "Discussion", None], size),
+        }
+    )
+    df.loc[rng.choice(size, 50, replace=False), "comment_score"] = np.nan
+    df.loc[rng.choice(size, 20, replace=False), "event_name"] = None
+    return df
+
+
+def _chunks(df, size=77):
+    return (df.iloc[start : start + size] for start in range(0, len(df), size))
+
+
+def test_group_moments_match_pandas(comments):
+    moments = statistical_tests.compute_group_moments(
+        _chunks(comments), "event_name", "comment_score"
+    )
+    expected = comments.groupby("event_name")["comment_score"].agg(
+        ["count", "mean", "std"]
+    )
+
+    pd.testing.assert_frame_equal(
+        moments.sort_index(), expected, check_dtype=False, check_names=False
+    )
+
+
+def test_chunked_t_test_matches_the_dataframe_version(comments):
+    args = ("event_name", "comment_score", "TI13", "OG_RM24")
+    expected = statistical_tests.perform_independent_t_test(comments, *args)
+    result = statistical_tests.perform_independent_t_test_from_chunks(
+        _chunks(comments), *args
+    )
+
+    assert result["status"] == expected["status"] == "completed"
+    for key in ("t_statistic", "p_value", "group1_mean", "group2_mean"):
+        assert result[key] == pytest.approx(expected[key], rel=1e-9)
+
+
+def test_chunked_anova_matches_the_dataframe_version(comments):
+    expected = statistical_tests.perform_anova_test(
+        comments, "event_name", "comment_score"
+    )
+    result = statistical_tests.perform_anova_test_from_chunks(
+        _chunks(comments), "event_name", "comment_score"
+    )
+
+    assert result["status"] == expected["status"] == "completed"
+    for key in ("f_statistic", "p_value"):
+        assert result[key] == pytest.approx(expected[key], rel=1e-9)
+
+
+def test_chunked_chi_squared_test_matches_the_dataframe_version(comments):
+    expected = statistical_tests.perform_chi_squared_test(
+        comments, "time_period", "post_type"
+    )
+    result = statistical_tests.perform_chi_squared_test_from_chunks(
+        _chunks(comments), "time_period", "post_type"
+    )
+
+    assert result["status"] == expected["status"] == "completed"
+    assert result["dof"] == expected["dof"]
+    for key in ("chi2_statistic", "p_value"):
+        assert result[key] == pytest.approx(expected[key], rel=1e-9)
+    np.testing.assert_allclose(result["expected_freq"], expected["expected_freq"])
+
+
+def test_chunked_t_test_skips_groups_with_fewer_than_two_values(comments):
+    result = statistical_tests.perform_independent_t_test_from_chunks(
+        _chunks(comments), "event_name", "comment_score", "TI13", "TI8"
+    )
+
+    assert result["status"] == "skipped"
@@ -0,0 +1,438 @@
+import glob
+import os
+import random
+import re
+import string
+import sys
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import config
+from BA.src.data.raw_io import iter_raw_comments
+from BA.src.features import text_features
+
+RAW_DATA_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "BA", "data", "raw")
+
+ADVERSARIAL_TEXTS = [
+    # URLs and mentions, also run together with each other
+    "Check https://liquipedia.net/dota2/TI, www.dota2.com and http://x.co/a?b=1!",
+    "@http://x.com hi",
+    "@abchttp://x y",
+    "a@www.q b",
+    "#http://a",
+    "@#abc",
+    "@user_1 #tag 42nd",
+    "sa@wwwx",
+    "https://t.co/x)",
+    "@",
+    # Digits, including non-ASCII ones
+    "Team Spirit won 3-2 in 2023, MVP had 1,234 GPM",
+    "İstanbul ÅB 123 ١٢٣ x²",
+    # Non-ASCII punctuation and contractions word_tokenize splits
+    "I’m “quoted” — dash… ok",
+    "don’t can’t won't",
+    "gonna wanna cannot whatcha gotta",
+    "a.b.c",
+    "\x00a\x1cb\tc\n\nd",
+    "",
+    None,
+    3.5,
+]
+
+
+def _old_remove_urls_and_mentions(text):
+    """The URL, mention and hashtag substitutions of the old clean_text."""
+    text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
+    return re.sub(r"\@\w+|\#", "", text)
+
+
+def _old_remove_punctuation_and_digits(text):
+    """The punctuation and digit removal of the old clean_text."""
+    text = text.translate(str.maketrans("", "", string.punctuation))
+    return re.sub(r"\d+", "", text)
+
+
+def _old_clean_text(text):
+    """The clean_text regex chain before the passes were fused."""
+    if not isinstance(text, str):
+        text = str(text)
+    text = _old_remove_urls_and_mentions(text.lower())
+    text = _old_remove_punctuation_and_digits(text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _old_tokenize(text):
+    cleaned_text = _old_clean_text(text)
+    return text_features.word_tokenize(cleaned_text) if cleaned_text else []
+
+
+def _raw_texts():
+    texts = []
+    for path in sorted(glob.glob(os.path.join(RAW_DATA_DIR, "*"))):
+        if ".checkpoint." in path:
+            continue
+        for record in iter_raw_comments(path, parse_dates=False):
+            texts.extend(
+                record.get(field)
+                for field in ("comment_body", "post_title", "selftext")
+            )
+    return texts
+
+
+def _fuzzed_texts(count=2000):
+    rng = random.Random(0)
+    alphabet = list("ab @#:/.htpw1١’ \n_é") + ["http", "www", "gonna", "can", "not"]
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        for _ in range(count)
+    ]
+
+
+def _require_nltk_data(*data_names):
+    nltk = pytest.importorskip("nltk")
+    for data_name in data_names:
+        resource = text_features.NLTK_DATA_PACKAGES[data_name]
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            pytest.skip(f"NLTK data '{resource}' is not installed.")
+
+
+TEXT_SOURCES = [
+    pytest.param(_raw_texts, id="raw-data"),
+    pytest.param(lambda: ADVERSARIAL_TEXTS, id="adversarial"),
+    pytest.param(_fuzzed_texts, id="fuzzed"),
+]
+
+
+def _lowercase_strings(texts):
+    return [text.lower() if isinstance(text, str) else str(text) for text in texts]
+
+
+@pytest.mark.parametrize("texts", TEXT_SOURCES)
+def test_url_and_mention_pattern_matches_the_old_substitutions(texts):
+    texts = _lowercase_strings(texts())
+    assert texts
+
+    for text in texts:
+        # Hashtags are left to the punctuation table
+        removed = text_features.URL_AND_MENTION_PATTERN.sub("", text)
+        assert removed.replace("#", "") == _old_remove_urls_and_mentions(text), text
+
+
+@pytest.mark.parametrize("texts", TEXT_SOURCES)
+def test_translate_table_matches_the_old_punctuation_and_digit_removal(texts):
+    table = text_features._punctuation_and_digit_table()
+    texts = [
+        text_features.URL_AND_MENTION_PATTERN.sub("", text)
+        for text in _lowercase_strings(texts())
+    ]
+    assert texts
+
+    for text in texts:
+        assert text.translate(table) == _old_remove_punctuation_and_digits(text), text
+
+
+def test_translate_table_deletes_exactly_punctuation_and_digits():
+    table = text_features._punctuation_and_digit_table()
+    deleted = "".join(map(chr, table))
+
+    assert set(table.values()) == {None}
+    assert set(string.punctuation) <= set(deleted)
+    assert _old_remove_punctuation_and_digits(deleted) == ""
+    digits = {chr(c) for c in range(sys.maxunicode + 1) if re.match(r"\d", chr(c))}
+    assert set(deleted) == digits | set(string.punctuation)
+
+
+@pytest.mark.parametrize("texts", TEXT_SOURCES)
+def test_clean_text_matches_the_old_regex_chain(texts):
+    texts = texts()
+    assert texts
+
+    for text in texts:
+        assert text_features.clean_text(text) == _old_clean_text(text), text
+
+
+@pytest.mark.parametrize("texts", TEXT_SOURCES)
+def test_tokens_match_the_old_regex_chain(texts):
+    _require_nltk_data("punkt")
+    texts = texts()
+    assert texts
+
+    for text in texts:
+        assert text_features.tokenize_clean_text(text) == _old_tokenize(text), text
+
+
+def test_preprocess_worker_initializer_loads_nltk_and_copies_the_lemma_cache(
+    monkeypatch,
+):
+    _require_nltk_data("stopwords", "wordnet", "punkt")
+    monkeypatch.setattr(text_features, "_nltk_components", {})
+    cache = text_features.LemmaCache(text_features._lemmatize_with_wordnet, maxsize=100)
+    monkeypatch.setattr(text_features, "lemma_cache", cache)
+    cache.update([("stale", "stale")])
+    parent_items = [("games", "game"), ("heroes", "hero")]
+
+    text_features._init_preprocess_worker(parent_items)
+
+    assert {"stop_words", "lemmatizer", "word_tokenize"} <= set(
+        text_features._nltk_components
+    )
+    assert sorted(cache.items()) == sorted(parent_items)
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache.pop_new_entries() == []
+
+
+def test_lemma_cache_file_of_another_nltk_version_is_ignored(tmp_path, monkeypatch):
+    path = str(tmp_path / "lemmas.json")
+    cache = text_features.LemmaCache(str.upper, maxsize=100)
+    cache.update([("games", "game")])
+    cache.save(path)
+
+    assert text_features.LemmaCache(str.upper, maxsize=100).load(path) == 1
+
+    monkeypatch.setattr(text_features, "_nltk_version", lambda: "0.0.1")
+    reloaded = text_features.LemmaCache(str.upper, maxsize=100)
+    assert reloaded.load(path) == 0
+    assert len(reloaded) == 0
+
+
+class CountingLemmatizer:
+    """Lemmatizes by stripping a trailing 's' and records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, token):
+        self.calls.append(token)
+        return token[:-1] if token.endswith("s") else token
+
+
+def test_lemma_cache_evicts_the_least_recently_used_token():
+    lemmatizer = CountingLemmatizer()
+    cache = text_features.LemmaCache(lemmatizer, maxsize=2)
+
+    assert cache.lemmatize("games") == "game"
+    assert cache.lemmatize("heroes") == "heroe"
+    assert cache.lemmatize("games") == "game"  # 'heroes' is now the oldest
+    assert cache.lemmatize("wins") == "win"
+
+    assert cache.items() == [("games", "game"), ("wins", "win")]
+    assert cache.lemmatize("heroes") == "heroe"
+    assert lemmatizer.calls == ["games", "heroes", "wins", "heroes"]
+    assert len(cache) == 2
+
+
+def test_lemma_cache_counts_hits_and_misses():
+    cache = text_features.LemmaCache(CountingLemmatizer(), maxsize=10)
+    assert cache.stats()["hit_rate"] == 0.0
+
+    for token in ["games", "games", "wins", "games"]:
+        cache.lemmatize(token)
+
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "hit_rate": 0.5,
+        "size": 2,
+        "maxsize": 10,
+    }
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_lemma_cache_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "cache" / "lemmas.json")
+    cache = text_features.LemmaCache(CountingLemmatizer(), maxsize=10)
+    for token in ["games", "heroes", "wins", "games"]:
+        cache.lemmatize(token)
+    cache.save(path)
+
+    lemmatizer = CountingLemmatizer()
+    reloaded = text_features.LemmaCache(lemmatizer, maxsize=10)
+    assert reloaded.load(path) == 3
+    assert reloaded.items() == cache.items()
+    assert reloaded.lemmatize("heroes") == "heroe"
+    assert lemmatizer.calls == []
+
+    # A smaller cache keeps the most recently used entries of the file
+    small = text_features.LemmaCache(CountingLemmatizer(), maxsize=2)
+    assert small.load(path) == 2
+    assert small.items() == [("wins", "win"), ("games", "game")]
+    assert text_features.LemmaCache(str, maxsize=2).load(path + ".missing") == 0
+
+
+def test_lemma_cache_merges_worker_entries_and_counts():
+    parent = text_features.LemmaCache(CountingLemmatizer(), maxsize=10)
+    parent.lemmatize("games")
+
+    worker_results = []
+    for tokens in [["games", "wins", "wins"], ["heroes", "games"]]:
+        worker = text_features.LemmaCache(CountingLemmatizer(), maxsize=10)
+        worker.update(parent.items())
+        worker.track_new_entries()
+        for token in tokens:
+            worker.lemmatize(token)
+        worker_results.append((worker.pop_new_entries(), worker.hits, worker.misses))
+        assert worker.pop_new_entries() == []
+
+    for new_entries, hits, misses in worker_results:
+        parent.merge(new_entries, hits, misses)
+
+    assert parent.items() == [("games", "game"), ("wins", "win"), ("heroes", "heroe")]
+    assert (parent.hits, parent.misses) == (3, 3)
+
+
+class StubAnalyzer:
+    """Stands in for VADER: scores with up to 4 decimals and records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def polarity_scores(self, text):
+        self.calls.append(text)
+        compound = round(((len(text) * 7919) % 20001) / 10000 - 1, 4)
+        neg = round(text.count("a") / (len(text) + 3), 4)
+        pos = round(text.count("e") / (len(text) + 7), 4)
+        return {
+            "neg": neg,
+            "neu": round(1 - neg - pos, 4),
+            "pos": pos,
+            "compound": compound,
+        }
+
+
+@pytest.fixture
+def stub_analyzer(monkeypatch):
+    analyzer = StubAnalyzer()
+    monkeypatch.setitem(text_features._nltk_components, "analyzer", analyzer)
+    monkeypatch.setattr(text_features, "_sentiment_cache", OrderedDict())
+    return analyzer
+
+
+def test_score_sentiments_matches_get_sentiment_scores(stub_analyzer):
+    texts = pd.Series(
+        ["gg wp", "what a game", "gg wp", "", "   ", None, 3.5, "what a game", "ez"],
+        index=range(100, 109),
+    )
+
+    scores = text_features.score_sentiments(texts, max_workers=1, chunksize=2)
+
+    assert scores.shape == (len(texts), 4) and scores.dtype == np.float32
+    # Each distinct text is scored once
+    assert stub_analyzer.calls == ["gg wp", "what a game", "ez"]
+    for row, text in zip(scores, texts):
+        expected = text_features.get_sentiment_scores(text)
+        expected = [expected[key] for key in text_features.SENTIMENT_SCORE_KEYS]
+        np.testing.assert_allclose(row, expected, rtol=1e-6, atol=1e-7)
+        assert (
+            np.round(row.astype(np.float64), text_features.SENTIMENT_SCORE_DECIMALS)
+            == expected
+        ).all()
+    assert not scores[3:6].any()
+
+
+def test_score_sentiments_reuses_cached_scores(stub_analyzer, monkeypatch):
+    monkeypatch.setattr(config, "SENTIMENT_CACHE_SIZE", 2, raising=False)
+    first = text_features.score_sentiments(["gg wp", "ez", "what a game"])
+    assert len(text_features._sentiment_cache) == 2
+    assert next(iter(text_features._sentiment_cache)) == (
+        text_features._sentiment_cache_key("ez")
+    )
+    stub_analyzer.calls.clear()
+
+    second = text_features.score_sentiments(["what a game", "ez", "gg wp", "ez"])
+
+    # Only the evicted text is scored again
+    assert stub_analyzer.calls == ["gg wp"]
+    np.testing.assert_array_equal(second, first[[2, 1, 0, 1]])
+
+
+KEYWORDS = [
+    "og",
+    "ogre magi",
+    "team spirit",
+    "team",
+    "spirit",
+    "anti-mage",
+    "am",
+    "n0tail!",
+    "c++",
+    ".io",
+    "Miracle-",  # never matches: keywords are not lowercased, texts are
+    "",
+]
+
+KEYWORD_TEXTS = [
+    "OG won TI9",
+    "Ogre Magi is a hero, not OG",
+    "og's ogre magi",
+    "Team Spirit beat OG; team-spirit and teamspirit are not keywords",
+    "Anti-Mage farms; anti-mages and am-ish do not count but AM does",
+    "N0tail! and n0tail!! and xn0tail!",
+    "c++ c++x ac++",
+    "dota.io, x.io and .io",
+    "miracle- and Miracle-",
+    "spirit_team",
+    "",
+    None,
+    42,
+]
+
+
+def _old_contains_any_keyword(text, keyword_list):
+    """contains_any_keyword before the trie matcher."""
+    if not isinstance(text, str):
+        text = str(text)
+    pattern = r"\b(?:" + "|".join(re.escape(kw) for kw in keyword_list) + r")\b"
+    return bool(re.search(pattern, text.lower()))
+
+
+def _old_matched_keywords(text, keyword_list):
+    """The keywords that the old whole-word regex finds on their own."""
+    return {
+        keyword
+        for keyword in keyword_list
+        if keyword and _old_contains_any_keyword(text, [keyword])
+    }
+
+
+@pytest.mark.parametrize("text", KEYWORD_TEXTS)
+def test_keyword_matcher_matches_the_old_regex(text):
+    keywords = [keyword for keyword in KEYWORDS if keyword]
+    matcher = text_features.KeywordMatcher(KEYWORDS)
+
+    assert matcher.contains_any(text) == _old_contains_any_keyword(text, keywords)
+    assert set(matcher.find_all(text)) == _old_matched_keywords(text, keywords)
+    for keyword in keywords:
+        assert text_features.contains_any_keyword(
+            text, [keyword]
+        ) == _old_contains_any_keyword(text, [keyword]), keyword
+
+
+def test_keyword_matcher_finds_nested_keywords_in_order_of_their_start():
+    matcher = text_features.KeywordMatcher(KEYWORDS)
+
+    assert matcher.find_all("Team Spirit and OG, then team spirit again") == [
+        "team",
+        "team spirit",
+        "spirit",
+        "og",
+    ]
+    assert matcher.find_all("no keywords here") == []
+    assert not text_features.contains_any_keyword("og", [])
+
+
+def test_keyword_matcher_series_match_the_scalar_methods():
+    matcher = text_features.KeywordMatcher(KEYWORDS)
+    texts = pd.Series(KEYWORD_TEXTS * 2, index=range(10, 10 + 2 * len(KEYWORD_TEXTS)))
+
+    flags = matcher.contains_any_series(texts)
+    matches = matcher.find_all_series(texts)
+
+    assert flags.index.equals(texts.index) and matches.index.equals(texts.index)
+    assert flags.tolist() == [matcher.contains_any(text) for text in texts]
+    assert matches.tolist() == [matcher.find_all(text) for text in texts]